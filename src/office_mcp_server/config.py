@@ -57,6 +57,10 @@ class WordConfig(BaseModel):
     default_font: str = Field(default="宋体", description="默认字体")
     default_font_size: int = Field(default=12, description="默认字号")
     default_line_spacing: float = Field(default=1.5, description="默认行距")
+    document_cache_size: int = Field(default=8, description="已解析文档缓存数量 (0 表示禁用)")
+    batch_workers: int = Field(
+        default=0, description="批量处理多个文件时的进程数 (0 表示按 CPU 核数, 1 表示串行)"
+    )
 
 
 class ExcelConfig(BaseModel):
@@ -65,6 +69,10 @@ class ExcelConfig(BaseModel):
     default_sheet_name: str = Field(default="Sheet1", description="默认工作表名称")
     max_rows: int = Field(default=1048576, description="最大行数")
     max_cols: int = Field(default=16384, description="最大列数")
+    workbook_cache_size: int = Field(default=8, description="已解析工作簿缓存数量 (0 表示禁用)")
+    batch_workers: int = Field(
+        default=0, description="批量处理多个文件时的进程数 (0 表示按 CPU 核数, 1 表示串行)"
+    )
 
 
 class PowerPointConfig(BaseModel):
@@ -73,6 +81,9 @@ class PowerPointConfig(BaseModel):
     default_width: int = Field(default=9144000, description="默认宽度(EMU)")
     default_height: int = Field(default=6858000, description="默认高度(EMU)")
     default_theme: str = Field(default="Office Theme", description="默认主题")
+    presentation_cache_size: int = Field(
+        default=8, description="已解析演示文稿缓存数量 (0 表示禁用)"
+    )
 
 
 class Config(BaseModel):
@@ -112,16 +123,21 @@ class Config(BaseModel):
                 default_font=os.getenv("WORD_DEFAULT_FONT", "宋体"),
                 default_font_size=int(os.getenv("WORD_DEFAULT_FONT_SIZE", "12")),
                 default_line_spacing=float(os.getenv("WORD_DEFAULT_LINE_SPACING", "1.5")),
+                document_cache_size=int(os.getenv("WORD_DOCUMENT_CACHE_SIZE", "8")),
+                batch_workers=int(os.getenv("WORD_BATCH_WORKERS", "0")),
             ),
             excel=ExcelConfig(
                 default_sheet_name=os.getenv("EXCEL_DEFAULT_SHEET_NAME", "Sheet1"),
                 max_rows=int(os.getenv("EXCEL_MAX_ROWS", "1048576")),
                 max_cols=int(os.getenv("EXCEL_MAX_COLS", "16384")),
+                workbook_cache_size=int(os.getenv("EXCEL_WORKBOOK_CACHE_SIZE", "8")),
+                batch_workers=int(os.getenv("EXCEL_BATCH_WORKERS", "0")),
             ),
             powerpoint=PowerPointConfig(
                 default_width=int(os.getenv("PPT_DEFAULT_WIDTH", "9144000")),
                 default_height=int(os.getenv("PPT_DEFAULT_HEIGHT", "6858000")),
                 default_theme=os.getenv("PPT_DEFAULT_THEME", "Office Theme"),
+                presentation_cache_size=int(os.getenv("PPT_PRESENTATION_CACHE_SIZE", "8")),
             ),
         )
 
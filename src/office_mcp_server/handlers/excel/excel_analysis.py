@@ -1,18 +1,72 @@
 """Excel 数据分析模块."""
 
+import functools
 import statistics
-from typing import Any, Optional
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, Optional, Union
 
 import numpy as np
 import pandas as pd
-from openpyxl import load_workbook
 from loguru import logger
-from scipy import stats
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import PolynomialFeatures
+from scipy import optimize, stats
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.excel.excel_cache import workbook_cache
+from office_mcp_server.utils.cell_ref import parse_cell, parse_range
 from office_mcp_server.utils.file_manager import FileManager
+from office_mcp_server.utils.xlsx_patch import sheet_has_formulas
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # python-calamine 为可选依赖, 未安装时用 openpyxl 读取
+    CalamineWorkbook = None
+
+NumericRows = list[list[float]]
+
+# 数据量少于该值时不使用 numba: 导入 numba 约 0.3 秒、首次编译约 0.2 秒,
+# 小数据量下 pandas / 纯 Python 实现本身只需几毫秒
+_JIT_MIN_VALUES = 50_000
+
+
+def _moving_average_kernel(x: np.ndarray, window: int) -> np.ndarray:
+    """滑动窗口均值 (累加和递推, O(n)); 窗口未满的位置为 NaN."""
+    out = np.full(x.shape[0], np.nan)
+    total = 0.0
+    for i in range(x.shape[0]):
+        total += x[i]
+        if i >= window:
+            total -= x[i - window]
+        if i >= window - 1:
+            out[i] = total / window
+    return out
+
+
+def _exponential_smoothing_kernel(x: np.ndarray, alpha: float) -> np.ndarray:
+    """一次指数平滑: y[i] = alpha * x[i] + (1 - alpha) * y[i - 1]."""
+    out = np.empty(x.shape[0])
+    out[0] = x[0]
+    for i in range(1, x.shape[0]):
+        out[i] = alpha * x[i] + (1 - alpha) * out[i - 1]
+    return out
+
+
+@functools.cache
+def _jit_kernels() -> Optional[tuple[Callable, Callable]]:
+    """首次使用时导入 numba 并编译计算内核, numba 未安装时返回 None."""
+    try:
+        from numba import njit
+    except ImportError:  # numba 为可选依赖, 未安装时使用 pandas / 纯 Python 实现
+        return None
+    jit = njit(cache=True, boundscheck=False, fastmath=True)
+    return jit(_moving_average_kernel), jit(_exponential_smoothing_kernel)
+
+
+def _kernels_for(size: int) -> Optional[tuple[Callable, Callable]]:
+    """数据量足够大时返回 numba 编译后的 (移动平均, 指数平滑) 内核, 否则返回 None."""
+    if size < _JIT_MIN_VALUES:
+        return None
+    return _jit_kernels()
 
 
 class ExcelAnalysisOperations:
@@ -22,6 +76,153 @@ class ExcelAnalysisOperations:
         """初始化数据分析操作类."""
         self.file_manager = FileManager()
 
+    @staticmethod
+    def _range_rows(ws: Any, data_range: str) -> Iterator[tuple[Any, ...]]:
+        """按行遍历范围内的值.
+
+        范围超出工作表已用区域的部分直接裁掉, 避免创建空单元格而改变
+        缓存中工作簿的尺寸。
+        """
+        min_col, min_row, max_col, max_row = parse_range(data_range)
+        max_row = ws.max_row if max_row is None else min(max_row, ws.max_row)
+        max_col = ws.max_column if max_col is None else min(max_col, ws.max_column)
+        return ws.iter_rows(
+            min_row=min_row or 1,
+            max_row=max_row,
+            min_col=min_col or 1,
+            max_col=max_col,
+            values_only=True,
+        )
+
+    @classmethod
+    def _numeric_values(cls, ws: Any, data_range: str) -> list[Union[int, float]]:
+        """按行读取范围内的数值 (跳过空值和非数值单元格)."""
+        return [
+            value
+            for row in cls._range_rows(ws, data_range)
+            for value in row
+            if isinstance(value, (int, float))
+        ]
+
+    @classmethod
+    def _read_numeric_rows(
+        cls, file_path: Path, sheet_name: str, *data_ranges: str
+    ) -> list[NumericRows]:
+        """只读地按行读取各范围内的数值 (每行跳过空值和非数值单元格, 不保留空行).
+
+        工作簿已在缓存中时直接复用; 否则若安装了 python-calamine 且工作表不含
+        公式, 用其只解析单元格值而不构建 Cell 对象; 都不满足时再用 openpyxl 解析
+        并放入缓存。两条路径的结果一致: 公式单元格一律跳过 (openpyxl 不保留公式的
+        计算结果), 数值一律转为 float。
+
+        Returns:
+            list: 与 data_ranges 一一对应的按行数值列表
+        """
+        wb = workbook_cache.lookup(file_path)
+        if wb is None and CalamineWorkbook is not None and not sheet_has_formulas(
+            file_path, sheet_name
+        ):
+            return cls._calamine_numeric_rows(file_path, sheet_name, data_ranges)
+        if wb is None:
+            wb = workbook_cache.load(file_path)
+
+        if sheet_name not in wb.sheetnames:
+            raise ValueError(f"工作表 '{sheet_name}' 不存在")
+
+        ws = wb[sheet_name]
+        result = [
+            [
+                numbers
+                for row in cls._range_rows(ws, data_range)
+                if (numbers := [float(value) for value in row if isinstance(value, (int, float))])
+            ]
+            for data_range in data_ranges
+        ]
+        workbook_cache.release(wb, file_path)
+        return result
+
+    @staticmethod
+    def _calamine_numeric_rows(
+        file_path: Path, sheet_name: str, data_ranges: tuple[str, ...]
+    ) -> list[NumericRows]:
+        """用 python-calamine 读取各范围内的数值 (调用方保证工作表不含公式)."""
+        workbook = CalamineWorkbook.from_path(str(file_path))
+        if sheet_name not in workbook.sheet_names:
+            raise ValueError(f"工作表 '{sheet_name}' 不存在")
+
+        # 不跳过左上角空白区域, data[r - 1][c - 1] 即第 r 行第 c 列
+        data = workbook.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+        result = []
+        for data_range in data_ranges:
+            min_col, min_row, max_col, max_row = parse_range(data_range)
+            columns = slice((min_col or 1) - 1, max_col)
+            rows = (
+                [float(value) for value in row[columns] if isinstance(value, (int, float))]
+                for row in data[(min_row or 1) - 1:max_row]
+            )
+            result.append([numbers for numbers in rows if numbers])
+        return result
+
+    @classmethod
+    def _read_numeric_values(
+        cls, file_path: Path, sheet_name: str, *data_ranges: str
+    ) -> list[list[float]]:
+        """只读地读取各范围内的数值 (按行展开), 与 data_ranges 一一对应."""
+        return [
+            [value for row in rows for value in row]
+            for rows in cls._read_numeric_rows(file_path, sheet_name, *data_ranges)
+        ]
+
+    @staticmethod
+    def _write_column(ws: Any, output_cell: str, values: list[Optional[float]]) -> None:
+        """从输出单元格起向下写入一列结果 (None 跳过).
+
+        起始坐标只解析一次, 逐行用 ws.cell(row, column, value) 直接定位,
+        不再为每个值拼接并解析坐标字符串。
+        """
+        col, row = parse_cell(output_cell)
+        for offset, value in enumerate(values):
+            if value is not None:
+                ws.cell(row=row + offset, column=col, value=float(value))
+
+    @staticmethod
+    def _least_squares(
+        x: np.ndarray, y: np.ndarray, degree: int = 1
+    ) -> tuple[np.ndarray, float, np.ndarray]:
+        """最小二乘多项式拟合 (np.linalg.lstsq, LAPACK gelsd).
+
+        与 sklearn LinearRegression 的做法一致: 先对各次项特征和目标值中心化
+        再求解, 特征共线 (如 X 全部相同) 时取最小范数解。
+
+        Returns:
+            tuple: (1..degree 次项系数, 截距, 拟合值)
+        """
+        if degree == 1:
+            # 一次拟合直接用闭式解, 两次点积即可, 无需构造矩阵调用 LAPACK
+            x_mean = x.mean()
+            y_mean = y.mean()
+            x_dev = x - x_mean
+            sxx = float(np.dot(x_dev, x_dev))
+            slope = float(np.dot(x_dev, y - y_mean)) / sxx if sxx else 0.0
+            intercept = float(y_mean - slope * x_mean)
+            return np.array([slope]), intercept, slope * x + intercept
+
+        features = np.vander(x, degree + 1, increasing=True)[:, 1:]
+        feature_mean = features.mean(axis=0)
+        y_mean = y.mean()
+        coef = np.linalg.lstsq(features - feature_mean, y - y_mean, rcond=None)[0]
+        intercept = float(y_mean - feature_mean @ coef)
+        return coef, intercept, features @ coef + intercept
+
+    @staticmethod
+    def _r_squared(y: np.ndarray, y_pred: np.ndarray) -> float:
+        """决定系数 R² (y 为常数时, 完全拟合记为 1, 否则记为 0)."""
+        ss_res = float(np.sum((y - y_pred) ** 2))
+        ss_tot = float(np.sum((y - y.mean()) ** 2))
+        if ss_tot == 0:
+            return 1.0 if ss_res == 0 else 0.0
+        return 1 - ss_res / ss_tot
+
     def descriptive_statistics(
         self,
         filename: str,
@@ -39,47 +240,32 @@ class ExcelAnalysisOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
-
-            if sheet_name not in wb.sheetnames:
-                raise ValueError(f"工作表 '{sheet_name}' 不存在")
-
-            ws = wb[sheet_name]
-            data_cells = ws[data_range]
-
             # 提取数值数据
-            values = []
-            for row in data_cells:
-                if isinstance(row, tuple):
-                    for cell in row:
-                        if isinstance(cell.value, (int, float)) and cell.value is not None:
-                            values.append(cell.value)
-                else:
-                    if isinstance(row.value, (int, float)) and row.value is not None:
-                        values.append(row.value)
+            (values,) = self._read_numeric_values(file_path, sheet_name, data_range)
 
             if not values:
                 raise ValueError("没有找到有效的数值数据")
 
-            # 计算统计指标
+            # 计算统计指标 (均值、方差由 NumPy 向量化计算)
+            arr = np.asarray(values, dtype=np.float64)
+            sorted_values = sorted(values)
+            n = len(sorted_values)
             stats = {
-                "count": len(values),
+                "count": n,
                 "sum": sum(values),
-                "mean": statistics.mean(values),
-                "median": statistics.median(values),
-                "mode": statistics.mode(values) if len(set(values)) < len(values) else None,
-                "std_dev": statistics.stdev(values) if len(values) > 1 else 0,
-                "variance": statistics.variance(values) if len(values) > 1 else 0,
-                "min": min(values),
-                "max": max(values),
-                "range": max(values) - min(values),
+                "mean": float(arr.mean()),
+                "median": statistics.median(sorted_values),
+                "mode": statistics.mode(values) if len(set(values)) < n else None,
+                "std_dev": float(arr.std(ddof=1)) if n > 1 else 0,
+                "variance": float(arr.var(ddof=1)) if n > 1 else 0,
+                "min": sorted_values[0],
+                "max": sorted_values[-1],
+                "range": sorted_values[-1] - sorted_values[0],
             }
 
             # 计算四分位数
-            sorted_values = sorted(values)
-            n = len(sorted_values)
             stats["q1"] = sorted_values[n // 4] if n >= 4 else sorted_values[0]
-            stats["q2"] = statistics.median(values)
+            stats["q2"] = stats["median"]
             stats["q3"] = sorted_values[3 * n // 4] if n >= 4 else sorted_values[-1]
 
             logger.info(f"描述性统计完成: {file_path}")
@@ -114,36 +300,10 @@ class ExcelAnalysisOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
-
-            if sheet_name not in wb.sheetnames:
-                raise ValueError(f"工作表 '{sheet_name}' 不存在")
-
-            ws = wb[sheet_name]
-
-            # 提取第一组数据
-            data_cells1 = ws[data_range1]
-            values1 = []
-            for row in data_cells1:
-                if isinstance(row, tuple):
-                    for cell in row:
-                        if isinstance(cell.value, (int, float)) and cell.value is not None:
-                            values1.append(cell.value)
-                else:
-                    if isinstance(row.value, (int, float)) and row.value is not None:
-                        values1.append(row.value)
-
-            # 提取第二组数据
-            data_cells2 = ws[data_range2]
-            values2 = []
-            for row in data_cells2:
-                if isinstance(row, tuple):
-                    for cell in row:
-                        if isinstance(cell.value, (int, float)) and cell.value is not None:
-                            values2.append(cell.value)
-                else:
-                    if isinstance(row.value, (int, float)) and row.value is not None:
-                        values2.append(row.value)
+            # 提取两组数据
+            values1, values2 = self._read_numeric_values(
+                file_path, sheet_name, data_range1, data_range2
+            )
 
             if len(values1) != len(values2):
                 raise ValueError("两组数据长度不一致")
@@ -153,12 +313,14 @@ class ExcelAnalysisOperations:
 
             # 计算皮尔逊相关系数
             n = len(values1)
-            mean1 = statistics.mean(values1)
-            mean2 = statistics.mean(values2)
+            dev1 = np.asarray(values1, dtype=np.float64)
+            dev2 = np.asarray(values2, dtype=np.float64)
+            dev1 -= dev1.mean()
+            dev2 -= dev2.mean()
 
-            numerator = sum((x - mean1) * (y - mean2) for x, y in zip(values1, values2))
-            denominator1 = sum((x - mean1) ** 2 for x in values1)
-            denominator2 = sum((y - mean2) ** 2 for y in values2)
+            numerator = float(dev1 @ dev2)
+            denominator1 = float(dev1 @ dev1)
+            denominator2 = float(dev2 @ dev2)
 
             if denominator1 == 0 or denominator2 == 0:
                 correlation = 0
@@ -217,21 +379,24 @@ class ExcelAnalysisOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
 
             ws = wb[sheet_name]
 
-            # 简化的单变量求解 (二分法)
+            # 单变量求解: 在 [当前值-1000, 当前值+1000] 内用 Brent 法求根,
+            # 超线性收敛, 所需试算次数远少于二分法
             variable_value = ws[variable_cell].value or 0
             min_val = variable_value - 1000
             max_val = variable_value + 1000
+            evaluations = 0
 
-            for iteration in range(max_iterations):
-                # 尝试中点值
-                test_value = (min_val + max_val) / 2
+            def objective(test_value: float) -> float:
+                """写入试算值并返回目标单元格与目标值之差."""
+                nonlocal evaluations
+                evaluations += 1
                 ws[variable_cell] = test_value
 
                 # 重新计算 (注意: openpyxl不能自动计算公式)
@@ -247,40 +412,41 @@ class ExcelAnalysisOperations:
 
                 # 转换为浮点数
                 try:
-                    result_float = float(result_value)
+                    return float(result_value) - target_value
                 except (ValueError, TypeError):
                     raise ValueError(f"目标单元格 {target_cell} 的值 '{result_value}' 无法转换为数字")
 
-                diff = abs(result_float - target_value)
-
-                if diff < tolerance:
-                    wb.save(str(file_path))
-                    wb.close()
-
-                    logger.info(f"目标搜索完成: {file_path}")
-                    return {
-                        "success": True,
-                        "message": "目标搜索成功",
-                        "filename": str(file_path),
-                        "target_cell": target_cell,
-                        "target_value": target_value,
-                        "variable_cell": variable_cell,
-                        "solution": test_value,
-                        "iterations": iteration + 1,
-                        "final_diff": diff,
-                    }
-
-                # 调整搜索范围
-                if float(result_value) < target_value:
-                    min_val = test_value
-                else:
-                    max_val = test_value
-
-            wb.close()
+            # 先检验区间中点 (即当前值), 已满足时无需搜索
+            solution = (min_val + max_val) / 2
+            diff = abs(objective(solution))
+
+            if diff >= tolerance and objective(min_val) * objective(max_val) <= 0:
+                solution = optimize.brentq(
+                    objective, min_val, max_val, maxiter=max_iterations, disp=False
+                )
+                # 最后一次试算不一定落在解上, 重新写入解并计算误差
+                diff = abs(objective(solution))
+
+            if diff < tolerance:
+                workbook_cache.save(wb, file_path)
 
+                logger.info(f"目标搜索完成: {file_path}")
+                return {
+                    "success": True,
+                    "message": "目标搜索成功",
+                    "filename": str(file_path),
+                    "target_cell": target_cell,
+                    "target_value": target_value,
+                    "variable_cell": variable_cell,
+                    "solution": float(solution),
+                    "iterations": evaluations,
+                    "final_diff": diff,
+                }
+
+            # 未收敛时工作簿已被试算值修改, 不归还缓存
             return {
                 "success": False,
-                "message": f"达到最大迭代次数 {max_iterations}, 未找到精确解",
+                "message": f"在 [{min_val}, {max_val}] 内经 {evaluations} 次试算未找到精确解",
                 "note": "此功能需要Excel应用程序支持以执行公式计算"
             }
 
@@ -309,36 +475,8 @@ class ExcelAnalysisOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
-
-            if sheet_name not in wb.sheetnames:
-                raise ValueError(f"工作表 '{sheet_name}' 不存在")
-
-            ws = wb[sheet_name]
-
-            # 提取X数据
-            x_cells = ws[x_range]
-            x_values = []
-            for row in x_cells:
-                if isinstance(row, tuple):
-                    for cell in row:
-                        if isinstance(cell.value, (int, float)) and cell.value is not None:
-                            x_values.append(cell.value)
-                else:
-                    if isinstance(row.value, (int, float)) and row.value is not None:
-                        x_values.append(row.value)
-
-            # 提取Y数据
-            y_cells = ws[y_range]
-            y_values = []
-            for row in y_cells:
-                if isinstance(row, tuple):
-                    for cell in row:
-                        if isinstance(cell.value, (int, float)) and cell.value is not None:
-                            y_values.append(cell.value)
-                else:
-                    if isinstance(row.value, (int, float)) and row.value is not None:
-                        y_values.append(row.value)
+            # 提取X/Y数据
+            x_values, y_values = self._read_numeric_values(file_path, sheet_name, x_range, y_range)
 
             if len(x_values) != len(y_values):
                 raise ValueError("X和Y数据长度不一致")
@@ -346,16 +484,13 @@ class ExcelAnalysisOperations:
             if len(x_values) < 2:
                 raise ValueError("数据量太少,无法进行回归分析")
 
-            X = np.array(x_values).reshape(-1, 1)
-            y = np.array(y_values)
+            x = np.asarray(x_values, dtype=np.float64)
+            y = np.asarray(y_values, dtype=np.float64)
 
             if regression_type == "linear":
                 # 线性回归
-                model = LinearRegression()
-                model.fit(X, y)
-
-                y_pred = model.predict(X)
-                r_squared = model.score(X, y)
+                coef, intercept, y_pred = self._least_squares(x, y, 1)
+                r_squared = self._r_squared(y, y_pred)
 
                 # 计算标准误差
                 residuals = y - y_pred
@@ -365,24 +500,18 @@ class ExcelAnalysisOperations:
                 result = {
                     "success": True,
                     "regression_type": "linear",
-                    "coefficient": float(model.coef_[0]),
-                    "intercept": float(model.intercept_),
-                    "r_squared": float(r_squared),
+                    "coefficient": float(coef[0]),
+                    "intercept": intercept,
+                    "r_squared": r_squared,
                     "rmse": float(rmse),
-                    "equation": f"y = {model.coef_[0]:.4f}x + {model.intercept_:.4f}",
+                    "equation": f"y = {coef[0]:.4f}x + {intercept:.4f}",
                     "sample_size": len(x_values),
                 }
 
             elif regression_type == "polynomial":
                 # 多项式回归 (2次)
-                poly = PolynomialFeatures(degree=2)
-                X_poly = poly.fit_transform(X)
-
-                model = LinearRegression()
-                model.fit(X_poly, y)
-
-                y_pred = model.predict(X_poly)
-                r_squared = model.score(X_poly, y)
+                coef, intercept, y_pred = self._least_squares(x, y, 2)
+                r_squared = self._r_squared(y, y_pred)
 
                 residuals = y - y_pred
                 mse = np.mean(residuals ** 2)
@@ -391,9 +520,10 @@ class ExcelAnalysisOperations:
                 result = {
                     "success": True,
                     "regression_type": "polynomial",
-                    "coefficients": [float(c) for c in model.coef_],
-                    "intercept": float(model.intercept_),
-                    "r_squared": float(r_squared),
+                    # 与原 PolynomialFeatures 输出保持一致: 首项为常数列系数 (恒为 0)
+                    "coefficients": [0.0] + [float(c) for c in coef],
+                    "intercept": intercept,
+                    "r_squared": r_squared,
                     "rmse": float(rmse),
                     "degree": 2,
                     "sample_size": len(x_values),
@@ -427,29 +557,12 @@ class ExcelAnalysisOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
-
-            if sheet_name not in wb.sheetnames:
-                raise ValueError(f"工作表 '{sheet_name}' 不存在")
-
-            ws = wb[sheet_name]
-
-            # 提取各组数据
-            groups = []
-            for group_range in group_ranges:
-                cells = ws[group_range]
-                values = []
-                for row in cells:
-                    if isinstance(row, tuple):
-                        for cell in row:
-                            if isinstance(cell.value, (int, float)) and cell.value is not None:
-                                values.append(cell.value)
-                    else:
-                        if isinstance(row.value, (int, float)) and row.value is not None:
-                            values.append(row.value)
-
-                if values:
-                    groups.append(values)
+            # 提取各组数据 (每组只转换一次为 float64 数组, 后续计算共用)
+            groups = [
+                np.asarray(values, dtype=np.float64)
+                for values in self._read_numeric_values(file_path, sheet_name, *group_ranges)
+                if values
+            ]
 
             if len(groups) < 2:
                 raise ValueError("至少需要2组数据进行方差分析")
@@ -458,11 +571,10 @@ class ExcelAnalysisOperations:
             f_statistic, p_value = stats.f_oneway(*groups)
 
             # 计算组间和组内统计量
-            all_values = [v for group in groups for v in group]
-            grand_mean = np.mean(all_values)
+            grand_mean = np.concatenate(groups).mean()
 
             # 组均值
-            group_means = [np.mean(group) for group in groups]
+            group_means = [group.mean() for group in groups]
             group_sizes = [len(group) for group in groups]
 
             # 判断显著性
@@ -510,48 +622,25 @@ class ExcelAnalysisOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
-
-            if sheet_name not in wb.sheetnames:
-                raise ValueError(f"工作表 '{sheet_name}' 不存在")
-
-            ws = wb[sheet_name]
-
-            # 提取第一组数据
-            cells1 = ws[group1_range]
-            values1 = []
-            for row in cells1:
-                if isinstance(row, tuple):
-                    for cell in row:
-                        if isinstance(cell.value, (int, float)) and cell.value is not None:
-                            values1.append(cell.value)
-                else:
-                    if isinstance(row.value, (int, float)) and row.value is not None:
-                        values1.append(row.value)
-
-            # 提取第二组数据
-            cells2 = ws[group2_range]
-            values2 = []
-            for row in cells2:
-                if isinstance(row, tuple):
-                    for cell in row:
-                        if isinstance(cell.value, (int, float)) and cell.value is not None:
-                            values2.append(cell.value)
-                else:
-                    if isinstance(row.value, (int, float)) and row.value is not None:
-                        values2.append(row.value)
+            # 提取两组数据
+            values1, values2 = self._read_numeric_values(
+                file_path, sheet_name, group1_range, group2_range
+            )
 
             if not values1 or not values2:
                 raise ValueError("数据不足")
 
+            arr1 = np.asarray(values1, dtype=np.float64)
+            arr2 = np.asarray(values2, dtype=np.float64)
+
             if test_type == "independent":
                 # 独立样本t检验
-                t_statistic, p_value = stats.ttest_ind(values1, values2)
+                t_statistic, p_value = stats.ttest_ind(arr1, arr2)
             elif test_type == "paired":
                 # 配对样本t检验
                 if len(values1) != len(values2):
                     raise ValueError("配对t检验要求两组数据长度相同")
-                t_statistic, p_value = stats.ttest_rel(values1, values2)
+                t_statistic, p_value = stats.ttest_rel(arr1, arr2)
             else:
                 raise ValueError(f"不支持的检验类型: {test_type}")
 
@@ -568,8 +657,8 @@ class ExcelAnalysisOperations:
                 "p_value": float(p_value),
                 "significant": significant,
                 "significance_level": alpha,
-                "group1_mean": float(np.mean(values1)),
-                "group2_mean": float(np.mean(values2)),
+                "group1_mean": float(arr1.mean()),
+                "group2_mean": float(arr2.mean()),
                 "group1_size": len(values1),
                 "group2_size": len(values2),
                 "interpretation": "两组存在显著差异" if significant else "两组不存在显著差异",
@@ -596,27 +685,8 @@ class ExcelAnalysisOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
-
-            if sheet_name not in wb.sheetnames:
-                raise ValueError(f"工作表 '{sheet_name}' 不存在")
-
-            ws = wb[sheet_name]
-
             # 提取观测频数
-            cells = ws[observed_range]
-            observed = []
-            for row in cells:
-                row_data = []
-                if isinstance(row, tuple):
-                    for cell in row:
-                        if isinstance(cell.value, (int, float)) and cell.value is not None:
-                            row_data.append(cell.value)
-                else:
-                    if isinstance(row.value, (int, float)) and row.value is not None:
-                        row_data.append(row.value)
-                if row_data:
-                    observed.append(row_data)
+            (observed,) = self._read_numeric_rows(file_path, sheet_name, observed_range)
 
             if not observed:
                 raise ValueError("没有找到有效的观测数据")
@@ -667,41 +737,24 @@ class ExcelAnalysisOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
-
-            if sheet_name not in wb.sheetnames:
-                raise ValueError(f"工作表 '{sheet_name}' 不存在")
-
-            ws = wb[sheet_name]
-
             # 提取数据
-            cells = ws[data_range]
-            values = []
-            for row in cells:
-                if isinstance(row, tuple):
-                    for cell in row:
-                        if isinstance(cell.value, (int, float)) and cell.value is not None:
-                            values.append(cell.value)
-                else:
-                    if isinstance(row.value, (int, float)) and row.value is not None:
-                        values.append(row.value)
+            (values,) = self._read_numeric_values(file_path, sheet_name, data_range)
 
             if len(values) < 3:
                 raise ValueError("数据量太少,无法进行趋势分析")
 
             # 使用线性回归进行趋势预测
-            X = np.arange(len(values)).reshape(-1, 1)
-            y = np.array(values)
+            X = np.arange(len(values), dtype=np.float64)
+            y = np.asarray(values, dtype=np.float64)
 
-            model = LinearRegression()
-            model.fit(X, y)
+            coef, intercept, y_pred = self._least_squares(X, y, 1)
 
             # 预测未来值
-            future_X = np.arange(len(values), len(values) + periods_ahead).reshape(-1, 1)
-            predictions = model.predict(future_X)
+            future_X = np.arange(len(values), len(values) + periods_ahead)
+            predictions = intercept + coef[0] * future_X
 
             # 计算趋势
-            slope = model.coef_[0]
+            slope = coef[0]
             if slope > 0:
                 trend = "上升"
             elif slope < 0:
@@ -716,8 +769,8 @@ class ExcelAnalysisOperations:
                 "sheet_name": sheet_name,
                 "trend": trend,
                 "slope": float(slope),
-                "intercept": float(model.intercept_),
-                "r_squared": float(model.score(X, y)),
+                "intercept": intercept,
+                "r_squared": self._r_squared(y, y_pred),
                 "predictions": [float(p) for p in predictions],
                 "periods_ahead": periods_ahead,
             }
@@ -747,7 +800,7 @@ class ExcelAnalysisOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
@@ -755,33 +808,28 @@ class ExcelAnalysisOperations:
             ws = wb[sheet_name]
 
             # 提取数据
-            cells = ws[data_range]
-            values = []
-            for row in cells:
-                if isinstance(row, tuple):
-                    for cell in row:
-                        if isinstance(cell.value, (int, float)) and cell.value is not None:
-                            values.append(cell.value)
-                else:
-                    if isinstance(row.value, (int, float)) and row.value is not None:
-                        values.append(row.value)
+            values = self._numeric_values(ws, data_range)
 
             if len(values) < window:
                 raise ValueError(f"数据量 ({len(values)}) 小于窗口大小 ({window})")
 
             # 计算移动平均
-            series = pd.Series(values)
-            ma = series.rolling(window=window).mean()
-            ma_values = ma.tolist()
+            kernels = _kernels_for(len(values))
+            if kernels is not None and window > 0:
+                ma_values = kernels[0](
+                    np.ascontiguousarray(values, dtype=np.float64), window
+                ).tolist()
+            else:
+                ma_values = pd.Series(values).rolling(window=window).mean().tolist()
+
+            ma_result = [float(v) if not pd.isna(v) else None for v in ma_values]
 
             # 如果指定输出单元格,写入结果
             if output_cell:
-                for i, val in enumerate(ma_values):
-                    if not pd.isna(val):
-                        ws[f"{output_cell[0]}{int(output_cell[1:]) + i}"] = float(val)
-                wb.save(str(file_path))
-
-            wb.close()
+                self._write_column(ws, output_cell, ma_result)
+                workbook_cache.save(wb, file_path)
+            else:
+                workbook_cache.release(wb, file_path)
 
             logger.info(f"移动平均计算完成: {file_path}")
             return {
@@ -790,7 +838,7 @@ class ExcelAnalysisOperations:
                 "sheet_name": sheet_name,
                 "window": window,
                 "original_data": values,
-                "moving_average": [float(v) if not pd.isna(v) else None for v in ma_values],
+                "moving_average": ma_result,
             }
 
         except Exception as e:
@@ -821,7 +869,7 @@ class ExcelAnalysisOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
@@ -829,33 +877,29 @@ class ExcelAnalysisOperations:
             ws = wb[sheet_name]
 
             # 提取数据
-            cells = ws[data_range]
-            values = []
-            for row in cells:
-                if isinstance(row, tuple):
-                    for cell in row:
-                        if isinstance(cell.value, (int, float)) and cell.value is not None:
-                            values.append(cell.value)
-                else:
-                    if isinstance(row.value, (int, float)) and row.value is not None:
-                        values.append(row.value)
+            values = self._numeric_values(ws, data_range)
 
             if len(values) < 2:
                 raise ValueError("数据量太少")
 
             # 计算指数平滑
-            smoothed = [values[0]]
-            for i in range(1, len(values)):
-                smoothed_value = alpha * values[i] + (1 - alpha) * smoothed[i - 1]
-                smoothed.append(smoothed_value)
+            kernels = _kernels_for(len(values))
+            if kernels is not None:
+                smoothed = kernels[1](
+                    np.ascontiguousarray(values, dtype=np.float64), alpha
+                ).tolist()
+            else:
+                smoothed = [values[0]]
+                for i in range(1, len(values)):
+                    smoothed_value = alpha * values[i] + (1 - alpha) * smoothed[i - 1]
+                    smoothed.append(smoothed_value)
 
             # 如果指定输出单元格,写入结果
             if output_cell:
-                for i, val in enumerate(smoothed):
-                    ws[f"{output_cell[0]}{int(output_cell[1:]) + i}"] = float(val)
-                wb.save(str(file_path))
-
-            wb.close()
+                self._write_column(ws, output_cell, smoothed)
+                workbook_cache.save(wb, file_path)
+            else:
+                workbook_cache.release(wb, file_path)
 
             logger.info(f"指数平滑计算完成: {file_path}")
             return {
@@ -4,10 +4,10 @@ from typing import Any, Optional, Union
 from datetime import datetime, timedelta
 
 from openpyxl import load_workbook
-from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.utils.cell_ref import parse_cell
 from office_mcp_server.utils.file_manager import FileManager
 
 
@@ -50,11 +50,8 @@ class ExcelAutoFillOperations:
 
             ws = wb[sheet_name]
 
-            start_col_letter, start_row = coordinate_from_string(start_cell)
-            start_col = column_index_from_string(start_col_letter)
-
-            end_col_letter, end_row = coordinate_from_string(end_cell)
-            end_col = column_index_from_string(end_col_letter)
+            start_col, start_row = parse_cell(start_cell)
+            end_col, end_row = parse_cell(end_cell)
 
             if start_col != end_col and start_row != end_row:
                 raise ValueError("填充只能在同一行或同一列中进行")
@@ -200,8 +197,7 @@ class ExcelAutoFillOperations:
 
             ws = wb[sheet_name]
 
-            col_letter, row = coordinate_from_string(start_cell)
-            start_col = column_index_from_string(col_letter)
+            start_col, row = parse_cell(start_cell)
 
             filled_count = 0
             if fill_direction == "down":
@@ -4,9 +4,12 @@ from pathlib import Path
 from typing import Any, Optional, Union
 
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell.cell import Cell
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.excel.excel_cache import cell_values, workbook_cache
+from office_mcp_server.utils.cell_ref import MAX_COLUMN, parse_cell, parse_range
 from office_mcp_server.utils.file_manager import FileManager
 
 
@@ -34,7 +37,7 @@ class ExcelBasicOperations:
             else:
                 ws.title = "Sheet1"
 
-            wb.save(str(output_path))
+            workbook_cache.save(wb, output_path)
 
             logger.info(f"Excel 工作簿创建成功: {output_path}")
             return {
@@ -56,14 +59,14 @@ class ExcelBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
 
             ws = wb[sheet_name]
             ws[cell] = value
-            wb.save(str(file_path))
+            workbook_cache.save(wb, file_path)
 
             logger.info(f"单元格 {cell} 写入成功: {file_path}")
             return {
@@ -86,23 +89,23 @@ class ExcelBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
 
             ws = wb[sheet_name]
 
-            from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
+            start_col, row = parse_cell(start_cell)
 
-            col_letter, row = coordinate_from_string(start_cell)
-            start_col = column_index_from_string(col_letter)
-
-            for i, row_data in enumerate(data):
-                for j, value in enumerate(row_data):
-                    ws.cell(row=row + i, column=start_col + j, value=value)
+            if self._is_numeric_grid(data):
+                self._write_numeric_block(ws, row, start_col, data)
+            else:
+                for i, row_data in enumerate(data):
+                    for j, value in enumerate(row_data):
+                        ws.cell(row=row + i, column=start_col + j, value=value)
 
-            wb.save(str(file_path))
+            workbook_cache.save(wb, file_path)
 
             logger.info(f"批量写入成功: {file_path}")
             return {
@@ -117,19 +120,55 @@ class ExcelBasicOperations:
             logger.error(f"批量写入失败: {e}")
             return {"success": False, "message": f"写入失败: {str(e)}"}
 
+    @staticmethod
+    def _is_numeric_grid(data: list[list[Any]]) -> bool:
+        """判断数据是否全部为 int/float (不含 bool)."""
+        return all(
+            type(value) is int or type(value) is float
+            for row_data in data
+            for value in row_data
+        )
+
+    @staticmethod
+    def _write_numeric_block(
+        ws: Any, start_row: int, start_col: int, data: list[list[Any]]
+    ) -> None:
+        """写入纯数值数据块.
+
+        数值单元格的类型固定为 'n', 直接设置单元格的值,
+        省去 openpyxl 逐个单元格的类型推断。
+        """
+        if start_row + len(data) - 1 > 1048576:
+            raise ValueError("行号超出 Excel 最大行数 1048576")
+        if start_col + max(map(len, data), default=0) - 1 > MAX_COLUMN:
+            raise ValueError(f"列号超出 Excel 最大列数 {MAX_COLUMN}")
+        cells = ws._cells
+        for i, row_data in enumerate(data):
+            row = start_row + i
+            for j, value in enumerate(row_data):
+                coordinate = (row, start_col + j)
+                target_cell = cells.get(coordinate)
+                if target_cell is None:
+                    target_cell = Cell(ws, row=row, column=start_col + j)
+                    ws._add_cell(target_cell)
+                target_cell._value = value
+                target_cell.data_type = "n"
+
     def read_cell(self, filename: str, sheet_name: str, cell: str) -> dict[str, Any]:
         """读取单元格数据."""
         try:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
 
-            ws = wb[sheet_name]
-            value = ws[cell].value
+            col, row = parse_cell(cell)
+            value = cell_values(wb[sheet_name], row, row, col, col)[0][0]
+
+            workbook_cache.release(wb, file_path)
 
             logger.info(f"单元格 {cell} 读取成功: {file_path}")
             return {
@@ -151,21 +190,29 @@ class ExcelBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            min_col, min_row, max_col, max_row = parse_range(cell_range)
+            if None in (min_col, min_row, max_col, max_row):
+                # 整行/整列引用 (如 'A:B') 保持按列返回的原有语义
+                wb = workbook_cache.load(file_path)
 
-            if sheet_name not in wb.sheetnames:
-                raise ValueError(f"工作表 '{sheet_name}' 不存在")
-
-            ws = wb[sheet_name]
-            data_cells = ws[cell_range]
+                if sheet_name not in wb.sheetnames:
+                    raise ValueError(f"工作表 '{sheet_name}' 不存在")
 
-            data = []
-            for row in data_cells:
-                if isinstance(row, tuple):
-                    row_data = [cell.value for cell in row]
+                ws = wb[sheet_name]
+                if min_row is None:
+                    # 整列引用: 每列一个列表
+                    rows = cell_values(ws, 1, ws.max_row, min_col, max_col)
+                    lines = [list(column) for column in zip(*rows, strict=True)]
+                    single = min_col == max_col
                 else:
-                    row_data = [row.value]
-                data.append(row_data)
+                    lines = cell_values(ws, min_row, max_row, 1, ws.max_column)
+                    single = min_row == max_row
+                # 单行/单列引用 (如 'A:A') 与 ws[...] 一样展开为每个单元格一行
+                data = [[value] for value in lines[0]] if single else lines
+
+                workbook_cache.release(wb, file_path)
+            else:
+                data = self._read_values(file_path, sheet_name, (min_col, min_row, max_col, max_row))
 
             logger.info(f"读取范围 {cell_range} 成功: {file_path}")
             return {
@@ -189,13 +236,18 @@ class ExcelBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
 
+            if row_index < 1:
+                raise ValueError(f"无效的行号: {row_index}")
+
             ws = wb[sheet_name]
-            row_data = [cell.value for cell in ws[row_index]]
+            row_data = cell_values(ws, row_index, row_index, 1, ws.max_column)[0]
+
+            workbook_cache.release(wb, file_path)
 
             logger.info(f"读取行 {row_index} 成功: {file_path}")
             return {
@@ -218,7 +270,7 @@ class ExcelBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
@@ -228,7 +280,9 @@ class ExcelBasicOperations:
             from openpyxl.utils import get_column_letter
             col_letter = get_column_letter(col_index)
 
-            col_data = [cell.value for cell in ws[col_letter]]
+            col_data = [row[0] for row in cell_values(ws, 1, ws.max_row, col_index, col_index)]
+
+            workbook_cache.release(wb, file_path)
 
             logger.info(f"读取列 {col_letter} 成功: {file_path}")
             return {
@@ -252,23 +306,9 @@ class ExcelBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
-
-            if sheet_name not in wb.sheetnames:
-                raise ValueError(f"工作表 '{sheet_name}' 不存在")
-
-            ws = wb[sheet_name]
-
-            data = []
-            if include_empty:
-                for row in ws.iter_rows(values_only=True):
-                    data.append(list(row))
-            else:
-                for row in ws.iter_rows(min_row=1, max_row=ws.max_row,
-                                       min_col=1, max_col=ws.max_column,
-                                       values_only=True):
-                    if any(cell is not None for cell in row):
-                        data.append(list(row))
+            data = self._read_values(file_path, sheet_name)
+            if not include_empty:
+                data = [row for row in data if any(cell is not None for cell in row)]
 
             logger.info(f"读取整表数据成功: {file_path}")
             return {
@@ -284,6 +324,68 @@ class ExcelBasicOperations:
             logger.error(f"读取整表数据失败: {e}")
             return {"success": False, "message": f"读取失败: {str(e)}"}
 
+    @staticmethod
+    def _read_values(
+        file_path: Path,
+        sheet_name: str,
+        bounds: Optional[tuple[int, int, int, int]] = None,
+    ) -> list[list[Any]]:
+        """读取工作表单元格的值.
+
+        工作簿已在缓存中时直接复用; 否则以只读模式流式解析,
+        不创建 Cell 对象。返回的行列形状与普通模式下的 iter_rows 一致。
+
+        Args:
+            file_path: 文件路径
+            sheet_name: 工作表名称
+            bounds: (min_col, min_row, max_col, max_row), 为 None 时读取整表
+        """
+        iter_kwargs: dict[str, int] = {}
+        if bounds is not None:
+            min_col, min_row, max_col, max_row = bounds
+            iter_kwargs = {
+                "min_col": min_col, "min_row": min_row,
+                "max_col": max_col, "max_row": max_row,
+            }
+
+        wb = workbook_cache.lookup(file_path)
+        if wb is not None:
+            try:
+                if sheet_name not in wb.sheetnames:
+                    raise ValueError(f"工作表 '{sheet_name}' 不存在")
+                ws = wb[sheet_name]
+                if bounds is None:
+                    return cell_values(ws, 1, ws.max_row, 1, ws.max_column)
+                return cell_values(ws, min_row, max_row, min_col, max_col)
+            finally:
+                workbook_cache.release(wb, file_path)
+
+        wb = load_workbook(str(file_path), read_only=True)
+        try:
+            if sheet_name not in wb.sheetnames:
+                raise ValueError(f"工作表 '{sheet_name}' 不存在")
+            ws = wb[sheet_name]
+
+            if bounds is None:
+                # 忽略文件记录的 dimension, 按实际单元格计算尺寸
+                ws.reset_dimensions()
+                rows = [list(row) for row in ws.iter_rows(values_only=True)]
+                # 末尾不含单元格的空 <row> 元素在普通模式下不计入 max_row
+                while rows and not rows[-1]:
+                    rows.pop()
+                if not rows:
+                    return []
+                width = max(len(row) for row in rows)
+                return [row + [None] * (width - len(row)) for row in rows]
+
+            rows = [list(row) for row in ws.iter_rows(values_only=True, **iter_kwargs)]
+            # 只读模式不会生成数据末尾之后的空行, 按请求范围补齐
+            width = max_col - min_col + 1
+            rows.extend([None] * width for _ in range(max_row - min_row + 1 - len(rows)))
+            return rows
+        finally:
+            wb.close()
+
     def clear_cell(
         self, filename: str, sheet_name: str, cell: str
     ) -> dict[str, Any]:
@@ -292,7 +394,7 @@ class ExcelBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
@@ -300,7 +402,7 @@ class ExcelBasicOperations:
             ws = wb[sheet_name]
             ws[cell].value = None
 
-            wb.save(str(file_path))
+            workbook_cache.save(wb, file_path)
             wb.close()
 
             logger.info(f"清除单元格 {cell} 成功: {file_path}")
@@ -323,7 +425,7 @@ class ExcelBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
@@ -341,7 +443,7 @@ class ExcelBasicOperations:
                     row.value = None
                     count += 1
 
-            wb.save(str(file_path))
+            workbook_cache.save(wb, file_path)
             wb.close()
 
             logger.info(f"清除范围 {cell_range} 成功: {file_path}")
@@ -363,7 +465,7 @@ class ExcelBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             sheets_info = []
             for sheet_name in wb.sheetnames:
@@ -374,6 +476,8 @@ class ExcelBasicOperations:
                     "cols": ws.max_column,
                 })
 
+            workbook_cache.release(wb, file_path)
+
             logger.info(f"获取工作簿信息成功: {file_path}")
             return {
                 "success": True,
@@ -1,6 +1,10 @@
 """Excel 批量处理和高级功能模块."""
 
 import glob
+import os
+import time
+from contextlib import closing
+from functools import lru_cache
 from typing import Any, Optional, Callable
 from pathlib import Path
 
@@ -9,6 +13,54 @@ from loguru import logger
 
 from office_mcp_server.config import config
 from office_mcp_server.utils.file_manager import FileManager
+from office_mcp_server.utils.parallel import map_in_processes, total_size
+
+
+def _process_batch_file(job: tuple[str, str, dict[str, Any]]) -> dict[str, Any]:
+    """处理单个文件并返回结果摘要 (在子进程中执行, 因此定义在模块级)."""
+    file_path, operation, kwargs = job
+    file_name = Path(file_path).name
+    try:
+        _BATCH_OPERATIONS[operation](file_path, **kwargs)
+
+        return {
+            "file": file_name,
+            "status": "success",
+        }
+
+    except Exception as e:
+        return {
+            "file": file_name,
+            "status": "failed",
+            "error": str(e),
+        }
+
+
+# 目录修改时间距今不足该秒数时不缓存匹配结果, 避免同一时间戳内新建的文件被漏掉
+_GLOB_CACHE_MIN_AGE = 2.0
+
+
+@lru_cache(maxsize=64)
+def _glob_listing(search_path: str, dir_mtime_ns: int) -> tuple[str, ...]:
+    """按 (匹配模式, 目录修改时间) 缓存的 glob 结果."""
+    return tuple(glob.glob(search_path))
+
+
+def _glob_files(search_path: str) -> list[str]:
+    """匹配文件, 所在目录未变化 (无文件增删/改名) 时复用上次的匹配结果.
+
+    仅缓存目录部分不含通配符的模式, 其余情况直接调用 glob。
+    """
+    directory = os.path.dirname(search_path)
+    if glob.has_magic(directory):
+        return glob.glob(search_path)
+    try:
+        dir_mtime_ns = os.stat(directory).st_mtime_ns
+    except OSError:
+        return []
+    if time.time_ns() - dir_mtime_ns < _GLOB_CACHE_MIN_AGE * 1e9:
+        return glob.glob(search_path)
+    return list(_glob_listing(search_path, dir_mtime_ns))
 
 
 class ExcelBatchOperations:
@@ -32,45 +84,23 @@ class ExcelBatchOperations:
             **kwargs: 操作特定参数
         """
         try:
-            search_path = config.paths.output_dir / pattern
-            files = list(glob.glob(str(search_path)))
+            if operation not in _BATCH_OPERATIONS:
+                raise ValueError(f"不支持的操作类型: {operation}")
+
+            files = _glob_files(str(config.paths.output_dir / pattern))
 
             if not files:
                 raise ValueError(f"未找到匹配文件: {pattern}")
 
-            results = []
-            success_count = 0
-            failure_count = 0
-
-            for file_path in files:
-                try:
-                    file_name = Path(file_path).name
-
-                    if operation == "format":
-                        # 批量格式化
-                        self._batch_format_file(file_path, **kwargs)
-                    elif operation == "merge":
-                        # 批量合并
-                        pass
-                    elif operation == "export":
-                        # 批量导出
-                        self._batch_export_file(file_path, **kwargs)
-                    else:
-                        raise ValueError(f"不支持的操作类型: {operation}")
-
-                    results.append({
-                        "file": file_name,
-                        "status": "success",
-                    })
-                    success_count += 1
-
-                except Exception as e:
-                    results.append({
-                        "file": file_name,
-                        "status": "failed",
-                        "error": str(e),
-                    })
-                    failure_count += 1
+            # 各文件相互独立, 文件多且总量大时分发到多个进程并行处理
+            results = map_in_processes(
+                _process_batch_file,
+                [(file_path, operation, kwargs) for file_path in files],
+                config.excel.batch_workers,
+                total_size(files),
+            )
+            success_count = sum(1 for result in results if result["status"] == "success")
+            failure_count = len(results) - success_count
 
             logger.info(f"批量处理完成: 成功 {success_count}, 失败 {failure_count}")
             return {
@@ -86,7 +116,8 @@ class ExcelBatchOperations:
             logger.error(f"批量处理失败: {e}")
             return {"success": False, "message": f"批量处理失败: {str(e)}"}
 
-    def _batch_format_file(self, file_path: str, **kwargs: Any) -> None:
+    @staticmethod
+    def _batch_format_file(file_path: str, **kwargs: Any) -> None:
         """批量格式化单个文件."""
         wb = load_workbook(file_path)
         ws = wb.active
@@ -104,7 +135,12 @@ class ExcelBatchOperations:
         wb.save(file_path)
         wb.close()
 
-    def _batch_export_file(self, file_path: str, **kwargs: Any) -> None:
+    @staticmethod
+    def _batch_merge_file(file_path: str, **kwargs: Any) -> None:
+        """批量合并单个文件 (暂未实现, 合并请使用 merge_workbooks)."""
+
+    @staticmethod
+    def _batch_export_file(file_path: str, **kwargs: Any) -> None:
         """批量导出单个文件."""
         export_format = kwargs.get('format', 'csv')
         output_dir = kwargs.get('output_dir', config.paths.output_dir)
@@ -128,8 +164,9 @@ class ExcelBatchOperations:
         try:
             from openpyxl import Workbook
 
-            wb_out = Workbook()
-            wb_out.remove(wb_out.active)
+            # 源文件按只读模式流式解析, 输出使用只写模式逐行落盘,
+            # 两端都不为每个单元格创建 Cell 对象, 内存占用与数据量无关
+            wb_out = Workbook(write_only=True)
 
             for source_file in source_files:
                 source_path = config.paths.output_dir / source_file
@@ -137,20 +174,23 @@ class ExcelBatchOperations:
                     logger.warning(f"文件不存在,跳过: {source_file}")
                     continue
 
-                wb_source = load_workbook(str(source_path))
-
-                for sheet_name in wb_source.sheetnames:
-                    ws_source = wb_source[sheet_name]
+                # 只读工作簿持有打开的文件句柄, 出错时也要关闭 (Windows 上会锁定文件)
+                with closing(load_workbook(str(source_path), read_only=True)) as wb_source:
+                    for sheet_name in wb_source.sheetnames:
+                        ws_source = wb_source[sheet_name]
+                        # 只读模式按文件记录的 dimension 截取数据, 记录过期时会丢数据
+                        ws_source.reset_dimensions()
 
-                    # 创建新工作表
-                    new_name = f"{Path(source_file).stem}_{sheet_name}"
-                    ws_out = wb_out.create_sheet(title=new_name)
+                        # 创建新工作表
+                        new_name = f"{Path(source_file).stem}_{sheet_name}"
+                        ws_out = wb_out.create_sheet(title=new_name)
 
-                    # 复制数据
-                    for row in ws_source.iter_rows(values_only=True):
-                        ws_out.append(row)
+                        # 复制数据
+                        for row in ws_source.iter_rows(values_only=True):
+                            ws_out.append(row)
 
-                wb_source.close()
+            if not wb_out.worksheets:
+                raise ValueError("没有可合并的工作表")
 
             output_path = config.paths.output_dir / output_file
             wb_out.save(str(output_path))
@@ -167,3 +207,14 @@ class ExcelBatchOperations:
         except Exception as e:
             logger.error(f"合并工作簿失败: {e}")
             return {"success": False, "message": f"合并失败: {str(e)}"}
+
+
+# 批量操作分派表: 操作类型 -> 单文件处理函数
+_BATCH_OPERATIONS: dict[str, Callable[..., None]] = {
+    # 批量格式化
+    "format": ExcelBatchOperations._batch_format_file,
+    # 批量合并
+    "merge": ExcelBatchOperations._batch_merge_file,
+    # 批量导出
+    "export": ExcelBatchOperations._batch_export_file,
+}
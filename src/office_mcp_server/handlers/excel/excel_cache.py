@@ -0,0 +1,29 @@
+"""Excel 工作簿缓存模块."""
+
+from typing import Any
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.worksheet.worksheet import Worksheet
+
+from office_mcp_server.config import config
+from office_mcp_server.utils.document_cache import DocumentCache
+
+# 所有 Excel 操作共享的已解析工作簿缓存
+workbook_cache: DocumentCache[Workbook] = DocumentCache(
+    load_workbook, maxsize=config.excel.workbook_cache_size
+)
+
+
+def cell_values(
+    ws: Worksheet, min_row: int, max_row: int, min_col: int, max_col: int
+) -> list[list[Any]]:
+    """按行读取区域内的值, 不为不存在的坐标创建单元格.
+
+    普通模式下 ``ws[...]``/``iter_rows`` 会为每个不存在的坐标创建空单元格,
+    只读操作放回缓存的工作簿因此被撑大 (行列数变化, 下次保存时写回磁盘)。
+    """
+    cells = ws._cells
+    return [
+        [getattr(cells.get((row, col)), "value", None) for col in range(min_col, max_col + 1)]
+        for row in range(min_row, max_row + 1)
+    ]
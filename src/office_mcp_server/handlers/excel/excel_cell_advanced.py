@@ -1,13 +1,13 @@
 """Excel 单元格高级操作模块."""
 
 from typing import Any, Literal
-import re
 
 from openpyxl import load_workbook
-from openpyxl.utils import get_column_letter, column_index_from_string
+from openpyxl.utils import get_column_letter
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.utils.cell_ref import parse_cell
 from office_mcp_server.utils.file_manager import FileManager
 
 
@@ -45,12 +45,7 @@ class ExcelCellAdvancedOperations:
             ws = wb[sheet_name]
 
             # 解析单元格位置 (如 'B2' -> 列字母='B', 行号=2)
-            match = re.match(r'^([A-Z]+)(\d+)$', cell.upper())
-            if not match:
-                raise ValueError(f"无效的单元格格式: {cell}")
-            col_letter = match.group(1)
-            row = int(match.group(2))
-            col_idx = column_index_from_string(col_letter)
+            col_idx, row = parse_cell(cell)
 
             if shift == "down":
                 # 向下移动：插入行
@@ -105,12 +100,7 @@ class ExcelCellAdvancedOperations:
             ws = wb[sheet_name]
 
             # 解析单元格位置 (如 'B2' -> 列字母='B', 行号=2)
-            match = re.match(r'^([A-Z]+)(\d+)$', cell.upper())
-            if not match:
-                raise ValueError(f"无效的单元格格式: {cell}")
-            col_letter = match.group(1)
-            row = int(match.group(2))
-            col_idx = column_index_from_string(col_letter)
+            col_idx, row = parse_cell(cell)
 
             if shift == "up":
                 # 向上移动：删除行
@@ -167,18 +157,8 @@ class ExcelCellAdvancedOperations:
             ws = wb[sheet_name]
 
             # 解析单元格位置
-            start_match = re.match(r'^([A-Z]+)(\d+)$', start_cell.upper())
-            end_match = re.match(r'^([A-Z]+)(\d+)$', end_cell.upper())
-            if not start_match or not end_match:
-                raise ValueError(f"无效的单元格格式: {start_cell} 或 {end_cell}")
-
-            start_col_letter = start_match.group(1)
-            start_row = int(start_match.group(2))
-            end_col_letter = end_match.group(1)
-            end_row = int(end_match.group(2))
-
-            start_col_idx = column_index_from_string(start_col_letter)
-            end_col_idx = column_index_from_string(end_col_letter)
+            start_col_idx, start_row = parse_cell(start_cell)
+            end_col_idx, end_row = parse_cell(end_cell)
 
             if shift == "down":
                 # 向下移动：插入多行
@@ -237,18 +217,8 @@ class ExcelCellAdvancedOperations:
             ws = wb[sheet_name]
 
             # 解析单元格位置
-            start_match = re.match(r'^([A-Z]+)(\d+)$', start_cell.upper())
-            end_match = re.match(r'^([A-Z]+)(\d+)$', end_cell.upper())
-            if not start_match or not end_match:
-                raise ValueError(f"无效的单元格格式: {start_cell} 或 {end_cell}")
-
-            start_col_letter = start_match.group(1)
-            start_row = int(start_match.group(2))
-            end_col_letter = end_match.group(1)
-            end_row = int(end_match.group(2))
-
-            start_col_idx = column_index_from_string(start_col_letter)
-            end_col_idx = column_index_from_string(end_col_letter)
+            start_col_idx, start_row = parse_cell(start_cell)
+            end_col_idx, end_row = parse_cell(end_cell)
 
             if shift == "up":
                 # 向上移动：删除多行
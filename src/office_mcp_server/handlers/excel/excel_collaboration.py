@@ -3,11 +3,12 @@
 from typing import Any, Optional
 from datetime import datetime
 
-from openpyxl import load_workbook
 from openpyxl.comments import Comment
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.excel.excel_cache import workbook_cache
+from office_mcp_server.utils.cell_ref import parse_cell
 from office_mcp_server.utils.file_manager import FileManager
 
 
@@ -39,7 +40,7 @@ class ExcelCollaborationOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
@@ -49,8 +50,7 @@ class ExcelCollaborationOperations:
             comment = Comment(comment_text, author)
             ws[cell].comment = comment
 
-            wb.save(str(file_path))
-            wb.close()
+            workbook_cache.save(wb, file_path)
 
             logger.info(f"添加批注成功: {file_path}, 单元格: {cell}")
             return {
@@ -83,13 +83,15 @@ class ExcelCollaborationOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
 
-            ws = wb[sheet_name]
-            comment = ws[cell].comment
+            # 直接查找已有单元格, 不为空坐标创建单元格
+            col, row = parse_cell(cell)
+            target = wb[sheet_name]._cells.get((row, col))
+            comment = target.comment if target is not None else None
 
             if comment:
                 result = {
@@ -110,7 +112,7 @@ class ExcelCollaborationOperations:
                     "message": "该单元格没有批注",
                 }
 
-            wb.close()
+            workbook_cache.release(wb, file_path)
 
             logger.info(f"获取批注成功: {file_path}, 单元格: {cell}")
             return result
@@ -136,7 +138,7 @@ class ExcelCollaborationOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
@@ -144,8 +146,7 @@ class ExcelCollaborationOperations:
             ws = wb[sheet_name]
             ws[cell].comment = None
 
-            wb.save(str(file_path))
-            wb.close()
+            workbook_cache.save(wb, file_path)
 
             logger.info(f"删除批注成功: {file_path}, 单元格: {cell}")
             return {
@@ -175,7 +176,7 @@ class ExcelCollaborationOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
@@ -192,7 +193,7 @@ class ExcelCollaborationOperations:
                             "author": cell.comment.author,
                         })
 
-            wb.close()
+            workbook_cache.release(wb, file_path)
 
             logger.info(f"列出批注成功: {file_path}, 共 {len(comments)} 个")
             return {
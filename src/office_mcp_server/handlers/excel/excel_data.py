@@ -1,5 +1,7 @@
 """Excel 数据操作模块."""
 
+import operator
+from collections.abc import Callable
 from typing import Any, Optional, Union
 
 from openpyxl import load_workbook
@@ -7,9 +9,45 @@ from openpyxl.worksheet.datavalidation import DataValidation
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.utils.cell_ref import parse_cell, parse_range
 from office_mcp_server.utils.file_manager import FileManager
 
 
+def _column_sort_key(col_idx: int) -> Callable[[list[Any]], Any]:
+    """生成按指定列排序的键函数 (空值按空字符串处理)."""
+
+    def key(row: list[Any]) -> Any:
+        value = row[col_idx]
+        return value if value is not None else ""
+
+    return key
+
+
+def _numeric_filter(compare: Callable[[float, float], bool]) -> Callable[[str, str], bool]:
+    """生成数值比较筛选函数 (无法转换为数字时不匹配)."""
+
+    def predicate(cell_value: str, filter_value: str) -> bool:
+        try:
+            return compare(float(cell_value), float(filter_value))
+        except (ValueError, TypeError):
+            return False
+
+    return predicate
+
+
+# 筛选操作符 -> (单元格文本, 筛选值) 判断函数
+_FILTER_PREDICATES: dict[str, Callable[[str, str], bool]] = {
+    "equals": operator.eq,
+    "notEquals": operator.ne,
+    "contains": lambda cell_value, filter_value: filter_value in cell_value,
+    "notContains": lambda cell_value, filter_value: filter_value not in cell_value,
+    "beginsWith": str.startswith,
+    "endsWith": str.endswith,
+    "greaterThan": _numeric_filter(operator.gt),
+    "lessThan": _numeric_filter(operator.lt),
+}
+
+
 class ExcelDataOperations:
     """Excel 数据操作类."""
 
@@ -48,13 +86,17 @@ class ExcelDataOperations:
             ws = wb[sheet_name]
 
             # 获取数据范围
-            data_cells = ws[data_range]
-
-            # 将数据转换为列表
-            data_list = []
-            for row in data_cells:
-                row_data = [cell.value for cell in row]
-                data_list.append(row_data)
+            min_col, min_row, max_col, max_row = parse_range(data_range)
+            data_list = [
+                list(row)
+                for row in ws.iter_rows(
+                    min_row=min_row,
+                    max_row=max_row,
+                    min_col=min_col,
+                    max_col=max_col,
+                    values_only=True,
+                )
+            ]
 
             # 多列排序
             if sort_keys and len(sort_keys) > 0:
@@ -64,52 +106,14 @@ class ExcelDataOperations:
                     if col_idx >= len(data_list[0]):
                         raise ValueError(f"排序列索引 {col_idx} 超出范围")
 
-                # 多列排序
-                def multi_key(row):
-                    keys = []
-                    for key in sort_keys:
-                        col_idx = key.get("column", 0)
-                        asc = key.get("ascending", True)
-                        value = row[col_idx] if row[col_idx] is not None else ""
-                        # 对于降序，需要反转排序键
-                        if not asc:
-                            # 对于数字，使用负数；对于字符串，需要特殊处理
-                            if isinstance(value, (int, float)):
-                                keys.append(-value)
-                            else:
-                                keys.append((False, value))  # 标记为降序
-                        else:
-                            if isinstance(value, (int, float)):
-                                keys.append(value)
-                            else:
-                                keys.append((True, value))  # 标记为升序
-                    return keys
-
-                # 自定义比较函数处理混合排序
-                from functools import cmp_to_key
-
-                def compare(a, b):
-                    for key in sort_keys:
-                        col_idx = key.get("column", 0)
-                        asc = key.get("ascending", True)
-                        val_a = a[col_idx] if a[col_idx] is not None else ""
-                        val_b = b[col_idx] if b[col_idx] is not None else ""
-
-                        # 比较值
-                        if val_a < val_b:
-                            result = -1
-                        elif val_a > val_b:
-                            result = 1
-                        else:
-                            result = 0
-
-                        # 如果不相等，应用排序方向
-                        if result != 0:
-                            return result if asc else -result
-
-                    return 0
-
-                sorted_data = sorted(data_list, key=cmp_to_key(compare))
+                # 从最次要的键开始逐列稳定排序, 结果等同于按各键依次比较
+                sorted_data = data_list
+                for key in reversed(sort_keys):
+                    sorted_data = sorted(
+                        sorted_data,
+                        key=_column_sort_key(key.get("column", 0)),
+                        reverse=not key.get("ascending", True),
+                    )
             else:
                 # 单列排序
                 if sort_by_column >= len(data_list[0]):
@@ -117,13 +121,11 @@ class ExcelDataOperations:
 
                 sorted_data = sorted(
                     data_list,
-                    key=lambda x: x[sort_by_column] if x[sort_by_column] is not None else "",
+                    key=_column_sort_key(sort_by_column),
                     reverse=not ascending
                 )
 
             # 写回数据
-            from openpyxl.utils import range_boundaries
-            min_col, min_row, max_col, max_row = range_boundaries(data_range)
 
             for i, row_data in enumerate(sorted_data):
                 for j, value in enumerate(row_data):
@@ -174,10 +176,9 @@ class ExcelDataOperations:
 
             # 如果指定了筛选列和值,应用筛选
             if filter_column is not None and filter_value is not None:
-                from openpyxl.utils import range_boundaries
                 from openpyxl.worksheet.filters import FilterColumn, CustomFilters, CustomFilter
 
-                min_col, min_row, max_col, max_row = range_boundaries(data_range)
+                min_col, min_row, max_col, max_row = parse_range(data_range)
 
                 if filter_column >= (max_col - min_col + 1):
                     raise ValueError(f"筛选列索引 {filter_column} 超出范围")
@@ -533,8 +534,7 @@ class ExcelDataOperations:
             ws = wb[sheet_name]
 
             # 获取数据范围
-            from openpyxl.utils import range_boundaries
-            min_col, min_row, max_col, max_row = range_boundaries(data_range)
+            min_col, min_row, max_col, max_row = parse_range(data_range)
 
             # 读取数据及颜色信息
             data_with_color = []
@@ -626,58 +626,34 @@ class ExcelDataOperations:
             ws = wb[sheet_name]
 
             # 获取数据范围
-            from openpyxl.utils import range_boundaries, coordinate_from_string, column_index_from_string
-            min_col, min_row, max_col, max_row = range_boundaries(source_range)
+            min_col, min_row, max_col, max_row = parse_range(source_range)
 
             # 读取数据
-            data_list = []
-            for row_idx in range(min_row, max_row + 1):
-                row_data = []
-                for col_idx in range(min_col, max_col + 1):
-                    cell = ws.cell(row=row_idx, column=col_idx)
-                    row_data.append(cell.value)
-                data_list.append(row_data)
+            data_list = [
+                list(row)
+                for row in ws.iter_rows(
+                    min_row=min_row,
+                    max_row=max_row,
+                    min_col=min_col,
+                    max_col=max_col,
+                    values_only=True,
+                )
+            ]
 
-            # 筛选数据
+            # 筛选数据 (不支持的操作符不匹配任何行)
+            predicate = _FILTER_PREDICATES.get(filter_operator)
+            filter_val_str = str(filter_value)
             filtered_data = []
-            for row in data_list:
-                if filter_column >= len(row):
-                    continue
-
-                cell_value = str(row[filter_column]) if row[filter_column] is not None else ""
-                filter_val_str = str(filter_value)
-
-                # 应用筛选条件
-                match = False
-                if filter_operator == "equals":
-                    match = cell_value == filter_val_str
-                elif filter_operator == "notEquals":
-                    match = cell_value != filter_val_str
-                elif filter_operator == "contains":
-                    match = filter_val_str in cell_value
-                elif filter_operator == "notContains":
-                    match = filter_val_str not in cell_value
-                elif filter_operator == "beginsWith":
-                    match = cell_value.startswith(filter_val_str)
-                elif filter_operator == "endsWith":
-                    match = cell_value.endswith(filter_val_str)
-                elif filter_operator == "greaterThan":
-                    try:
-                        match = float(cell_value) > float(filter_val_str)
-                    except (ValueError, TypeError):
-                        match = False
-                elif filter_operator == "lessThan":
-                    try:
-                        match = float(cell_value) < float(filter_val_str)
-                    except (ValueError, TypeError):
-                        match = False
-
-                if match:
-                    filtered_data.append(row)
+            if predicate is not None:
+                for row in data_list:
+                    if filter_column >= len(row):
+                        continue
+                    cell_value = str(row[filter_column]) if row[filter_column] is not None else ""
+                    if predicate(cell_value, filter_val_str):
+                        filtered_data.append(row)
 
             # 解析目标单元格
-            target_col_letter, target_row = coordinate_from_string(target_cell)
-            target_col = column_index_from_string(target_col_letter)
+            target_col, target_row = parse_cell(target_cell)
 
             # 写入筛选结果
             for i, row_data in enumerate(filtered_data):
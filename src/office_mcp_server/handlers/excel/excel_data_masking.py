@@ -2,14 +2,39 @@
 
 import hashlib
 import re
+from collections.abc import Callable
 from typing import Any, Literal, Optional
 
 from openpyxl import load_workbook
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.utils.cell_ref import parse_range
 from office_mcp_server.utils.file_manager import FileManager
 
+# 脱敏使用的预编译模式
+_PHONE_RE = re.compile(r"^\d{11}$")
+_ID_CARD_RE = re.compile(r"^\d{15}$|^\d{18}$")
+_CARD_SEPARATOR_RE = re.compile(r"[\s-]")
+_CARD_RE = re.compile(r"^\d{16}$")
+
+# 敏感数据检测: 四类模式互斥, 合并为一个正则, 每个单元格只匹配一次,
+# 由命中的分组名 (lastgroup) 确定类别。信用卡分支等价于去掉空白和 '-' 后为 16 位数字
+_SENSITIVE_RE = re.compile(
+    r"^(?:"
+    r"(?P<phone>\d{11})"
+    r"|(?P<email>[\w\.-]+@[\w\.-]+\.\w+)"
+    r"|(?P<id_card>\d{15}|\d{18})"
+    r"|(?P<credit_card>[\s-]*(?:\d[\s-]*){16})"
+    r")$"
+)
+
+# 支持的哈希算法 (hashlib 构造函数由 OpenSSL 实现, 支持时自动使用 SHA-NI 等指令)
+_HASH_ALGORITHMS = {
+    "md5": hashlib.md5,
+    "sha256": hashlib.sha256,
+}
+
 
 class DataMasking:
     """数据脱敏处理类."""
@@ -56,22 +81,24 @@ class DataMasking:
             ws = wb[sheet_name]
 
             masked_count = 0
+            mask = self._build_masker(mask_type, mask_char, keep_first, keep_last)
+            # 表格中重复值很常见, 相同内容只脱敏一次
+            masked_values: dict[str, str] = {}
 
             # 遍历范围内的单元格
-            for row in ws[cell_range]:
-                for cell in row if isinstance(row, tuple) else [row]:
-                    if cell.value is None or not isinstance(cell.value, str):
+            min_col, min_row, max_col, max_row = parse_range(cell_range)
+            for row in ws.iter_rows(
+                min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col
+            ):
+                for cell in row:
+                    original_value = cell.value
+                    if not isinstance(original_value, str):
                         continue
 
-                    original_value = str(cell.value)
-                    masked_value = self._apply_mask(
-                        original_value,
-                        mask_type,
-                        mask_char,
-                        keep_first,
-                        keep_last,
-                        custom_pattern,
-                    )
+                    masked_value = masked_values.get(original_value)
+                    if masked_value is None:
+                        masked_value = mask(original_value)
+                        masked_values[original_value] = masked_value
 
                     if masked_value != original_value:
                         cell.value = masked_value
@@ -94,68 +121,82 @@ class DataMasking:
             logger.error(f"数据脱敏失败: {e}")
             return {"success": False, "message": f"脱敏失败: {str(e)}"}
 
-    def _apply_mask(
-        self,
-        value: str,
+    @staticmethod
+    def _build_masker(
         mask_type: str,
         mask_char: str,
         keep_first: int,
         keep_last: int,
-        custom_pattern: Optional[str],
-    ) -> str:
-        """应用脱敏规则."""
+    ) -> Callable[[str], str]:
+        """生成单个值的脱敏函数.
+
+        脱敏类型的分派和固定长度的掩码串在每次调用 mask_data 时只处理一次,
+        逐单元格只执行匹配和切片拼接。
+        """
         if mask_type == "phone":
             # 手机号脱敏: 138****5678
-            if re.match(r"^\d{11}$", value):
-                return value[:3] + mask_char * 4 + value[7:]
-            return value
+            phone_mask = mask_char * 4
+
+            def mask_phone(value: str) -> str:
+                return value[:3] + phone_mask + value[7:] if _PHONE_RE.match(value) else value
 
-        elif mask_type == "email":
+            return mask_phone
+
+        if mask_type == "email":
             # 邮箱脱敏: abc***@example.com
-            if "@" in value:
-                local, domain = value.split("@", 1)
-                if len(local) > 3:
-                    masked_local = local[:3] + mask_char * 3
-                else:
-                    masked_local = mask_char * len(local)
+            local_mask = mask_char * 3
+
+            def mask_email(value: str) -> str:
+                local, at, domain = value.partition("@")
+                if not at:
+                    return value
+                masked_local = local[:3] + local_mask if len(local) > 3 else mask_char * len(local)
                 return f"{masked_local}@{domain}"
-            return value
 
-        elif mask_type == "id_card":
+            return mask_email
+
+        if mask_type == "id_card":
             # 身份证脱敏: 110***********1234
-            if re.match(r"^\d{15}$|^\d{18}$", value):
+            def mask_id_card(value: str) -> str:
+                if not _ID_CARD_RE.match(value):
+                    return value
                 return value[:3] + mask_char * (len(value) - 7) + value[-4:]
-            return value
 
-        elif mask_type == "credit_card":
+            return mask_id_card
+
+        if mask_type == "credit_card":
             # 信用卡脱敏: 6222 **** **** 1234
-            cleaned = re.sub(r"[\s-]", "", value)
-            if re.match(r"^\d{16}$", cleaned):
-                masked = cleaned[:4] + mask_char * 8 + cleaned[-4:]
+            card_mask = mask_char * 8
+
+            def mask_card(value: str) -> str:
+                cleaned = _CARD_SEPARATOR_RE.sub("", value)
+                if not _CARD_RE.match(cleaned):
+                    return value
+                masked = cleaned[:4] + card_mask + cleaned[-4:]
                 # 格式化为 XXXX **** **** XXXX
                 return f"{masked[:4]} {masked[4:8]} {masked[8:12]} {masked[12:]}"
-            return value
 
-        elif mask_type == "name":
+            return mask_card
+
+        if mask_type == "name":
             # 姓名脱敏: 张*、李**
-            if len(value) == 2:
-                return value[0] + mask_char
-            elif len(value) > 2:
-                return value[0] + mask_char * (len(value) - 1)
-            return value
+            def mask_name(value: str) -> str:
+                return value[0] + mask_char * (len(value) - 1) if len(value) >= 2 else value
 
-        elif mask_type == "partial" or mask_type == "custom":
-            # 部分脱敏或自定义脱敏
-            if keep_first + keep_last >= len(value):
-                return value
+            return mask_name
 
-            if keep_first == 0 and keep_last == 0:
-                return mask_char * len(value)
+        if mask_type == "partial" or mask_type == "custom":
+            # 部分脱敏或自定义脱敏
+            def mask_partial(value: str) -> str:
+                if keep_first + keep_last >= len(value):
+                    return value
+                middle = mask_char * (len(value) - keep_first - keep_last)
+                tail = value[-keep_last:] if keep_last > 0 else ""
+                return value[:keep_first] + middle + tail
 
-            middle_len = len(value) - keep_first - keep_last
-            return value[:keep_first] + mask_char * middle_len + value[-keep_last:] if keep_last > 0 else value[:keep_first] + mask_char * middle_len
+            return mask_partial
 
-        return value
+        return lambda value: value
 
     def detect_sensitive_data(
         self,
@@ -204,30 +245,10 @@ class DataMasking:
                         continue
 
                     value = str(cell.value)
-                    cell_coord = cell.coordinate
-
-                    # 检测手机号
-                    if re.match(r"^\d{11}$", value):
-                        sensitive_data["phone"].append(
-                            {"cell": cell_coord, "value": value}
-                        )
-
-                    # 检测邮箱
-                    elif re.match(r"^[\w\.-]+@[\w\.-]+\.\w+$", value):
-                        sensitive_data["email"].append(
-                            {"cell": cell_coord, "value": value}
-                        )
-
-                    # 检测身份证
-                    elif re.match(r"^\d{15}$|^\d{18}$", value):
-                        sensitive_data["id_card"].append(
-                            {"cell": cell_coord, "value": value}
-                        )
-
-                    # 检测信用卡
-                    elif re.match(r"^\d{16}$", re.sub(r"[\s-]", "", value)):
-                        sensitive_data["credit_card"].append(
-                            {"cell": cell_coord, "value": value}
+                    match = _SENSITIVE_RE.match(value)
+                    if match:
+                        sensitive_data[match.lastgroup].append(
+                            {"cell": cell.coordinate, "value": value}
                         )
 
             wb.close()
@@ -267,6 +288,10 @@ class DataMasking:
             操作结果
         """
         try:
+            hash_func = _HASH_ALGORITHMS.get(algorithm)
+            if hash_func is None:
+                raise ValueError(f"不支持的哈希算法: {algorithm}")
+
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
@@ -278,21 +303,23 @@ class DataMasking:
             ws = wb[sheet_name]
 
             hashed_count = 0
+            # 表格中重复值很常见, 相同内容只计算一次摘要
+            digests: dict[str, str] = {}
 
             # 遍历范围内的单元格
-            for row in ws[cell_range]:
-                for cell in row if isinstance(row, tuple) else [row]:
+            min_col, min_row, max_col, max_row = parse_range(cell_range)
+            for row in ws.iter_rows(
+                min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col
+            ):
+                for cell in row:
                     if cell.value is None:
                         continue
 
                     value_str = str(cell.value)
-
-                    if algorithm == "md5":
-                        hashed = hashlib.md5(value_str.encode()).hexdigest()
-                    elif algorithm == "sha256":
-                        hashed = hashlib.sha256(value_str.encode()).hexdigest()
-                    else:
-                        raise ValueError(f"不支持的哈希算法: {algorithm}")
+                    hashed = digests.get(value_str)
+                    if hashed is None:
+                        hashed = hash_func(value_str.encode()).hexdigest()
+                        digests[value_str] = hashed
 
                     cell.value = hashed
                     hashed_count += 1
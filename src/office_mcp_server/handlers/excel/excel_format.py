@@ -1,5 +1,6 @@
 """Excel 格式化操作模块."""
 
+from functools import lru_cache
 from typing import Any, Optional, Union
 
 from openpyxl import load_workbook
@@ -14,10 +15,38 @@ from openpyxl.formatting.rule import (
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.excel.excel_cache import workbook_cache
+from office_mcp_server.utils.cell_ref import parse_range
 from office_mcp_server.utils.file_manager import FileManager
 from office_mcp_server.utils.format_helper import ColorUtils
 
 
+# 样式对象缓存: 相同参数的格式化请求复用同一个样式对象, 避免重复创建
+@lru_cache(maxsize=512)
+def _font(name: Optional[str], size: Optional[int], bold: bool, color: Optional[str]) -> Font:
+    """获取字体样式对象."""
+    return Font(name=name, size=size, bold=bold or None, color=color)
+
+
+@lru_cache(maxsize=512)
+def _fill(color: str) -> PatternFill:
+    """获取纯色填充样式对象."""
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+
+@lru_cache(maxsize=512)
+def _alignment(horizontal: Optional[str], vertical: Optional[str], wrap_text: bool) -> Alignment:
+    """获取对齐样式对象."""
+    return Alignment(horizontal=horizontal, vertical=vertical, wrap_text=wrap_text or None)
+
+
+@lru_cache(maxsize=512)
+def _border(style: str, color: str) -> Border:
+    """获取四周相同的边框样式对象."""
+    side = Side(style=style, color=color)
+    return Border(left=side, right=side, top=side, bottom=side)
+
+
 class ExcelFormatOperations:
     """Excel 格式化操作类."""
 
@@ -47,72 +76,130 @@ class ExcelFormatOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
 
             ws = wb[sheet_name]
-            target_cell = ws[cell]
-
-            # 应用字体样式
-            font_kwargs = {}
-            if font_name:
-                font_kwargs["name"] = font_name
-            if font_size:
-                font_kwargs["size"] = font_size
-            if bold:
-                font_kwargs["bold"] = True
-            if color:
-                font_kwargs["color"] = color.lstrip("#")
-
-            if font_kwargs:
-                target_cell.font = Font(**font_kwargs)
-
-            # 应用背景色
-            if bg_color:
-                target_cell.fill = PatternFill(
-                    start_color=bg_color.lstrip("#"),
-                    end_color=bg_color.lstrip("#"),
-                    fill_type="solid",
-                )
+            self._apply_cell_format(
+                [ws[cell]], font_name, font_size, bold, color, bg_color, number_format,
+                horizontal_alignment, vertical_alignment, wrap_text, border_style, border_color
+            )
 
-            # 应用数字格式
-            if number_format:
-                target_cell.number_format = number_format
+            workbook_cache.save(wb, file_path)
+            wb.close()
 
-            # 应用对齐方式
-            alignment_kwargs = {}
-            if horizontal_alignment:
-                alignment_kwargs["horizontal"] = horizontal_alignment
-            if vertical_alignment:
-                alignment_kwargs["vertical"] = vertical_alignment
-            if wrap_text:
-                alignment_kwargs["wrap_text"] = True
+            logger.info(f"单元格 {cell} 格式化成功: {file_path}")
+            return {
+                "success": True,
+                "message": "单元格格式化成功",
+                "filename": str(file_path),
+            }
 
-            if alignment_kwargs:
-                target_cell.alignment = Alignment(**alignment_kwargs)
+        except Exception as e:
+            logger.error(f"格式化单元格失败: {e}")
+            return {"success": False, "message": f"格式化失败: {str(e)}"}
 
-            # 应用边框
-            if border_style:
-                border_color_hex = border_color.lstrip("#") if border_color else "000000"
-                side = Side(style=border_style, color=border_color_hex)
-                target_cell.border = Border(left=side, right=side, top=side, bottom=side)
+    def format_range(
+        self,
+        filename: str,
+        sheet_name: str,
+        cell_range: str,
+        font_name: Optional[str] = None,
+        font_size: Optional[int] = None,
+        bold: bool = False,
+        color: Optional[str] = None,
+        bg_color: Optional[str] = None,
+        number_format: Optional[str] = None,
+        horizontal_alignment: Optional[str] = None,
+        vertical_alignment: Optional[str] = None,
+        wrap_text: bool = False,
+        border_style: Optional[str] = None,
+        border_color: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """批量格式化单元格范围 (范围内所有单元格共享同一组样式对象)."""
+        try:
+            file_path = config.paths.output_dir / filename
+            self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb.save(str(file_path))
+            wb = workbook_cache.load(file_path)
+
+            if sheet_name not in wb.sheetnames:
+                raise ValueError(f"工作表 '{sheet_name}' 不存在")
+
+            ws = wb[sheet_name]
+            min_col, min_row, max_col, max_row = parse_range(cell_range)
+            cells = [
+                target_cell
+                for row in ws.iter_rows(
+                    min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col
+                )
+                for target_cell in row
+            ]
+            self._apply_cell_format(
+                cells, font_name, font_size, bold, color, bg_color, number_format,
+                horizontal_alignment, vertical_alignment, wrap_text, border_style, border_color
+            )
+
+            workbook_cache.save(wb, file_path)
             wb.close()
 
-            logger.info(f"单元格 {cell} 格式化成功: {file_path}")
+            logger.info(f"范围 {cell_range} 格式化成功: {file_path}, 共 {len(cells)} 个单元格")
             return {
                 "success": True,
-                "message": "单元格格式化成功",
+                "message": f"成功格式化 {len(cells)} 个单元格",
                 "filename": str(file_path),
+                "cell_range": cell_range,
+                "cell_count": len(cells),
             }
 
         except Exception as e:
-            logger.error(f"格式化单元格失败: {e}")
+            logger.error(f"格式化范围失败: {e}")
             return {"success": False, "message": f"格式化失败: {str(e)}"}
 
+    @staticmethod
+    def _apply_cell_format(
+        cells: list[Any],
+        font_name: Optional[str],
+        font_size: Optional[int],
+        bold: bool,
+        color: Optional[str],
+        bg_color: Optional[str],
+        number_format: Optional[str],
+        horizontal_alignment: Optional[str],
+        vertical_alignment: Optional[str],
+        wrap_text: bool,
+        border_style: Optional[str],
+        border_color: Optional[str],
+    ) -> None:
+        """将同一组格式应用到多个单元格."""
+        font = None
+        if font_name or font_size or bold or color:
+            font_color = color.lstrip("#") if color else None
+            font = _font(font_name or None, font_size or None, bold, font_color)
+        fill = _fill(bg_color.lstrip("#")) if bg_color else None
+        alignment = None
+        if horizontal_alignment or vertical_alignment or wrap_text:
+            alignment = _alignment(
+                horizontal_alignment or None, vertical_alignment or None, wrap_text
+            )
+        border = None
+        if border_style:
+            border = _border(border_style, border_color.lstrip("#") if border_color else "000000")
+
+        for target_cell in cells:
+            if font is not None:
+                target_cell.font = font
+            if fill is not None:
+                target_cell.fill = fill
+            if number_format:
+                target_cell.number_format = number_format
+            if alignment is not None:
+                target_cell.alignment = alignment
+            if border is not None:
+                target_cell.border = border
+
     def apply_conditional_formatting(
         self,
         filename: str,
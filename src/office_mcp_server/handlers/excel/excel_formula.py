@@ -1,5 +1,6 @@
 """Excel 公式操作模块."""
 
+from collections.abc import Callable, Mapping
 from typing import Any, Optional
 
 from openpyxl import load_workbook
@@ -8,6 +9,61 @@ from loguru import logger
 from office_mcp_server.config import config
 from office_mcp_server.utils.file_manager import FileManager
 
+# 常用函数公式模板: 函数名 -> (模板 format_map, 必填参数, 缺少参数时的错误信息)
+_FORMULA_SPECS: dict[str, tuple[str, tuple[str, ...], str]] = {
+    # 基础聚合函数
+    **{
+        name: (f"={name}({{range1}})", ("range1",), "{function}函数需要指定range1")
+        for name in ("SUM", "AVERAGE", "MAX", "MIN", "COUNT", "COUNTA")
+    },
+    # 条件函数
+    "IF": (
+        "=IF({condition},{value_if_true},{value_if_false})",
+        ("condition", "value_if_true", "value_if_false"),
+        "IF函数需要指定condition, value_if_true, value_if_false",
+    ),
+    "SUMIF": (
+        "=SUMIF({range1},{condition},{sum_range})",
+        ("range1", "condition"),
+        "SUMIF函数需要指定range1和condition",
+    ),
+    "COUNTIF": (
+        "=COUNTIF({range1},{condition})",
+        ("range1", "condition"),
+        "COUNTIF函数需要指定range1和condition",
+    ),
+    # 查找函数
+    **{
+        name: (
+            f"={name}({{lookup_value}},{{table_array}},{{col_index}},{{range_lookup}})",
+            ("lookup_value", "table_array", "col_index"),
+            f"{name}函数需要指定lookup_value, table_array, col_index",
+        )
+        for name in ("VLOOKUP", "HLOOKUP")
+    },
+    # 文本函数 (CONCATENATE 的 range1 为逗号分隔的单元格引用)
+    "CONCATENATE": ("=CONCATENATE({range1})", ("range1",), "CONCATENATE函数需要指定range1"),
+    **{
+        name: (f"={name}({{range1}},{{num_chars}})", ("range1",), "{function}函数需要指定range1")
+        for name in ("LEFT", "RIGHT")
+    },
+    "MID": (
+        "=MID({range1},{condition},{value_if_true})",
+        ("range1", "condition", "value_if_true"),
+        "MID函数需要指定range1(文本), condition(起始位置), value_if_true(字符数)",
+    ),
+    **{
+        name: (f"={name}({{range1}})", ("range1",), "{function}函数需要指定range1")
+        for name in ("LEN", "UPPER", "LOWER", "TRIM")
+    },
+}
+
+# 导入时绑定各模板的 format_map, 调用时只需一次字典查找
+FORMULA_TEMPLATES: dict[str, tuple[Callable[[Mapping[str, Any]], str], tuple[str, ...], str]] = {
+    name: (template.format_map, required, error)
+    for name, (template, required, error) in _FORMULA_SPECS.items()
+}
+
 
 class ExcelFormulaOperations:
     """Excel 公式操作类."""
@@ -87,72 +143,29 @@ class ExcelFormulaOperations:
 
             # 根据函数名称构建公式
             function_name = function_name.upper()
-
-            if function_name in ['SUM', 'AVERAGE', 'MAX', 'MIN', 'COUNT', 'COUNTA']:
-                # 基础聚合函数
-                if not range1:
-                    raise ValueError(f"{function_name}函数需要指定range1")
-                formula = f"={function_name}({range1})"
-
-            elif function_name == 'IF':
-                # IF条件函数
-                if not condition or not value_if_true or not value_if_false:
-                    raise ValueError("IF函数需要指定condition, value_if_true, value_if_false")
-                formula = f"=IF({condition},{value_if_true},{value_if_false})"
-
-            elif function_name == 'SUMIF':
-                # 条件求和
-                if not range1 or not condition:
-                    raise ValueError("SUMIF函数需要指定range1和condition")
-                sum_range = range2 if range2 else range1
-                formula = f"=SUMIF({range1},{condition},{sum_range})"
-
-            elif function_name == 'COUNTIF':
-                # 条件计数
-                if not range1 or not condition:
-                    raise ValueError("COUNTIF函数需要指定range1和condition")
-                formula = f"=COUNTIF({range1},{condition})"
-
-            elif function_name == 'VLOOKUP':
-                # 纵向查找
-                if not lookup_value or not table_array or col_index is None:
-                    raise ValueError("VLOOKUP函数需要指定lookup_value, table_array, col_index")
-                formula = f"=VLOOKUP({lookup_value},{table_array},{col_index},{1 if range_lookup else 0})"
-
-            elif function_name == 'HLOOKUP':
-                # 横向查找
-                if not lookup_value or not table_array or col_index is None:
-                    raise ValueError("HLOOKUP函数需要指定lookup_value, table_array, col_index")
-                formula = f"=HLOOKUP({lookup_value},{table_array},{col_index},{1 if range_lookup else 0})"
-
-            elif function_name == 'CONCATENATE':
-                # 文本连接
-                if not range1:
-                    raise ValueError("CONCATENATE函数需要指定range1")
-                # range1应该是逗号分隔的单元格引用
-                formula = f"=CONCATENATE({range1})"
-
-            elif function_name in ['LEFT', 'RIGHT']:
-                # 左侧/右侧文本
-                if not range1:
-                    raise ValueError(f"{function_name}函数需要指定range1")
-                num_chars = condition if condition else "1"
-                formula = f"={function_name}({range1},{num_chars})"
-
-            elif function_name == 'MID':
-                # 中间文本
-                if not range1 or not condition or not value_if_true:
-                    raise ValueError("MID函数需要指定range1(文本), condition(起始位置), value_if_true(字符数)")
-                formula = f"=MID({range1},{condition},{value_if_true})"
-
-            elif function_name in ['LEN', 'UPPER', 'LOWER', 'TRIM']:
-                # 文本处理函数
-                if not range1:
-                    raise ValueError(f"{function_name}函数需要指定range1")
-                formula = f"={function_name}({range1})"
-
-            else:
+            spec = FORMULA_TEMPLATES.get(function_name)
+            if spec is None:
                 raise ValueError(f"不支持的函数: {function_name}")
+            build, required, error = spec
+
+            params = {
+                "function": function_name,
+                "range1": range1,
+                "range2": range2,
+                "condition": condition,
+                "value_if_true": value_if_true,
+                "value_if_false": value_if_false,
+                "lookup_value": lookup_value,
+                "table_array": table_array,
+                "col_index": col_index,
+            }
+            if any(params[name] is None or params[name] == "" for name in required):
+                raise ValueError(error.format(function=function_name))
+
+            params["sum_range"] = range2 if range2 else range1
+            params["num_chars"] = condition if condition else "1"
+            params["range_lookup"] = 1 if range_lookup else 0
+            formula = build(params)
 
             # 插入公式
             ws[cell] = formula
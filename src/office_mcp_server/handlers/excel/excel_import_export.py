@@ -5,13 +5,27 @@ import json
 from typing import Any, Optional
 from pathlib import Path
 
+import pandas as pd
 from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.excel.excel_cache import workbook_cache
+from office_mcp_server.utils.cell_ref import parse_cell, parse_range
 from office_mcp_server.utils.file_manager import FileManager
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖, 未安装时回退到标准库 json
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow 为可选依赖, 未安装时回退到 csv 模块
+    pa = None
+
 
 class ExcelImportExportOperations:
     """Excel 数据导入导出操作类."""
@@ -55,17 +69,20 @@ class ExcelImportExportOperations:
 
             ws = wb[sheet_name]
 
-            from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
-            col_letter, row = coordinate_from_string(start_cell)
-            start_col = column_index_from_string(col_letter)
+            start_col, row = parse_cell(start_cell)
 
-            with open(csv_path, 'r', encoding='utf-8-sig') as f:
-                csv_reader = csv.reader(f)
-                row_count = 0
-                for csv_row in csv_reader:
-                    for col_idx, value in enumerate(csv_row):
-                        ws.cell(row=row + row_count, column=start_col + col_idx, value=value)
-                    row_count += 1
+            csv_rows = self._read_csv_rows(csv_path)
+
+            if row == 1 and start_col == 1 and not ws._cells:
+                # 空工作表从 A1 导入时整行追加, 避免逐单元格定位
+                for csv_row in csv_rows:
+                    ws.append(csv_row)
+            else:
+                for row_offset, csv_row in enumerate(csv_rows):
+                    for col_offset, value in enumerate(csv_row):
+                        if value is not None:
+                            ws.cell(row=row + row_offset, column=start_col + col_offset, value=value)
+            row_count = len(csv_rows)
 
             wb.save(str(file_path))
             wb.close()
@@ -84,6 +101,106 @@ class ExcelImportExportOperations:
             logger.error(f"从CSV导入失败: {e}")
             return {"success": False, "message": f"导入失败: {str(e)}"}
 
+    @staticmethod
+    def _read_csv_rows(csv_path: Path) -> list[tuple[Optional[str], ...]]:
+        """读取CSV全部行 (所有值保留为字符串).
+
+        优先使用 pandas C 解析器; 各行字段数不一致时回退到 csv 模块.
+        pandas 会把短行和空行补齐到最大列数, 补齐的字段与空字段都记为 None,
+        不写入单元格。
+        """
+        try:
+            df = pd.read_csv(
+                csv_path,
+                header=None,
+                dtype=str,
+                keep_default_na=False,
+                na_values=[''],
+                skip_blank_lines=False,
+                encoding='utf-8-sig',
+                engine='c',
+            )
+        except pd.errors.EmptyDataError:
+            return []
+        except pd.errors.ParserError:
+            with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+                return [tuple(csv_row) for csv_row in csv.reader(f)]
+        return list(df.astype(object).where(df.notna(), None).itertuples(index=False, name=None))
+
+    @staticmethod
+    def _write_csv_rows(rows: list[tuple[Any, ...]], csv_path: Path) -> None:
+        """写出CSV文件 (UTF-8 BOM, 空值写为空字段).
+
+        优先使用 pyarrow 按列批量格式化; 未安装或输出会与 csv 模块不同时
+        回退到 csv 模块, 两种方式写出的文件逐字节相同.
+        """
+        if pa is not None and ExcelImportExportOperations._write_csv_rows_arrow(rows, csv_path):
+            return
+        with open(csv_path, 'w', newline='', encoding='utf-8-sig') as f:
+            csv_writer = csv.writer(f)
+            for row in rows:
+                csv_writer.writerow([cell if cell is not None else '' for cell in row])
+
+    @staticmethod
+    def _write_csv_rows_arrow(rows: list[tuple[Any, ...]], csv_path: Path) -> bool:
+        """用 pyarrow 写出与 csv 模块相同的CSV, 无法保证相同时返回 False.
+
+        csv 模块只给含分隔符、引号或换行的值加引号, pyarrow 则给所有字符串
+        加引号, 因此以不加引号的方式写出, 遇到需要引号的值时放弃 (pyarrow 报错)。
+        单列时 csv 模块把空值写为 '""', 没有数据时不写 BOM, 同样交给 csv 模块处理。
+        """
+        if not rows or len(rows[0]) == 1:
+            return False
+
+        columns = []
+        for col in zip(*rows, strict=True):
+            kinds = {type(value) for value in col if value is not None}
+            if kinds <= {str}:
+                columns.append(pa.array(col, type=pa.string()))
+                continue
+            if kinds == {int}:
+                try:
+                    columns.append(pa.array(col, type=pa.int64()))
+                    continue
+                except OverflowError:
+                    pass
+            # 浮点数、日期、布尔等与 csv 模块一样按 str() 输出
+            columns.append(pa.array([None if v is None else str(v) for v in col], type=pa.string()))
+        table = pa.table(columns, names=[f"c{i}" for i in range(len(columns))])
+
+        options = pa_csv.WriteOptions(include_header=False, quoting_style="none", eol="\r\n")
+        try:
+            with open(csv_path, 'wb') as f:
+                f.write(b'\xef\xbb\xbf')
+                pa_csv.write_csv(table, f, options)
+        except pa.ArrowInvalid:
+            return False
+        return True
+
+    @staticmethod
+    def _load_json(json_path: Path) -> Any:
+        """解析JSON文件 (优先使用 orjson)."""
+        if orjson is not None:
+            return orjson.loads(json_path.read_bytes())
+        with open(json_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _dump_json(data: Any, json_path: Path) -> None:
+        """写出JSON文件 (优先使用 orjson).
+
+        两种实现解析后的值一致, 但输出并非逐字节相同: 数字写法可能不同
+        (如 orjson 写 1e20, 标准库写 1e+20)。NaN/Infinity 不会出现在导出数据中,
+        openpyxl 保存时已将其写为空单元格。
+        """
+        if orjson is not None:
+            # 日期时间交给 default=str 处理, 与 json.dump(default=str) 的输出保持一致
+            option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            json_path.write_bytes(orjson.dumps(data, default=str, option=option))
+            return
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+
     def import_from_json(
         self,
         filename: str,
@@ -119,12 +236,9 @@ class ExcelImportExportOperations:
 
             ws = wb[sheet_name]
 
-            from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
-            col_letter, row = coordinate_from_string(start_cell)
-            start_col = column_index_from_string(col_letter)
+            start_col, row = parse_cell(start_cell)
 
-            with open(json_file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._load_json(json_file_path)
 
             if json_path:
                 for path_part in json_path.split('.'):
@@ -191,27 +305,23 @@ class ExcelImportExportOperations:
 
             self.file_manager.ensure_directory(csv_path.parent)
 
-            wb = load_workbook(str(file_path))
+            with workbook_cache.reading(file_path):
+                wb = load_workbook(str(file_path))
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
 
             ws = wb[sheet_name]
 
-            with open(csv_path, 'w', newline='', encoding='utf-8-sig') as f:
-                csv_writer = csv.writer(f)
+            if cell_range:
+                min_col, min_row, max_col, max_row = parse_range(cell_range)
+                rows = ws.iter_rows(
+                    min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True
+                )
+            else:
+                rows = ws.iter_rows(values_only=True)
 
-                if cell_range:
-                    data_cells = ws[cell_range]
-                    for row in data_cells:
-                        if isinstance(row, tuple):
-                            row_data = [cell.value if cell.value is not None else '' for cell in row]
-                        else:
-                            row_data = [row.value if row.value is not None else '']
-                        csv_writer.writerow(row_data)
-                else:
-                    for row in ws.iter_rows(values_only=True):
-                        csv_writer.writerow([cell if cell is not None else '' for cell in row])
+            self._write_csv_rows(list(rows), csv_path)
 
             logger.info(f"导出为CSV成功: {file_path} -> {csv_path}")
             return {
@@ -295,8 +405,7 @@ class ExcelImportExportOperations:
             else:
                 result = all_data
 
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, ensure_ascii=False, indent=2, default=str)
+            self._dump_json(result, json_path)
 
             logger.info(f"导出为JSON成功: {file_path} -> {json_path}")
             return {
@@ -339,7 +448,8 @@ class ExcelImportExportOperations:
 
             self.file_manager.ensure_directory(html_path.parent)
 
-            wb = load_workbook(str(file_path))
+            with workbook_cache.reading(file_path):
+                wb = load_workbook(str(file_path))
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
@@ -442,7 +552,8 @@ class ExcelImportExportOperations:
                 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle
                 from reportlab.lib.units import inch
 
-                wb = load_workbook(str(file_path))
+                with workbook_cache.reading(file_path):
+                    wb = load_workbook(str(file_path))
 
                 if sheet_name not in wb.sheetnames:
                     raise ValueError(f"工作表 '{sheet_name}' 不存在")
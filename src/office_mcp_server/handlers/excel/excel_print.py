@@ -1,14 +1,28 @@
 """Excel 打印设置模块."""
 
+from functools import partial
 from typing import Any, Optional
 
-from openpyxl import load_workbook
+from openpyxl.compat import safe_string
 from openpyxl.worksheet.page import PageMargins, PrintPageSetup
 from openpyxl.worksheet.pagebreak import Break
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.excel.excel_cache import workbook_cache
+from office_mcp_server.utils.cell_ref import parse_cell
 from office_mcp_server.utils.file_manager import FileManager
+from office_mcp_server.utils.xlsx_patch import patch_sheet_xml, sheet_tag
+
+
+def _set_page_margins_xml(sheet: Any, margins: dict[str, float]) -> bool:
+    """直接修改工作表 XML 中 pageMargins 的属性 (元素不存在时交给 openpyxl 处理)."""
+    element = sheet.find(sheet_tag("pageMargins"))
+    if element is None:
+        return False
+    for key, value in margins.items():
+        element.set(key, safe_string(float(value)))
+    return True
 
 
 class ExcelPrintOperations:
@@ -43,7 +57,7 @@ class ExcelPrintOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
@@ -59,8 +73,7 @@ class ExcelPrintOperations:
             if fit_to_height is not None:
                 ws.page_setup.fitToHeight = fit_to_height
 
-            wb.save(str(file_path))
-            wb.close()
+            workbook_cache.save(wb, file_path)
 
             logger.info(f"页面设置成功: {file_path}")
             return {
@@ -103,24 +116,31 @@ class ExcelPrintOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            margins = {
+                "left": left,
+                "right": right,
+                "top": top,
+                "bottom": bottom,
+                "header": header,
+                "footer": footer,
+            }
 
-            if sheet_name not in wb.sheetnames:
-                raise ValueError(f"工作表 '{sheet_name}' 不存在")
+            # 工作簿不在缓存中时只改写该工作表 XML 的 pageMargins 属性,
+            # 不解析、也不重新序列化整个工作簿
+            wb = workbook_cache.lookup(file_path)
+            if wb is not None or not patch_sheet_xml(
+                file_path, sheet_name, partial(_set_page_margins_xml, margins=margins)
+            ):
+                if wb is None:
+                    wb = workbook_cache.load(file_path)
 
-            ws = wb[sheet_name]
+                if sheet_name not in wb.sheetnames:
+                    raise ValueError(f"工作表 '{sheet_name}' 不存在")
 
-            ws.page_margins = PageMargins(
-                left=left,
-                right=right,
-                top=top,
-                bottom=bottom,
-                header=header,
-                footer=footer
-            )
+                ws = wb[sheet_name]
+                ws.page_margins = PageMargins(**margins)
 
-            wb.save(str(file_path))
-            wb.close()
+                workbook_cache.save(wb, file_path)
 
             logger.info(f"页边距设置成功: {file_path}")
             return {
@@ -157,7 +177,7 @@ class ExcelPrintOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
@@ -171,8 +191,7 @@ class ExcelPrintOperations:
                 ws.print_area = None
                 message = "打印区域已清除"
 
-            wb.save(str(file_path))
-            wb.close()
+            workbook_cache.save(wb, file_path)
 
             logger.info(f"打印区域设置成功: {file_path}")
             return {
@@ -206,7 +225,7 @@ class ExcelPrintOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
@@ -236,8 +255,7 @@ class ExcelPrintOperations:
             else:
                 message = "打印标题已清除"
 
-            wb.save(str(file_path))
-            wb.close()
+            workbook_cache.save(wb, file_path)
 
             logger.info(f"打印标题设置成功: {file_path}")
             return {
@@ -269,13 +287,10 @@ class ExcelPrintOperations:
             break_type: 分页符类型 ('row'行分页符, 'col'列分页符, 默认 'row')
         """
         try:
-            import re
-            from openpyxl.utils import column_index_from_string
-
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
@@ -283,12 +298,7 @@ class ExcelPrintOperations:
             ws = wb[sheet_name]
 
             # 解析单元格位置
-            match = re.match(r'^([A-Z]+)(\d+)$', cell.upper())
-            if not match:
-                raise ValueError(f"无效的单元格格式: {cell}")
-            col_letter = match.group(1)
-            row = int(match.group(2))
-            col_idx = column_index_from_string(col_letter)
+            col_idx, row = parse_cell(cell)
 
             if break_type == 'row':
                 ws.row_breaks.append(Break(id=row))
@@ -299,8 +309,7 @@ class ExcelPrintOperations:
             else:
                 raise ValueError(f"不支持的分页符类型: {break_type}")
 
-            wb.save(str(file_path))
-            wb.close()
+            workbook_cache.save(wb, file_path)
 
             logger.info(f"分页符插入成功: {file_path}")
             return {
@@ -335,7 +344,7 @@ class ExcelPrintOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
@@ -355,8 +364,7 @@ class ExcelPrintOperations:
             else:
                 raise ValueError(f"不支持的分页符类型: {break_type}")
 
-            wb.save(str(file_path))
-            wb.close()
+            workbook_cache.save(wb, file_path)
 
             logger.info(f"分页符删除成功: {file_path}")
             return {
@@ -387,7 +395,7 @@ class ExcelPrintOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
+            wb = workbook_cache.load(file_path)
 
             if sheet_name not in wb.sheetnames:
                 raise ValueError(f"工作表 '{sheet_name}' 不存在")
@@ -402,8 +410,7 @@ class ExcelPrintOperations:
             col_breaks_count = len(ws.col_breaks.brk) if ws.col_breaks else 0
             ws.col_breaks.brk = []
 
-            wb.save(str(file_path))
-            wb.close()
+            workbook_cache.save(wb, file_path)
 
             logger.info(f"清除所有分页符成功: {file_path}")
             return {
@@ -1,15 +1,26 @@
 """Excel 报表自动化模块."""
 
-import shutil
 from typing import Any, Optional, Dict
 from pathlib import Path
 from datetime import datetime
 
 from openpyxl import load_workbook
+from openpyxl.comments import Comment
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.excel.excel_cache import workbook_cache
 from office_mcp_server.utils.file_manager import FileManager
+from office_mcp_server.utils.parallel import map_in_processes, total_size
+
+
+def _read_active_sheet_rows(source_path: str) -> list[tuple[Any, ...]]:
+    """读取工作簿活动工作表的全部行值 (在子进程中执行, 因此定义在模块级)."""
+    wb_source = load_workbook(source_path)
+    try:
+        return list(wb_source.active.iter_rows(values_only=True))
+    finally:
+        wb_source.close()
 
 
 class ExcelReportAutomation:
@@ -45,11 +56,9 @@ class ExcelReportAutomation:
             output_path = config.paths.output_dir / output_file
             self.file_manager.ensure_directory(output_path.parent)
 
-            # 复制模板
-            shutil.copy(template_path, output_path)
-
-            # 打开工作簿并填充数据
-            wb = load_workbook(str(output_path))
+            # 直接解析模板 (若刚生成过则复用缓存中的工作簿), 填充后另存为输出文件,
+            # 不再先复制模板文件再重新解析副本
+            wb = workbook_cache.load(template_path)
             ws = wb.active
 
             if mappings:
@@ -58,23 +67,24 @@ class ExcelReportAutomation:
                     if data_key in data:
                         ws[cell_ref] = data[data_key]
             else:
-                # 自动搜索并替换占位符 (如 {{variable_name}})
+                # 自动搜索并替换占位符 (如 {{variable_name}}), 占位符和替换文本只生成一次
+                replacements = [(f"{{{{{key}}}}}", str(value)) for key, value in data.items()]
                 for row in ws.iter_rows():
                     for cell in row:
-                        if cell.value and isinstance(cell.value, str):
-                            for key, value in data.items():
-                                placeholder = f"{{{{{key}}}}}"
-                                if placeholder in cell.value:
-                                    cell.value = cell.value.replace(placeholder, str(value))
+                        text = cell.value
+                        if not isinstance(text, str) or "{{" not in text:
+                            continue
+                        for placeholder, replacement in replacements:
+                            if placeholder in text:
+                                text = text.replace(placeholder, replacement)
+                        cell.value = text
 
             # 添加生成时间
             ws['A1'].comment = None
-            from openpyxl.comments import Comment
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             ws['A1'].comment = Comment(f"报表生成于: {timestamp}", "System")
 
-            wb.save(str(output_path))
-            wb.close()
+            workbook_cache.save(wb, output_path)
 
             logger.info(f"报表生成成功: {output_path}")
             return {
@@ -160,17 +170,26 @@ class ExcelReportAutomation:
             current_row = 1
             first_file = True
 
+            existing_files = []
             for source_file in source_files:
                 source_path = config.paths.output_dir / source_file
                 if not source_path.exists():
                     logger.warning(f"文件不存在,跳过: {source_file}")
                     continue
-
-                wb_source = load_workbook(str(source_path))
-                ws_source = wb_source.active
-
+                existing_files.append((source_file, str(source_path)))
+
+            # 各报表的解析相互独立, 文件多且总量大时在多个进程中并行读取, 再按原顺序合并
+            source_paths = [source_path for _, source_path in existing_files]
+            sheet_rows = map_in_processes(
+                _read_active_sheet_rows,
+                source_paths,
+                config.excel.batch_workers,
+                total_size(source_paths),
+            )
+
+            for (source_file, _), rows in zip(existing_files, sheet_rows, strict=True):
                 # 获取数据
-                for row_idx, row in enumerate(ws_source.iter_rows(values_only=True), 1):
+                for row_idx, row in enumerate(rows, 1):
                     # 跳过第一个文件之后的标题行
                     if not first_file and row_idx == 1:
                         continue
@@ -184,7 +203,6 @@ class ExcelReportAutomation:
                     ws_out.append(row_data)
                     current_row += 1
 
-                wb_source.close()
                 first_file = False
 
             # 如果添加了源文件名列,添加表头
@@ -1,14 +1,48 @@
 """Excel 行列操作模块."""
 
+from copy import copy
 from typing import Any, Optional
 
 from openpyxl import load_workbook
+from openpyxl.cell.cell import Cell
 from openpyxl.utils import get_column_letter, column_index_from_string
 from loguru import logger
 
 from office_mcp_server.config import config
 from office_mcp_server.utils.file_manager import FileManager
 
+CellBlock = list[tuple[int, int, Any]]
+
+
+def _take_block(ws: Any, min_row: int, max_row: int, min_col: int, max_col: int) -> CellBlock:
+    """取出区域内已存在的单元格.
+
+    直接遍历 ws._cells, 不会为空白位置创建单元格。返回的单元格对象在之后
+    插入/删除行列时会随之移动, 其内容不受影响。
+
+    Returns:
+        list: (相对行号, 相对列号, 单元格) 列表
+    """
+    return [
+        (row - min_row, col - min_col, cell)
+        for (row, col), cell in ws._cells.items()
+        if min_row <= row <= max_row and min_col <= col <= max_col
+    ]
+
+
+def _paste_block(ws: Any, block: CellBlock, top: int, left: int) -> None:
+    """将 _take_block 取出的单元格值和样式一次性写入以 (top, left) 为左上角的区域."""
+    pasted = {}
+    for row_offset, col_offset, source in block:
+        row, col = top + row_offset, left + col_offset
+        target = Cell(ws, row=row, column=col)
+        target._value = source._value
+        target.data_type = source.data_type
+        if source.has_style:
+            target._style = copy(source._style)
+        pasted[(row, col)] = target
+    ws._cells.update(pasted)
+
 
 class ExcelRowColOperations:
     """Excel 行列操作类."""
@@ -511,29 +545,10 @@ class ExcelRowColOperations:
 
             ws = wb[sheet_name]
 
-            # 在目标位置插入空行
+            # 先取出源行 (插入空行后源行位置可能后移), 再在目标位置插入空行并整块写入
+            block = _take_block(ws, source_row, source_row + count - 1, 1, ws.max_column)
             ws.insert_rows(target_row, count)
-
-            # 复制数据和格式
-            for i in range(count):
-                src_row_idx = source_row + i
-                tgt_row_idx = target_row + i
-
-                for col_idx in range(1, ws.max_column + 1):
-                    src_cell = ws.cell(row=src_row_idx, column=col_idx)
-                    tgt_cell = ws.cell(row=tgt_row_idx, column=col_idx)
-
-                    # 复制值
-                    tgt_cell.value = src_cell.value
-
-                    # 复制格式
-                    if src_cell.has_style:
-                        tgt_cell.font = src_cell.font.copy()
-                        tgt_cell.border = src_cell.border.copy()
-                        tgt_cell.fill = src_cell.fill.copy()
-                        tgt_cell.number_format = src_cell.number_format
-                        tgt_cell.protection = src_cell.protection.copy()
-                        tgt_cell.alignment = src_cell.alignment.copy()
+            _paste_block(ws, block, target_row, 1)
 
             wb.save(str(file_path))
             wb.close()
@@ -580,29 +595,10 @@ class ExcelRowColOperations:
 
             ws = wb[sheet_name]
 
-            # 在目标位置插入空列
+            # 先取出源列 (插入空列后源列位置可能后移), 再在目标位置插入空列并整块写入
+            block = _take_block(ws, 1, ws.max_row, source_col, source_col + count - 1)
             ws.insert_cols(target_col, count)
-
-            # 复制数据和格式
-            for i in range(count):
-                src_col_idx = source_col + i
-                tgt_col_idx = target_col + i
-
-                for row_idx in range(1, ws.max_row + 1):
-                    src_cell = ws.cell(row=row_idx, column=src_col_idx)
-                    tgt_cell = ws.cell(row=row_idx, column=tgt_col_idx)
-
-                    # 复制值
-                    tgt_cell.value = src_cell.value
-
-                    # 复制格式
-                    if src_cell.has_style:
-                        tgt_cell.font = src_cell.font.copy()
-                        tgt_cell.border = src_cell.border.copy()
-                        tgt_cell.fill = src_cell.fill.copy()
-                        tgt_cell.number_format = src_cell.number_format
-                        tgt_cell.protection = src_cell.protection.copy()
-                        tgt_cell.alignment = src_cell.alignment.copy()
+            _paste_block(ws, block, 1, target_col)
 
             wb.save(str(file_path))
             wb.close()
@@ -652,25 +648,9 @@ class ExcelRowColOperations:
             ws = wb[sheet_name]
 
             # 先复制行到目标位置
+            block = _take_block(ws, source_row, source_row + count - 1, 1, ws.max_column)
             ws.insert_rows(target_row, count)
-
-            for i in range(count):
-                src_row_idx = source_row + i if source_row < target_row else source_row + i + count
-                tgt_row_idx = target_row + i
-
-                for col_idx in range(1, ws.max_column + 1):
-                    src_cell = ws.cell(row=src_row_idx, column=col_idx)
-                    tgt_cell = ws.cell(row=tgt_row_idx, column=col_idx)
-
-                    tgt_cell.value = src_cell.value
-
-                    if src_cell.has_style:
-                        tgt_cell.font = src_cell.font.copy()
-                        tgt_cell.border = src_cell.border.copy()
-                        tgt_cell.fill = src_cell.fill.copy()
-                        tgt_cell.number_format = src_cell.number_format
-                        tgt_cell.protection = src_cell.protection.copy()
-                        tgt_cell.alignment = src_cell.alignment.copy()
+            _paste_block(ws, block, target_row, 1)
 
             # 删除源行
             delete_row_idx = source_row if source_row < target_row else source_row + count
@@ -722,25 +702,9 @@ class ExcelRowColOperations:
             ws = wb[sheet_name]
 
             # 先复制列到目标位置
+            block = _take_block(ws, 1, ws.max_row, source_col, source_col + count - 1)
             ws.insert_cols(target_col, count)
-
-            for i in range(count):
-                src_col_idx = source_col + i if source_col < target_col else source_col + i + count
-                tgt_col_idx = target_col + i
-
-                for row_idx in range(1, ws.max_row + 1):
-                    src_cell = ws.cell(row=row_idx, column=src_col_idx)
-                    tgt_cell = ws.cell(row=row_idx, column=tgt_col_idx)
-
-                    tgt_cell.value = src_cell.value
-
-                    if src_cell.has_style:
-                        tgt_cell.font = src_cell.font.copy()
-                        tgt_cell.border = src_cell.border.copy()
-                        tgt_cell.fill = src_cell.fill.copy()
-                        tgt_cell.number_format = src_cell.number_format
-                        tgt_cell.protection = src_cell.protection.copy()
-                        tgt_cell.alignment = src_cell.alignment.copy()
+            _paste_block(ws, block, 1, target_col)
 
             # 删除源列
             delete_col_idx = source_col if source_col < target_col else source_col + count
@@ -1,11 +1,16 @@
 """Excel 数据安全功能模块."""
 
+import os
+import shutil
+import tempfile
+from pathlib import Path
 from typing import Any, Optional
 
 from openpyxl import load_workbook
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.excel.excel_cache import workbook_cache
 from office_mcp_server.utils.file_manager import FileManager
 
 
@@ -37,16 +42,24 @@ class ExcelSecurityOperations:
 
             try:
                 import msoffcrypto
-                import io
 
-                # 读取文件
-                with open(file_path, 'rb') as f:
-                    office_file = msoffcrypto.OfficeFile(f)
-                    office_file.load_key(password=password)
-
-                    # 加密并保存
-                    with open(file_path, 'wb') as encrypted_file:
+                # 加密结果先写入同目录临时文件, 完成后原子替换原文件。
+                # 不能在读取源文件的同时以 'wb' 打开同一路径, 那样会先截断源文件
+                fd, tmp_name = tempfile.mkstemp(suffix=".tmp", dir=file_path.parent)
+                try:
+                    with open(file_path, 'rb') as f, os.fdopen(fd, 'wb') as encrypted_file:
+                        office_file = msoffcrypto.OfficeFile(f)
+                        # AES 由 cryptography (OpenSSL) 实现, 支持时自动使用 AES-NI
                         office_file.encrypt(password, encrypted_file)
+                    # mkstemp 创建的文件权限为 0600, 替换前恢复原文件的权限
+                    shutil.copymode(file_path, tmp_name)
+                    os.replace(tmp_name, file_path)
+                except BaseException:
+                    Path(tmp_name).unlink(missing_ok=True)
+                    raise
+
+                # 磁盘内容已变为加密文件, 丢弃缓存中的明文工作簿
+                workbook_cache.invalidate(file_path)
 
                 logger.info(f"工作簿加密成功: {file_path}")
                 return {
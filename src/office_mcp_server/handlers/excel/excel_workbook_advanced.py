@@ -1,15 +1,67 @@
 """Excel 工作簿高级操作模块."""
 
 import shutil
+from functools import partial
 from typing import Any, Optional
 from pathlib import Path
 
+from lxml import etree
 from openpyxl import load_workbook, Workbook
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import coordinate_to_tuple
 from openpyxl.worksheet.protection import SheetProtection
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.excel.excel_cache import workbook_cache
 from office_mcp_server.utils.file_manager import FileManager
+from office_mcp_server.utils.xlsx_patch import patch_sheet_xml, sheet_tag
+
+
+def _set_frozen_pane_xml(sheet: Any, top_left_cell: Optional[str]) -> bool:
+    """直接修改工作表 XML 中的冻结窗格.
+
+    生成的 pane/selection 元素与 openpyxl ``Worksheet.freeze_panes`` 的写法一致;
+    缺少 sheetView 或 selection 元素时交给 openpyxl 处理。
+    """
+    view = sheet.find(f"{sheet_tag('sheetViews')}/{sheet_tag('sheetView')}")
+    if view is None:
+        return False
+
+    freeze = bool(top_left_cell) and top_left_cell != "A1"
+    selections = view.findall(sheet_tag("selection"))
+    if freeze and not selections:
+        return False
+
+    old_pane = view.find(sheet_tag("pane"))
+    if old_pane is not None:
+        view.remove(old_pane)
+    if not freeze:
+        return True
+
+    row, column = coordinate_to_tuple(top_left_cell)
+    if row > 1 and column > 1:
+        active_pane = "bottomRight"
+    elif row > 1:
+        active_pane = "bottomLeft"
+    else:
+        active_pane = "topRight"
+
+    pane = etree.Element(sheet_tag("pane"))
+    if column > 1:
+        pane.set("xSplit", str(column - 1))
+    if row > 1:
+        pane.set("ySplit", str(row - 1))
+    pane.set("topLeftCell", top_left_cell)
+    pane.set("activePane", active_pane)
+    pane.set("state", "frozen")
+    view.insert(0, pane)
+
+    selections[0].set("pane", active_pane)
+    if row > 1 and column > 1:
+        for name in ("topRight", "bottomLeft"):
+            selections[0].addprevious(etree.Element(sheet_tag("selection"), pane=name))
+    return True
 
 
 class ExcelWorkbookAdvancedOperations:
@@ -43,7 +95,8 @@ class ExcelWorkbookAdvancedOperations:
             output_path = config.paths.output_dir / new_filename
             self.file_manager.ensure_directory(output_path.parent)
 
-            shutil.copy(template_path, output_path)
+            with workbook_cache.reading(template_path):
+                shutil.copy(template_path, output_path)
 
             if sheet_name:
                 wb = load_workbook(str(output_path))
@@ -83,7 +136,9 @@ class ExcelWorkbookAdvancedOperations:
             output_path = config.paths.output_dir / new_filename
             self.file_manager.ensure_directory(output_path.parent)
 
-            shutil.copy(source_path, output_path)
+            # 持有文件锁复制, 不会复制到其他调用写了一半的文件
+            with workbook_cache.reading(source_path):
+                shutil.copy(source_path, output_path)
 
             logger.info(f"复制工作簿成功: {source_path} -> {output_path}")
             return {
@@ -171,31 +226,34 @@ class ExcelWorkbookAdvancedOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            wb = load_workbook(str(file_path))
-
-            if sheet_name not in wb.sheetnames:
-                raise ValueError(f"工作表 '{sheet_name}' 不存在")
-
-            ws = wb[sheet_name]
-
-            # 如果指定了单元格，使用单元格位置
+            # 计算冻结区域左上角单元格 (None 表示取消冻结)
             if cell:
-                ws.freeze_panes = cell
+                # 如果指定了单元格，使用单元格位置
+                top_left_cell = cell
                 freeze_info = f"单元格 {cell}"
-            # 否则根据行列数计算
             elif freeze_rows > 0 or freeze_cols > 0:
-                from openpyxl.utils import get_column_letter
-                col_letter = get_column_letter(freeze_cols + 1)
-                row_num = freeze_rows + 1
-                ws.freeze_panes = f"{col_letter}{row_num}"
+                # 否则根据行列数计算
+                top_left_cell = f"{get_column_letter(freeze_cols + 1)}{freeze_rows + 1}"
                 freeze_info = f"{freeze_rows} 行, {freeze_cols} 列"
             else:
                 # 取消冻结
-                ws.freeze_panes = None
+                top_left_cell = None
                 freeze_info = "已取消"
 
-            wb.save(str(file_path))
-            wb.close()
+            # 工作簿不在缓存中时只改写该工作表 XML 的 pane 元素,
+            # 不解析、也不重新序列化整个工作簿
+            wb = workbook_cache.lookup(file_path)
+            if wb is not None or not patch_sheet_xml(
+                file_path, sheet_name, partial(_set_frozen_pane_xml, top_left_cell=top_left_cell)
+            ):
+                if wb is None:
+                    wb = workbook_cache.load(file_path)
+
+                if sheet_name not in wb.sheetnames:
+                    raise ValueError(f"工作表 '{sheet_name}' 不存在")
+
+                wb[sheet_name].freeze_panes = top_left_cell
+                workbook_cache.save(wb, file_path)
 
             logger.info(f"冻结窗格成功: {file_path}")
             return {
@@ -247,8 +305,10 @@ class ExcelWorkbookAdvancedOperations:
 
             backup_file_path = backup_path / backup_filename
 
-            # 复制文件作为备份
-            shutil.copy(str(file_path), str(backup_file_path))
+            # 复制文件作为备份 (内核态复制, 写时复制文件系统上不复制数据块),
+            # 持有文件锁, 不会备份到其他调用写了一半的文件
+            with workbook_cache.reading(file_path):
+                self.file_manager.clone_file(file_path, backup_file_path)
 
             logger.info(f"自动保存工作簿成功: {backup_file_path}")
             return {
@@ -3,6 +3,7 @@
 from typing import Any, Optional, Union
 
 from loguru import logger
+from openpyxl.xml import LXML
 
 from office_mcp_server.config import config
 from office_mcp_server.handlers.excel.excel_basic import ExcelBasicOperations
@@ -53,6 +54,8 @@ class ExcelHandler:
         self.report_ops = ExcelReportAutomation()
         self.cell_advanced_ops = ExcelCellAdvancedOperations()
         self.data_masking_ops = DataMasking()
+        if not LXML:
+            logger.warning("openpyxl 未启用 lxml, 将使用较慢的标准库 XML 解析器")
         logger.info("Excel 处理器初始化完成 - 已加载所有功能模块")
 
     # ========== 基础操作 ==========
@@ -105,6 +108,30 @@ class ExcelHandler:
             border_style, border_color
         )
 
+    def format_range(
+        self,
+        filename: str,
+        sheet_name: str,
+        cell_range: str,
+        font_name: Optional[str] = None,
+        font_size: Optional[int] = None,
+        bold: bool = False,
+        color: Optional[str] = None,
+        bg_color: Optional[str] = None,
+        number_format: Optional[str] = None,
+        horizontal_alignment: Optional[str] = None,
+        vertical_alignment: Optional[str] = None,
+        wrap_text: bool = False,
+        border_style: Optional[str] = None,
+        border_color: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """批量格式化单元格范围."""
+        return self.format_ops.format_range(
+            filename, sheet_name, cell_range, font_name, font_size, bold, color, bg_color,
+            number_format, horizontal_alignment, vertical_alignment, wrap_text,
+            border_style, border_color
+        )
+
     def apply_conditional_formatting(
         self,
         filename: str,
@@ -1,13 +1,29 @@
 """PowerPoint 页眉页脚、批量操作和超链接模块."""
 
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
 from typing import Any, Optional, List
 
-from pptx import Presentation
+from pptx.text.text import TextFrame
 from pptx.util import Inches
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.ppt.ppt_cache import presentation_cache
+from office_mcp_server.handlers.ppt.ppt_style import set_transition_xml
 from office_mcp_server.utils.file_manager import FileManager
+from office_mcp_server.utils.pptx_xml import patch_slides_xml
+
+
+def _add_footer_xml(sld: Any, footer_text: str) -> None:
+    """在幻灯片底部添加页脚文本框 (形状编号和名称与 python-pptx 的 add_textbox 一致)."""
+    shape_tree = sld.cSld.spTree
+    shape_id = shape_tree.max_shape_id + 1
+    sp = shape_tree.add_textbox(
+        shape_id, f"TextBox {shape_id - 1}", Inches(0.5), Inches(7.0), Inches(9.0), Inches(0.3)
+    )
+    TextFrame(sp.txBody, None).text = footer_text
 
 
 class PowerPointAdvancedFeatures:
@@ -39,7 +55,7 @@ class PowerPointAdvancedFeatures:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
+            prs = presentation_cache.load(file_path)
 
             # 设置页眉页脚 (需要通过XML操作)
             # python-pptx的页眉页脚功能有限
@@ -53,7 +69,7 @@ class PowerPointAdvancedFeatures:
                     tf = txBox.text_frame
                     tf.text = footer_text
 
-            prs.save(str(file_path))
+            presentation_cache.save(prs, file_path)
 
             logger.info(f"页眉页脚设置成功: {file_path}")
             return {
@@ -89,7 +105,7 @@ class PowerPointAdvancedFeatures:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
+            prs = presentation_cache.load(file_path)
 
             if slide_index >= len(prs.slides):
                 raise ValueError(f"幻灯片索引 {slide_index} 超出范围")
@@ -120,7 +136,7 @@ class PowerPointAdvancedFeatures:
                 else:
                     raise ValueError(f"不支持的链接类型: {link_type}")
 
-            prs.save(str(file_path))
+            presentation_cache.save(prs, file_path)
 
             logger.info(f"超链接添加成功: {file_path}")
             return {
@@ -204,24 +220,17 @@ class PowerPointAdvancedFeatures:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
-
-            # 确定要处理的幻灯片
-            if slide_indices is None:
-                slides_to_process = list(range(len(prs.slides)))
-            else:
-                slides_to_process = slide_indices
-
-            # 批量设置过渡效果需要调用过渡效果设置方法
-            # 这里返回处理信息
-            prs.save(str(file_path))
+            mutate = partial(
+                set_transition_xml, transition_type=transition_type, duration=duration
+            )
+            slides_affected = self._patch_slides(file_path, slide_indices, mutate)
 
             logger.info(f"批量设置过渡效果成功: {file_path}")
             return {
                 "success": True,
-                "message": f"批量设置过渡效果成功,共处理 {len(slides_to_process)} 张幻灯片",
+                "message": f"批量设置过渡效果成功,共处理 {slides_affected} 张幻灯片",
                 "filename": str(file_path),
-                "slides_affected": len(slides_to_process),
+                "slides_affected": slides_affected,
             }
 
         except Exception as e:
@@ -245,33 +254,45 @@ class PowerPointAdvancedFeatures:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
-
-            # 确定要处理的幻灯片
-            if slide_indices is None:
-                slides_to_process = prs.slides
-            else:
-                slides_to_process = [prs.slides[i] for i in slide_indices if i < len(prs.slides)]
-
-            # 批量添加页脚
-            for slide in slides_to_process:
-                txBox = slide.shapes.add_textbox(
-                    Inches(0.5), Inches(7.0), Inches(9.0), Inches(0.3)
-                )
-                tf = txBox.text_frame
-                tf.text = footer_text
-
-            prs.save(str(file_path))
+            mutate = partial(_add_footer_xml, footer_text=footer_text)
+            slides_affected = self._patch_slides(file_path, slide_indices, mutate)
 
             logger.info(f"批量添加页脚成功: {file_path}")
             return {
                 "success": True,
-                "message": f"批量添加页脚成功,共处理 {len(slides_to_process)} 张幻灯片",
+                "message": f"批量添加页脚成功,共处理 {slides_affected} 张幻灯片",
                 "filename": str(file_path),
                 "footer_text": footer_text,
-                "slides_affected": len(slides_to_process),
+                "slides_affected": slides_affected,
             }
 
         except Exception as e:
             logger.error(f"批量添加页脚失败: {e}")
             return {"success": False, "message": f"操作失败: {str(e)}"}
+
+    @staticmethod
+    def _patch_slides(
+        file_path: Path,
+        slide_indices: Optional[List[int]],
+        mutate: Callable[[Any], None],
+    ) -> int:
+        """对多张幻灯片的 XML 执行同一修改, 只写入一次文件.
+
+        只改写目标幻灯片部件, 其余部件原样复制; 编辑会话中则修改缓存的演示文稿,
+        与其他修改一起在提交时写盘。
+
+        Returns:
+            int: 处理的幻灯片数
+        """
+        if not presentation_cache.in_session(file_path):
+            return patch_slides_xml(file_path, slide_indices, mutate)
+
+        prs = presentation_cache.load(file_path)
+        if slide_indices is None:
+            slides = list(prs.slides)
+        else:
+            slides = [prs.slides[i] for i in slide_indices if i < len(prs.slides)]
+        for slide in slides:
+            mutate(slide._element)
+        presentation_cache.save(prs, file_path)
+        return len(slides)
@@ -2,11 +2,11 @@
 
 from typing import Any, Optional
 
-from pptx import Presentation
 from pptx.util import Inches
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.ppt.ppt_cache import presentation_cache
 from office_mcp_server.utils.file_manager import FileManager
 
 
@@ -42,7 +42,7 @@ class PowerPointAnimationOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
+            prs = presentation_cache.load(file_path)
 
             if slide_index < 0 or slide_index >= len(prs.slides):
                 raise ValueError(f"幻灯片索引 {slide_index} 超出范围 (0-{len(prs.slides)-1})")
@@ -100,7 +100,8 @@ class PowerPointAnimationOperations:
                 import win32com.client as win32
 
                 # 保存并关闭python-pptx的演示文稿
-                prs.save(str(file_path))
+                presentation_cache.save(prs, file_path)
+                presentation_cache.flush(file_path)
 
                 # 使用PowerPoint COM接口
                 powerpoint = win32.gencache.EnsureDispatch('PowerPoint.Application')
@@ -148,7 +149,7 @@ class PowerPointAnimationOperations:
 
             except ImportError:
                 # 如果win32com不可用，只保存基本信息
-                prs.save(str(file_path))
+                presentation_cache.save(prs, file_path)
 
                 return {
                     "success": False,
@@ -8,6 +8,7 @@ from pptx.util import Inches
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.ppt.ppt_cache import presentation_cache
 from office_mcp_server.utils.file_manager import FileManager
 
 
@@ -56,7 +57,7 @@ class PowerPointBasicOperations:
                 title_shape = slide.shapes.title
                 title_shape.text = title
 
-            prs.save(str(output_path))
+            presentation_cache.save(prs, output_path)
 
             logger.info(f"PowerPoint 演示文稿创建成功: {output_path}")
             return {
@@ -79,7 +80,7 @@ class PowerPointBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
+            prs = presentation_cache.load(file_path)
             slide_layout = prs.slide_layouts[layout_index]
             slide = prs.slides.add_slide(slide_layout)
 
@@ -87,7 +88,7 @@ class PowerPointBasicOperations:
             if title and slide.shapes.title:
                 slide.shapes.title.text = title
 
-            prs.save(str(file_path))
+            presentation_cache.save(prs, file_path)
 
             logger.info(f"幻灯片添加成功: {file_path}")
             return {
@@ -107,7 +108,7 @@ class PowerPointBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
+            prs = presentation_cache.load(file_path)
 
             if slide_index >= len(prs.slides):
                 raise ValueError(f"幻灯片索引 {slide_index} 超出范围")
@@ -117,7 +118,7 @@ class PowerPointBasicOperations:
             prs.part.drop_rel(rId)
             del prs.slides._sldIdLst[slide_index]
 
-            prs.save(str(file_path))
+            presentation_cache.save(prs, file_path)
 
             logger.info(f"幻灯片删除成功: {file_path}")
             return {
@@ -139,7 +140,7 @@ class PowerPointBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
+            prs = presentation_cache.load(file_path)
 
             slide_count = len(prs.slides)
             if from_index >= slide_count or to_index >= slide_count:
@@ -155,7 +156,7 @@ class PowerPointBasicOperations:
             for s in slides:
                 prs.slides._sldIdLst.append(s)
 
-            prs.save(str(file_path))
+            presentation_cache.save(prs, file_path)
 
             logger.info(f"幻灯片移动成功: {file_path}")
             return {
@@ -174,7 +175,7 @@ class PowerPointBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
+            prs = presentation_cache.load(file_path)
 
             if slide_index >= len(prs.slides):
                 raise ValueError(f"幻灯片索引 {slide_index} 超出范围")
@@ -192,7 +193,7 @@ class PowerPointBasicOperations:
                 newel = el.__class__(el)
                 dest_slide.shapes._spTree.insert_element_before(newel, 'p:extLst')
 
-            prs.save(str(file_path))
+            presentation_cache.save(prs, file_path)
 
             logger.info(f"幻灯片复制成功: {file_path}")
             return {
@@ -212,8 +213,9 @@ class PowerPointBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
+            prs = presentation_cache.load(file_path)
             slide_count = len(prs.slides)
+            presentation_cache.release(prs, file_path)
 
             logger.info(f"获取演示文稿信息成功: {file_path}")
             return {
@@ -225,3 +227,60 @@ class PowerPointBasicOperations:
         except Exception as e:
             logger.error(f"获取演示文稿信息失败: {e}")
             return {"success": False, "message": f"获取失败: {str(e)}"}
+
+    def begin_edit(self, filename: str) -> dict[str, Any]:
+        """开启编辑会话: 之后的修改只作用于缓存中的演示文稿, 提交时统一保存一次."""
+        try:
+            file_path = config.paths.output_dir / filename
+            self.file_manager.validate_file_path(file_path, must_exist=True)
+
+            if not presentation_cache.begin(file_path):
+                return {
+                    "success": True,
+                    "message": "编辑会话已开启",
+                    "filename": str(file_path),
+                }
+
+            logger.info(f"开启编辑会话: {file_path}")
+            return {
+                "success": True,
+                "message": "编辑会话已开启, 修改将在提交时统一保存",
+                "filename": str(file_path),
+            }
+
+        except Exception as e:
+            logger.error(f"开启编辑会话失败: {e}")
+            return {"success": False, "message": f"开启失败: {str(e)}"}
+
+    def commit_edit(self, filename: str, save: bool = True) -> dict[str, Any]:
+        """结束编辑会话, 保存 (或丢弃) 会话中的修改."""
+        try:
+            file_path = config.paths.output_dir / filename
+            if presentation_cache.aborted(file_path):
+                presentation_cache.end(file_path, commit=False)
+                return {
+                    "success": False,
+                    "message": "编辑会话已因操作失败中止, 未保存的修改已丢弃",
+                    "filename": str(file_path),
+                    "saved": False,
+                }
+            if not presentation_cache.in_session(file_path):
+                return {"success": False, "message": f"未开启编辑会话: {filename}"}
+
+            saved = presentation_cache.end(file_path, commit=save)
+            if saved:
+                message = "修改已保存"
+            else:
+                message = "没有需要保存的修改" if save else "修改已丢弃"
+
+            logger.info(f"结束编辑会话: {file_path} (已保存: {saved})")
+            return {
+                "success": True,
+                "message": message,
+                "filename": str(file_path),
+                "saved": saved,
+            }
+
+        except Exception as e:
+            logger.error(f"提交编辑会话失败: {e}")
+            return {"success": False, "message": f"提交失败: {str(e)}"}
@@ -0,0 +1,17 @@
+"""PowerPoint 演示文稿缓存模块."""
+
+import atexit
+
+from pptx import Presentation
+from pptx.presentation import Presentation as PresentationType
+
+from office_mcp_server.config import config
+from office_mcp_server.utils.document_cache import DocumentCache
+
+# 所有 PowerPoint 操作共享的已解析演示文稿缓存
+presentation_cache: DocumentCache[PresentationType] = DocumentCache(
+    Presentation, maxsize=config.powerpoint.presentation_cache_size
+)
+
+# 进程退出前写入编辑会话中尚未提交的修改
+atexit.register(presentation_cache.flush_all)
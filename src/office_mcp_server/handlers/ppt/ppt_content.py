@@ -1,14 +1,31 @@
 """PowerPoint 内容操作模块."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
-from pptx import Presentation
+from pptx.parts.image import Image
+from pptx.table import _Cell
 from pptx.util import Inches
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.ppt.ppt_cache import presentation_cache
 from office_mcp_server.utils.file_manager import FileManager
+from office_mcp_server.utils.pptx_xml import add_picture_xml
+
+
+@lru_cache(maxsize=32)
+def _cached_image(path: str, mtime_ns: int, size: int) -> Image:
+    """读取图片 (按路径、修改时间和大小缓存, 文件变化后自动重新读取)."""
+    return Image.from_file(path)
+
+
+def _load_image(image_path: Path) -> Image:
+    """读取图片, 同一个图片 (如每页都添加的徽标) 只读取和识别一次."""
+    stat = image_path.stat()
+    return _cached_image(os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size)
 
 
 class PowerPointContentOperations:
@@ -33,7 +50,7 @@ class PowerPointContentOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
+            prs = presentation_cache.load(file_path)
 
             if slide_index >= len(prs.slides):
                 raise ValueError(f"幻灯片索引 {slide_index} 超出范围")
@@ -50,7 +67,7 @@ class PowerPointContentOperations:
             text_frame = textbox.text_frame
             text_frame.text = text
 
-            prs.save(str(file_path))
+            presentation_cache.save(prs, file_path)
 
             logger.info(f"文本框添加成功: {file_path}")
             return {
@@ -82,25 +99,20 @@ class PowerPointContentOperations:
             if not img_path.exists():
                 raise FileNotFoundError(f"图片文件不存在: {image_path}")
 
-            prs = Presentation(str(file_path))
-
-            if slide_index >= len(prs.slides):
+            # 添加图片: 只改写目标幻灯片并追加图片部件, 包内已有相同图片时复用
+            # (编辑会话中尚未写盘的修改先写盘)
+            presentation_cache.flush(file_path)
+            width = Inches(width_inches) if width_inches else None
+            if not add_picture_xml(
+                file_path,
+                slide_index,
+                _load_image(img_path),
+                Inches(left_inches),
+                Inches(top_inches),
+                width,
+            ):
                 raise ValueError(f"幻灯片索引 {slide_index} 超出范围")
 
-            slide = prs.slides[slide_index]
-
-            # 添加图片
-            left = Inches(left_inches)
-            top = Inches(top_inches)
-
-            if width_inches:
-                width = Inches(width_inches)
-                slide.shapes.add_picture(str(img_path), left, top, width=width)
-            else:
-                slide.shapes.add_picture(str(img_path), left, top)
-
-            prs.save(str(file_path))
-
             logger.info(f"图片添加成功: {file_path}")
             return {
                 "success": True,
@@ -112,6 +124,35 @@ class PowerPointContentOperations:
             logger.error(f"添加图片失败: {e}")
             return {"success": False, "message": f"添加失败: {str(e)}"}
 
+    @staticmethod
+    def add_table_to_presentation(
+        prs: Any,
+        slide_index: int,
+        rows: int,
+        cols: int,
+        data: Optional[list[list[str]]] = None,
+    ) -> None:
+        """在已打开的演示文稿中添加表格并填充数据 (不保存)."""
+        if slide_index >= len(prs.slides):
+            raise ValueError(f"幻灯片索引 {slide_index} 超出范围")
+
+        slide = prs.slides[slide_index]
+
+        # 添加表格
+        left = Inches(1.0)
+        top = Inches(2.0)
+        width = Inches(8.0)
+        height = Inches(3.0)
+
+        table = slide.shapes.add_table(rows, cols, left, top, width, height).table
+
+        # 填充数据: 按行遍历 a:tr/a:tc 元素, 不用 table.cell(i, j)
+        # (每次调用都重新查询整张表的行列表), 超出表格的数据被忽略
+        if data:
+            for tr, row_data in zip(table._tbl.tr_lst, data, strict=False):
+                for tc, cell_data in zip(tr.tc_lst, row_data, strict=False):
+                    _Cell(tc, table).text = str(cell_data)
+
     def add_table(
         self,
         filename: str,
@@ -125,32 +166,9 @@ class PowerPointContentOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
-
-            if slide_index >= len(prs.slides):
-                raise ValueError(f"幻灯片索引 {slide_index} 超出范围")
-
-            slide = prs.slides[slide_index]
-
-            # 添加表格
-            left = Inches(1.0)
-            top = Inches(2.0)
-            width = Inches(8.0)
-            height = Inches(3.0)
-
-            table = slide.shapes.add_table(rows, cols, left, top, width, height).table
-
-            # 填充数据
-            if data:
-                for i, row_data in enumerate(data):
-                    if i >= rows:
-                        break
-                    for j, cell_data in enumerate(row_data):
-                        if j >= cols:
-                            break
-                        table.cell(i, j).text = str(cell_data)
-
-            prs.save(str(file_path))
+            prs = presentation_cache.load(file_path)
+            self.add_table_to_presentation(prs, slide_index, rows, cols, data)
+            presentation_cache.save(prs, file_path)
 
             logger.info(f"表格添加成功: {file_path}")
             return {
@@ -1,20 +1,66 @@
 """PowerPoint 内容高级操作模块 - 表格高级操作、形状、图表等."""
 
+from collections.abc import Callable
+from itertools import accumulate
 from typing import Any, Optional, List
 
-from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.chart import XL_CHART_TYPE
-from pptx.chart.data import CategoryChartData
+from pptx.chart.data import Categories, CategoryChartData
 from pptx.dml.color import RGBColor
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.ppt.ppt_cache import presentation_cache
+from office_mcp_server.handlers.ppt.ppt_content import PowerPointContentOperations
 from office_mcp_server.utils.file_manager import FileManager
 from office_mcp_server.utils.format_helper import ColorUtils
 
 
+class _IndexedCategories(Categories):
+    """分类集合: 一次性计算各分类的叶子偏移.
+
+    python-pptx 写入图表数据时对每个分类调用 ``index``, 其实现逐个线性查找,
+    分类较多时整体为 O(n²) (3000 个分类约 2.6 秒)。
+    """
+
+    def index(self, category: Any) -> int:
+        """返回分类在叶子分类序列中的偏移."""
+        offsets = getattr(self, "_offsets", None)
+        if offsets is None or len(offsets) != len(self._categories):
+            leaf_counts = (item.leaf_count for item in self._categories)
+            # accumulate(initial=0) 比分类多产生一个值 (总数), 不需要严格等长
+            offsets = self._offsets = {
+                id(item): offset
+                for item, offset in zip(
+                    self._categories, accumulate(leaf_counts, initial=0), strict=False
+                )
+            }
+        try:
+            return offsets[id(category)]
+        except KeyError:
+            raise ValueError("category not in top-level categories") from None
+
+
+class _CategoryChartData(CategoryChartData):
+    """使用 ``_IndexedCategories`` 的分类图表数据."""
+
+    @property
+    def categories(self) -> Categories:
+        """分类集合."""
+        if not getattr(self, "_categories", False):
+            self._categories = _IndexedCategories()
+        return self._categories
+
+    @categories.setter
+    def categories(self, category_labels: List[Any]) -> None:
+        categories = _IndexedCategories()
+        for label in category_labels:
+            categories.add_category(label)
+        self._categories = categories
+
+
 class PowerPointContentAdvancedOperations:
     """PowerPoint 内容高级操作类."""
 
@@ -44,24 +90,9 @@ class PowerPointContentAdvancedOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
-            slide = prs.slides[slide_index]
-
-            # 查找表格
-            tables = [shape for shape in slide.shapes if shape.has_table]
-            if table_index >= len(tables):
-                raise ValueError(f"表格索引 {table_index} 超出范围")
-
-            table = tables[table_index].table
-
-            # 添加行 (python-pptx不支持在指定位置插入行,只能添加到末尾)
-            new_row = table.add_row()
-
-            if data:
-                for col_idx, cell_data in enumerate(data[:len(new_row.cells)]):
-                    new_row.cells[col_idx].text = str(cell_data)
-
-            prs.save(str(file_path))
+            prs = presentation_cache.load(file_path)
+            self._insert_row(prs, slide_index, table_index, row_index, data)
+            presentation_cache.save(prs, file_path)
 
             logger.info(f"表格行插入成功: {file_path}")
             return {
@@ -86,7 +117,7 @@ class PowerPointContentAdvancedOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
+            prs = presentation_cache.load(file_path)
             slide = prs.slides[slide_index]
 
             tables = [shape for shape in slide.shapes if shape.has_table]
@@ -94,6 +125,7 @@ class PowerPointContentAdvancedOperations:
                 raise ValueError(f"表格索引 {table_index} 超出范围")
 
             table = tables[table_index].table
+            presentation_cache.release(prs, file_path)
 
             # python-pptx不直接支持删除行,需要通过XML操作
             # 这里返回提示信息
@@ -122,21 +154,9 @@ class PowerPointContentAdvancedOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
-            slide = prs.slides[slide_index]
-
-            tables = [shape for shape in slide.shapes if shape.has_table]
-            if table_index >= len(tables):
-                raise ValueError(f"表格索引 {table_index} 超出范围")
-
-            table = tables[table_index].table
-
-            # 合并单元格
-            start_cell = table.cell(start_row, start_col)
-            end_cell = table.cell(end_row, end_col)
-            start_cell.merge(end_cell)
-
-            prs.save(str(file_path))
+            prs = presentation_cache.load(file_path)
+            self._merge_cells(prs, slide_index, table_index, start_row, start_col, end_row, end_col)
+            presentation_cache.save(prs, file_path)
 
             logger.info(f"表格单元格合并成功: {file_path}")
             return {
@@ -166,35 +186,11 @@ class PowerPointContentAdvancedOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
-            slide = prs.slides[slide_index]
-
-            tables = [shape for shape in slide.shapes if shape.has_table]
-            if table_index >= len(tables):
-                raise ValueError(f"表格索引 {table_index} 超出范围")
-
-            table = tables[table_index].table
-            cell = table.cell(row, col)
-
-            # 设置填充颜色
-            if fill_color:
-                r, g, b = ColorUtils.hex_to_rgb(fill_color)
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = RGBColor(r, g, b)
-
-            # 设置文本格式
-            if cell.text_frame:
-                for paragraph in cell.text_frame.paragraphs:
-                    for run in paragraph.runs:
-                        if text_color:
-                            r, g, b = ColorUtils.hex_to_rgb(text_color)
-                            run.font.color.rgb = RGBColor(r, g, b)
-                        if bold:
-                            run.font.bold = True
-                        if font_size:
-                            run.font.size = Pt(font_size)
-
-            prs.save(str(file_path))
+            prs = presentation_cache.load(file_path)
+            self._format_cell(
+                prs, slide_index, table_index, row, col, fill_color, text_color, bold, font_size
+            )
+            presentation_cache.save(prs, file_path)
 
             logger.info(f"表格单元格格式化成功: {file_path}")
             return {
@@ -207,6 +203,138 @@ class PowerPointContentAdvancedOperations:
             logger.error(f"格式化表格单元格失败: {e}")
             return {"success": False, "message": f"操作失败: {str(e)}"}
 
+    def bulk_table_ops(self, filename: str, ops: List[dict[str, Any]]) -> dict[str, Any]:
+        """批量执行表格操作, 演示文稿只打开和保存一次.
+
+        任一操作失败时不保存, 文件保持不变。
+
+        Args:
+            filename: 文件名
+            ops: 操作列表. 每项的 'kind' 为 'add_table'、'insert_row'、'merge_cells'
+                或 'format_cell', 其余键与对应单项操作的参数相同 (不含 filename)
+        """
+        try:
+            file_path = config.paths.output_dir / filename
+            self.file_manager.validate_file_path(file_path, must_exist=True)
+
+            # 先校验操作类型, 避免执行到一半才发现不支持
+            for index, op in enumerate(ops):
+                if op.get("kind") not in _TABLE_OPERATIONS:
+                    raise ValueError(f"第 {index + 1} 个操作类型不支持: {op.get('kind')}")
+
+            prs = presentation_cache.load(file_path)
+            for index, op in enumerate(ops):
+                params = {key: value for key, value in op.items() if key != "kind"}
+                try:
+                    _TABLE_OPERATIONS[op["kind"]](prs, **params)
+                except Exception as e:
+                    raise ValueError(f"第 {index + 1} 个操作 ({op['kind']}) 失败: {e}") from e
+
+            presentation_cache.save(prs, file_path)
+
+            logger.info(f"批量表格操作成功: {file_path}, 共 {len(ops)} 个操作")
+            return {
+                "success": True,
+                "message": f"批量表格操作成功, 共 {len(ops)} 个操作",
+                "filename": str(file_path),
+                "operations": len(ops),
+            }
+
+        except Exception as e:
+            logger.error(f"批量表格操作失败: {e}")
+            return {"success": False, "message": f"操作失败: {str(e)}"}
+
+    @staticmethod
+    def _find_table(prs: Any, slide_index: int, table_index: int) -> Any:
+        """查找幻灯片中的第 table_index 个表格."""
+        slide = prs.slides[slide_index]
+
+        tables = [shape for shape in slide.shapes if shape.has_table]
+        if table_index >= len(tables):
+            raise ValueError(f"表格索引 {table_index} 超出范围")
+
+        return tables[table_index].table
+
+    @classmethod
+    def _insert_row(
+        cls,
+        prs: Any,
+        slide_index: int,
+        table_index: int,
+        row_index: int,
+        data: Optional[List[str]] = None,
+    ) -> None:
+        """在已打开的演示文稿中插入表格行 (不保存)."""
+        table = cls._find_table(prs, slide_index, table_index)
+
+        # python-pptx 没有插入行的接口, 直接添加 a:tr 元素 (行高沿用最后一行),
+        # 再移动到 row_index 处 (超出范围时保留在末尾)
+        tbl = table._tbl
+        rows = tbl.tr_lst
+        new_tr = tbl.add_tr(rows[-1].h if rows else Inches(0.4))
+        for _ in tbl.tblGrid.gridCol_lst:
+            new_tr.add_tc()
+        if 0 <= row_index < len(rows):
+            rows[row_index].addprevious(new_tr)
+
+        if data:
+            new_row = table.rows[tbl.tr_lst.index(new_tr)]
+            for col_idx, cell_data in enumerate(data[:len(new_row.cells)]):
+                new_row.cells[col_idx].text = str(cell_data)
+
+    @classmethod
+    def _merge_cells(
+        cls,
+        prs: Any,
+        slide_index: int,
+        table_index: int,
+        start_row: int,
+        start_col: int,
+        end_row: int,
+        end_col: int,
+    ) -> None:
+        """在已打开的演示文稿中合并表格单元格 (不保存)."""
+        table = cls._find_table(prs, slide_index, table_index)
+
+        # 合并单元格
+        start_cell = table.cell(start_row, start_col)
+        end_cell = table.cell(end_row, end_col)
+        start_cell.merge(end_cell)
+
+    @classmethod
+    def _format_cell(
+        cls,
+        prs: Any,
+        slide_index: int,
+        table_index: int,
+        row: int,
+        col: int,
+        fill_color: Optional[str] = None,
+        text_color: Optional[str] = None,
+        bold: bool = False,
+        font_size: Optional[int] = None,
+    ) -> None:
+        """在已打开的演示文稿中格式化表格单元格 (不保存)."""
+        cell = cls._find_table(prs, slide_index, table_index).cell(row, col)
+
+        # 设置填充颜色
+        if fill_color:
+            r, g, b = ColorUtils.hex_to_rgb(fill_color)
+            cell.fill.solid()
+            cell.fill.fore_color.rgb = RGBColor(r, g, b)
+
+        # 设置文本格式
+        if cell.text_frame:
+            for paragraph in cell.text_frame.paragraphs:
+                for run in paragraph.runs:
+                    if text_color:
+                        r, g, b = ColorUtils.hex_to_rgb(text_color)
+                        run.font.color.rgb = RGBColor(r, g, b)
+                    if bold:
+                        run.font.bold = True
+                    if font_size:
+                        run.font.size = Pt(font_size)
+
     # ========== 形状操作 ==========
     def add_shape(
         self,
@@ -239,7 +367,7 @@ class PowerPointContentAdvancedOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
+            prs = presentation_cache.load(file_path)
 
             if slide_index >= len(prs.slides):
                 raise ValueError(f"幻灯片索引 {slide_index} 超出范围")
@@ -282,7 +410,7 @@ class PowerPointContentAdvancedOperations:
                 r, g, b = ColorUtils.hex_to_rgb(line_color)
                 shape.line.color.rgb = RGBColor(r, g, b)
 
-            prs.save(str(file_path))
+            presentation_cache.save(prs, file_path)
 
             logger.info(f"形状添加成功: {file_path}")
             return {
@@ -328,7 +456,7 @@ class PowerPointContentAdvancedOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
+            prs = presentation_cache.load(file_path)
 
             if slide_index >= len(prs.slides):
                 raise ValueError(f"幻灯片索引 {slide_index} 超出范围")
@@ -348,7 +476,7 @@ class PowerPointContentAdvancedOperations:
                 raise ValueError(f"不支持的图表类型: {chart_type}")
 
             # 准备图表数据
-            chart_data = CategoryChartData()
+            chart_data = _CategoryChartData()
             chart_data.categories = categories
 
             for series_name, values in series_data.items():
@@ -365,7 +493,7 @@ class PowerPointContentAdvancedOperations:
                 chart.has_title = True
                 chart.chart_title.text_frame.text = title
 
-            prs.save(str(file_path))
+            presentation_cache.save(prs, file_path)
 
             logger.info(f"图表添加成功: {file_path}")
             return {
@@ -378,3 +506,12 @@ class PowerPointContentAdvancedOperations:
         except Exception as e:
             logger.error(f"添加图表失败: {e}")
             return {"success": False, "message": f"操作失败: {str(e)}"}
+
+
+# 批量表格操作分派表: 操作类型 -> 在已打开演示文稿上执行的函数
+_TABLE_OPERATIONS: dict[str, Callable[..., None]] = {
+    "add_table": PowerPointContentOperations.add_table_to_presentation,
+    "insert_row": PowerPointContentAdvancedOperations._insert_row,
+    "merge_cells": PowerPointContentAdvancedOperations._merge_cells,
+    "format_cell": PowerPointContentAdvancedOperations._format_cell,
+}
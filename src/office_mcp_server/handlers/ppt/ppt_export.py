@@ -6,7 +6,9 @@ from pptx import Presentation
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.ppt.ppt_cache import presentation_cache
 from office_mcp_server.utils.file_manager import FileManager
+from office_mcp_server.utils.office_app import powerpoint_app
 
 
 class PowerPointExportOperations:
@@ -27,8 +29,6 @@ class PowerPointExportOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
-
             # 确定输出文件名
             if not output_filename:
                 base_name = file_path.stem
@@ -47,15 +47,17 @@ class PowerPointExportOperations:
             if export_format == 'pdf':
                 # PDF导出
                 try:
-                    import comtypes.client
+                    presentation_cache.flush(file_path)
 
-                    powerpoint = comtypes.client.CreateObject("Powerpoint.Application")
-                    powerpoint.Visible = 1
+                    def save_as_pdf(powerpoint: Any) -> None:
+                        deck = powerpoint.Presentations.Open(str(file_path.absolute()))
+                        try:
+                            deck.SaveAs(str(output_path.absolute()), 32)  # 32 = ppSaveAsPDF
+                        finally:
+                            deck.Close()
 
-                    deck = powerpoint.Presentations.Open(str(file_path.absolute()))
-                    deck.SaveAs(str(output_path.absolute()), 32)  # 32 = ppSaveAsPDF
-                    deck.Close()
-                    powerpoint.Quit()
+                    # 复用常驻的 PowerPoint 实例, 不必每次导出都重新启动应用
+                    powerpoint_app.run(save_as_pdf)
 
                     message = f"演示文稿已成功导出为 PDF: {output_path}"
                 except ImportError:
@@ -70,8 +72,10 @@ class PowerPointExportOperations:
                     }
 
             elif export_format == 'html':
-                # 导出为HTML
+                # 导出为HTML (PDF 由 PowerPoint 直接读取文件, 只有 HTML 需要解析演示文稿)
+                prs = presentation_cache.load(file_path)
                 html_content = self._convert_to_html(prs)
+                presentation_cache.release(prs, file_path)
                 with open(output_path, 'w', encoding='utf-8') as f:
                     f.write(html_content)
                 message = f"演示文稿已成功导出为 HTML: {output_path}"
@@ -2,11 +2,26 @@
 
 from typing import Any, Optional
 
-from pptx import Presentation
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.oxml.ns import qn
+from pptx.text.text import TextFrame
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.ppt.ppt_cache import presentation_cache
 from office_mcp_server.utils.file_manager import FileManager
+from office_mcp_server.utils.pptx_xml import patch_notes_xml, read_slide_notes
+
+
+def _set_notes_text_xml(notes: Any, notes_text: str) -> bool:
+    """直接修改备注页 XML 中正文占位符的文本 (没有正文占位符时交给 python-pptx 处理)."""
+    for shape in notes.cSld.spTree.iter_ph_elms():
+        if shape.ph_type == PP_PLACEHOLDER.BODY:
+            if shape.tag != qn("p:sp"):
+                return False
+            TextFrame(shape.get_or_add_txBody(), None).text = notes_text
+            return True
+    return False
 
 
 class PowerPointNotesCommentsOperations:
@@ -33,19 +48,24 @@ class PowerPointNotesCommentsOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
+            # 幻灯片已有备注页时只改写该备注页的 XML 部件
+            # (缓存中的演示文稿因文件状态戳变化自动失效), 编辑会话中则修改缓存对象
+            if presentation_cache.in_session(file_path) or not patch_notes_xml(
+                file_path, slide_index, lambda notes: _set_notes_text_xml(notes, notes_text)
+            ):
+                prs = presentation_cache.load(file_path)
 
-            if slide_index >= len(prs.slides):
-                raise ValueError(f"幻灯片索引 {slide_index} 超出范围")
+                if slide_index >= len(prs.slides):
+                    raise ValueError(f"幻灯片索引 {slide_index} 超出范围")
 
-            slide = prs.slides[slide_index]
+                slide = prs.slides[slide_index]
 
-            # 获取或创建备注页
-            notes_slide = slide.notes_slide
-            text_frame = notes_slide.notes_text_frame
-            text_frame.text = notes_text
+                # 获取或创建备注页
+                notes_slide = slide.notes_slide
+                text_frame = notes_slide.notes_text_frame
+                text_frame.text = notes_text
 
-            prs.save(str(file_path))
+                presentation_cache.save(prs, file_path)
 
             logger.info(f"演讲者备注添加成功: {file_path}")
             return {
@@ -74,15 +94,12 @@ class PowerPointNotesCommentsOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
-
-            if slide_index >= len(prs.slides):
+            # 只读取目标幻灯片和备注页的 XML, 不加载整个演示文稿
+            presentation_cache.flush(file_path)
+            notes_text = read_slide_notes(file_path, slide_index)
+            if notes_text is None:
                 raise ValueError(f"幻灯片索引 {slide_index} 超出范围")
 
-            slide = prs.slides[slide_index]
-            notes_slide = slide.notes_slide
-            notes_text = notes_slide.notes_text_frame.text
-
             logger.info(f"演讲者备注获取成功: {file_path}")
             return {
                 "success": True,
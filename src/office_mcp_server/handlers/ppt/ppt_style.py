@@ -1,16 +1,154 @@
 """PowerPoint 样式操作模块 - 格式化、主题、过渡."""
 
-from typing import Any, Optional
+from functools import partial
+from typing import Any, List, Optional
 
-from pptx import Presentation
 from pptx.util import Pt, Inches
 from pptx.enum.text import PP_ALIGN, MSO_AUTO_SIZE
 from pptx.dml.color import RGBColor
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+from pptx.text.text import TextFrame
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.ppt.ppt_cache import presentation_cache
 from office_mcp_server.utils.file_manager import FileManager
 from office_mcp_server.utils.format_helper import ColorUtils
+from office_mcp_server.utils.pptx_xml import patch_slide_edits, patch_slide_xml
+
+# 对齐方式映射
+_ALIGNMENT_MAP = {
+    'left': PP_ALIGN.LEFT,
+    'center': PP_ALIGN.CENTER,
+    'right': PP_ALIGN.RIGHT,
+    'justify': PP_ALIGN.JUSTIFY,
+}
+
+# 过渡类型 -> p:transition 元素 XML
+_TRANSITION_XML = {
+    'fade': '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med"><p:fade thruBlk="0"/></p:transition>',
+    'push': '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med"><p:push dir="l"/></p:transition>',
+    'wipe': '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med"><p:wipe dir="l"/></p:transition>',
+    'split': '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med"><p:split orient="horz" dir="in"/></p:transition>',
+    'reveal': '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med"><p:reveal dir="l"/></p:transition>',
+    'random': '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med"><p:random/></p:transition>',
+    'none': '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med"/>',
+}
+
+
+def set_transition_xml(sld: Any, transition_type: str, duration: float) -> None:
+    """替换幻灯片 (p:sld 元素) 的过渡效果.
+
+    Args:
+        sld: 幻灯片根元素
+        transition_type: 过渡类型
+        duration: 持续时间 (秒)
+
+    Raises:
+        ValueError: 不支持的过渡类型
+    """
+    if transition_type not in _TRANSITION_XML:
+        raise ValueError(f"不支持的过渡类型: {transition_type}")
+
+    # 移除现有过渡效果
+    existing_transition = sld.find(qn('p:transition'))
+    if existing_transition is not None:
+        sld.remove(existing_transition)
+
+    # 添加新的过渡效果: p:sld 子元素顺序为 cSld, clrMapOvr, transition, timing, extLst
+    if transition_type != 'none':
+        transition_element = parse_xml(_TRANSITION_XML[transition_type])
+        transition_element.set('advTm', str(int(duration * 1000)))
+        anchor = sld.find(qn('p:clrMapOvr'))
+        if anchor is None:
+            anchor = sld.find(qn('p:cSld'))
+        anchor.addnext(transition_element)
+
+# 文本格式参数及其默认值 (与 format_text 一致)
+_TEXT_FORMAT_DEFAULTS: dict[str, Any] = {
+    "font_name": None,
+    "font_size": None,
+    "bold": False,
+    "italic": False,
+    "underline": False,
+    "color": None,
+    "alignment": None,
+}
+
+
+def _apply_text_format(
+    text_frame: TextFrame,
+    font_name: Optional[str],
+    font_size: Optional[int],
+    bold: bool,
+    italic: bool,
+    underline: bool,
+    color: Optional[str],
+    alignment: Optional[str],
+) -> None:
+    """应用格式到文本框的所有段落和运行."""
+    for paragraph in text_frame.paragraphs:
+        if alignment and alignment in _ALIGNMENT_MAP:
+            paragraph.alignment = _ALIGNMENT_MAP[alignment]
+
+        for run in paragraph.runs:
+            if font_name:
+                run.font.name = font_name
+            if font_size:
+                run.font.size = Pt(font_size)
+
+            run.font.bold = bold
+            run.font.italic = italic
+            run.font.underline = underline
+
+            if color:
+                r, g, b = ColorUtils.hex_to_rgb(color)
+                run.font.color.rgb = RGBColor(r, g, b)
+
+
+def _format_text_xml(slide: Any, shape_index: int, **text_format: Any) -> bool:
+    """直接修改幻灯片 XML 中文本形状的格式 (形状不存在或不是文本形状时交给 python-pptx 处理)."""
+    shapes = list(slide.cSld.spTree.iter_shape_elms())
+    if shape_index >= len(shapes) or shapes[shape_index].tag != qn("p:sp"):
+        return False
+    _apply_text_format(TextFrame(shapes[shape_index].get_or_add_txBody(), None), **text_format)
+    return True
+
+
+def _format_shape_text(
+    prs: Any, slide_index: int, shape_index: int, text_format: dict[str, Any]
+) -> None:
+    """在已打开的演示文稿中格式化形状文本 (不保存)."""
+    if slide_index >= len(prs.slides):
+        raise ValueError(f"幻灯片索引 {slide_index} 超出范围")
+
+    slide = prs.slides[slide_index]
+
+    if shape_index >= len(slide.shapes):
+        raise ValueError(f"形状索引 {shape_index} 超出范围")
+
+    shape = slide.shapes[shape_index]
+
+    if not hasattr(shape, "text_frame"):
+        raise ValueError(f"形状 {shape_index} 不包含文本框")
+
+    _apply_text_format(shape.text_frame, **text_format)
+
+
+def _text_edit(index: int, edit: dict[str, Any]) -> tuple[int, int, dict[str, Any]]:
+    """校验批量格式化的单项参数, 返回 (幻灯片索引, 形状索引, 格式参数)."""
+    params = dict(edit)
+    try:
+        slide_index = params.pop("slide_index")
+        shape_index = params.pop("shape_index")
+    except KeyError as e:
+        raise ValueError(f"第 {index + 1} 项缺少参数: {e.args[0]}") from e
+
+    unknown = set(params) - set(_TEXT_FORMAT_DEFAULTS)
+    if unknown:
+        raise ValueError(f"第 {index + 1} 项包含不支持的参数: {', '.join(sorted(unknown))}")
+    return slide_index, shape_index, {**_TEXT_FORMAT_DEFAULTS, **params}
 
 
 class PowerPointStyleOperations:
@@ -38,61 +176,85 @@ class PowerPointStyleOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
-
-            if slide_index >= len(prs.slides):
-                raise ValueError(f"幻灯片索引 {slide_index} 超出范围")
-
-            slide = prs.slides[slide_index]
-
-            if shape_index >= len(slide.shapes):
-                raise ValueError(f"形状索引 {shape_index} 超出范围")
-
-            shape = slide.shapes[shape_index]
-
-            if not hasattr(shape, "text_frame"):
-                raise ValueError(f"形状 {shape_index} 不包含文本框")
+            text_format = {
+                "font_name": font_name,
+                "font_size": font_size,
+                "bold": bold,
+                "italic": italic,
+                "underline": underline,
+                "color": color,
+                "alignment": alignment,
+            }
 
-            text_frame = shape.text_frame
+            # 只改写该幻灯片的 XML 部件, 不解析、也不重新序列化其余幻灯片、
+            # 版式、母版和图片 (缓存中的演示文稿因文件状态戳变化自动失效);
+            # 编辑会话中则修改缓存对象, 与其他修改一起在提交时写盘
+            mutate = partial(_format_text_xml, shape_index=shape_index, **text_format)
+            if presentation_cache.in_session(file_path) or not patch_slide_xml(
+                file_path, slide_index, mutate
+            ):
+                prs = presentation_cache.load(file_path)
+                _format_shape_text(prs, slide_index, shape_index, text_format)
+                presentation_cache.save(prs, file_path)
 
-            # 对齐方式映射
-            alignment_map = {
-                'left': PP_ALIGN.LEFT,
-                'center': PP_ALIGN.CENTER,
-                'right': PP_ALIGN.RIGHT,
-                'justify': PP_ALIGN.JUSTIFY,
+            logger.info(f"文本格式化成功: {file_path}")
+            return {
+                "success": True,
+                "message": "文本格式化成功",
+                "filename": str(file_path),
             }
 
-            # 应用格式到所有段落和运行
-            for paragraph in text_frame.paragraphs:
-                if alignment and alignment in alignment_map:
-                    paragraph.alignment = alignment_map[alignment]
-
-                for run in paragraph.runs:
-                    if font_name:
-                        run.font.name = font_name
-                    if font_size:
-                        run.font.size = Pt(font_size)
+        except Exception as e:
+            logger.error(f"格式化文本失败: {e}")
+            return {"success": False, "message": f"格式化失败: {str(e)}"}
 
-                    run.font.bold = bold
-                    run.font.italic = italic
-                    run.font.underline = underline
+    def batch_format_text(self, filename: str, edits: List[dict[str, Any]]) -> dict[str, Any]:
+        """批量格式化多个形状的文本, 演示文稿只读写一次.
 
-                    if color:
-                        r, g, b = ColorUtils.hex_to_rgb(color)
-                        run.font.color.rgb = RGBColor(r, g, b)
+        任一项失败时不保存, 文件保持不变。
 
-            prs.save(str(file_path))
+        Args:
+            filename: 文件名
+            edits: 格式化列表. 每项须含 'slide_index' 和 'shape_index', 其余键与
+                format_text 的格式参数相同 (未给出的取相同默认值)
+        """
+        try:
+            file_path = config.paths.output_dir / filename
+            self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            logger.info(f"文本格式化成功: {file_path}")
+            if not edits:
+                raise ValueError("格式化列表不能为空")
+
+            # 先校验全部参数, 避免执行到一半才发现无效
+            targets = [_text_edit(index, edit) for index, edit in enumerate(edits)]
+
+            # 与 format_text 相同: 只改写涉及的幻灯片部件, 每张幻灯片只解析一次;
+            # 无法局部修改时 (或编辑会话中) 改用缓存的演示文稿, 以得到准确的错误信息
+            slide_edits = [
+                (slide_index, partial(_format_text_xml, shape_index=shape_index, **text_format))
+                for slide_index, shape_index, text_format in targets
+            ]
+            if presentation_cache.in_session(file_path) or not patch_slide_edits(
+                file_path, slide_edits
+            ):
+                prs = presentation_cache.load(file_path)
+                for index, (slide_index, shape_index, text_format) in enumerate(targets):
+                    try:
+                        _format_shape_text(prs, slide_index, shape_index, text_format)
+                    except Exception as e:
+                        raise ValueError(f"第 {index + 1} 项格式化失败: {e}") from e
+                presentation_cache.save(prs, file_path)
+
+            logger.info(f"批量文本格式化成功: {file_path}, 共 {len(targets)} 项")
             return {
                 "success": True,
-                "message": "文本格式化成功",
+                "message": f"批量文本格式化成功, 共 {len(targets)} 项",
                 "filename": str(file_path),
+                "formatted": len(targets),
             }
 
         except Exception as e:
-            logger.error(f"格式化文本失败: {e}")
+            logger.error(f"批量格式化文本失败: {e}")
             return {"success": False, "message": f"格式化失败: {str(e)}"}
 
     def apply_theme(
@@ -106,7 +268,7 @@ class PowerPointStyleOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
+            prs = presentation_cache.load(file_path)
 
             # 定义主题颜色方案 (RGB值)
             theme_colors = {
@@ -188,7 +350,7 @@ class PowerPointStyleOperations:
                         except:
                             pass
 
-            prs.save(str(file_path))
+            presentation_cache.save(prs, file_path)
 
             logger.info(f"主题应用成功: {file_path}")
             return {
@@ -216,29 +378,14 @@ class PowerPointStyleOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
+            prs = presentation_cache.load(file_path)
 
             if not apply_to_all and slide_index >= len(prs.slides):
                 raise ValueError(f"幻灯片索引 {slide_index} 超出范围")
 
-            from pptx.oxml import parse_xml
-
-            # 定义过渡类型映射
-            transition_xml_map = {
-                'fade': '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med"><p:fade thruBlk="0"/></p:transition>',
-                'push': '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med"><p:push dir="l"/></p:transition>',
-                'wipe': '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med"><p:wipe dir="l"/></p:transition>',
-                'split': '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med"><p:split orient="horz" dir="in"/></p:transition>',
-                'reveal': '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med"><p:reveal dir="l"/></p:transition>',
-                'random': '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med"><p:random/></p:transition>',
-                'none': '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med"/>',
-            }
-
-            if transition_type not in transition_xml_map:
+            if transition_type not in _TRANSITION_XML:
                 raise ValueError(f"不支持的过渡类型: {transition_type}")
 
-            transition_xml = transition_xml_map[transition_type]
-
             # 应用过渡效果
             if apply_to_all:
                 slides_to_update = prs.slides
@@ -248,20 +395,9 @@ class PowerPointStyleOperations:
                 slides_count = 1
 
             for slide in slides_to_update:
-                sld = slide._element
-
-                # 移除现有过渡效果
-                existing_transition = sld.find('{http://schemas.openxmlformats.org/presentationml/2006/main}transition')
-                if existing_transition is not None:
-                    sld.remove(existing_transition)
-
-                # 添加新的过渡效果
-                if transition_type != 'none':
-                    transition_element = parse_xml(transition_xml)
-                    transition_element.set('advTm', str(int(duration * 1000)))
-                    sld.insert(0, transition_element)
+                set_transition_xml(slide._element, transition_type, duration)
 
-            prs.save(str(file_path))
+            presentation_cache.save(prs, file_path)
 
             logger.info(f"过渡效果设置成功: {file_path}")
             return {
@@ -298,7 +434,7 @@ class PowerPointStyleOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
+            prs = presentation_cache.load(file_path)
 
             if slide_index >= len(prs.slides):
                 raise ValueError(f"幻灯片索引 {slide_index} 超出范围")
@@ -330,7 +466,7 @@ class PowerPointStyleOperations:
                 elif bullet_type == "none":
                     paragraph.font.name = None
 
-            prs.save(str(file_path))
+            presentation_cache.save(prs, file_path)
 
             logger.info(f"项目符号添加成功: {file_path}")
             return {
@@ -370,7 +506,7 @@ class PowerPointStyleOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
+            prs = presentation_cache.load(file_path)
 
             if slide_index >= len(prs.slides):
                 raise ValueError(f"幻灯片索引 {slide_index} 超出范围")
@@ -399,7 +535,7 @@ class PowerPointStyleOperations:
 
                 paragraph.level = min(indent_level, 8)
 
-            prs.save(str(file_path))
+            presentation_cache.save(prs, file_path)
 
             logger.info(f"段落格式设置成功: {file_path}")
             return {
@@ -439,7 +575,7 @@ class PowerPointStyleOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            prs = Presentation(str(file_path))
+            prs = presentation_cache.load(file_path)
 
             if not apply_to_all and slide_index >= len(prs.slides):
                 raise ValueError(f"幻灯片索引 {slide_index} 超出范围")
@@ -480,7 +616,7 @@ class PowerPointStyleOperations:
                     fill.solid()
                     # 注意：完整的背景图片功能需要更复杂的实现
 
-            prs.save(str(file_path))
+            presentation_cache.save(prs, file_path)
 
             logger.info(f"背景设置成功: {file_path}")
             return {
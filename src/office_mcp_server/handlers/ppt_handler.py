@@ -1,9 +1,12 @@
 """PowerPoint 处理器主模块 - 门面模式."""
 
+import functools
+from collections.abc import Callable
 from typing import Any, Optional, List
 
 from loguru import logger
 
+from office_mcp_server.config import config
 from office_mcp_server.handlers.ppt.ppt_basic import PowerPointBasicOperations
 from office_mcp_server.handlers.ppt.ppt_content import PowerPointContentOperations
 from office_mcp_server.handlers.ppt.ppt_style import PowerPointStyleOperations
@@ -13,6 +16,24 @@ from office_mcp_server.handlers.ppt.ppt_content_advanced import PowerPointConten
 from office_mcp_server.handlers.ppt.ppt_notes_comments import PowerPointNotesCommentsOperations
 from office_mcp_server.handlers.ppt.ppt_advanced_features import PowerPointAdvancedFeatures
 from office_mcp_server.handlers.ppt.ppt_content_extraction import PowerPointContentExtraction
+from office_mcp_server.handlers.ppt.ppt_cache import presentation_cache
+
+
+def _session_operation(method: Callable[..., dict[str, Any]]) -> Callable[..., dict[str, Any]]:
+    """门面方法装饰器: 编辑会话中串行执行, 操作失败导致会话中止时在结果中说明."""
+
+    @functools.wraps(method)
+    def wrapper(self: Any, filename: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        file_path = config.paths.output_dir / filename
+        in_session = presentation_cache.in_session(file_path)
+        with presentation_cache.exclusive(file_path):
+            result = method(self, filename, *args, **kwargs)
+        if in_session and presentation_cache.aborted(file_path):
+            result["session_aborted"] = True
+            result["message"] = f"{result.get('message', '')} (编辑会话已中止, 未保存的修改已丢弃)"
+        return result
+
+    return wrapper
 
 
 class PowerPointHandler:
@@ -65,6 +86,14 @@ class PowerPointHandler:
         """获取演示文稿信息."""
         return self.basic_ops.get_presentation_info(filename)
 
+    def begin_edit(self, filename: str) -> dict[str, Any]:
+        """开启编辑会话."""
+        return self.basic_ops.begin_edit(filename)
+
+    def commit_edit(self, filename: str, save: bool = True) -> dict[str, Any]:
+        """提交编辑会话."""
+        return self.basic_ops.commit_edit(filename, save)
+
     # ========== 内容操作 ==========
     def add_text(
         self,
@@ -126,6 +155,10 @@ class PowerPointHandler:
             bold, italic, underline, color, alignment
         )
 
+    def batch_format_text(self, filename: str, edits: List[dict[str, Any]]) -> dict[str, Any]:
+        """批量格式化文本 (只读写一次)."""
+        return self.style_ops.batch_format_text(filename, edits)
+
     def apply_theme(
         self,
         filename: str,
@@ -229,6 +262,10 @@ class PowerPointHandler:
             filename, slide_index, table_index, row, col, fill_color, text_color, bold, font_size
         )
 
+    def bulk_table_ops(self, filename: str, ops: List[dict[str, Any]]) -> dict[str, Any]:
+        """批量执行表格操作 (只打开和保存一次)."""
+        return self.content_advanced_ops.bulk_table_ops(filename, ops)
+
     # ========== 形状操作 ==========
     def add_shape(
         self, filename: str, slide_index: int, shape_type: str,
@@ -325,3 +362,8 @@ class PowerPointHandler:
         """提取所有内容（文本、标题、备注、图片、超链接）."""
         return self.content_extraction_ops.extract_all_content(filename)
 
+
+# 所有工具都经由门面方法 (首个参数均为文件名) 调用, 在此统一接入编辑会话的串行化
+for _name, _method in list(vars(PowerPointHandler).items()):
+    if not _name.startswith("_") and callable(_method):
+        setattr(PowerPointHandler, _name, _session_operation(_method))
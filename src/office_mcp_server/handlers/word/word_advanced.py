@@ -10,6 +10,7 @@ from docx.shared import Inches, Pt, RGBColor
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.word.word_cache import document_cache
 from office_mcp_server.utils.file_manager import FileManager
 
 
@@ -34,7 +35,7 @@ class WordAdvancedOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
             section = doc.sections[0]
             section.different_first_page_header_footer = different_first_page
 
@@ -96,7 +97,7 @@ class WordAdvancedOperations:
 
                 add_page_number(para)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"页眉页脚添加成功: {file_path}")
             return {
@@ -130,7 +131,7 @@ class WordAdvancedOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if not 1 <= max_level <= 9:
                 raise ValueError(f"最大标题级别必须在 1-9 之间")
@@ -211,7 +212,7 @@ class WordAdvancedOperations:
             # 添加空行分隔
             insert_para.insert_paragraph_before()
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"目录生成成功: {file_path}, 插入位置: {insert_position}")
             return {
@@ -238,7 +239,7 @@ class WordAdvancedOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             # 确定输出文件名
             if not output_filename:
@@ -290,6 +291,7 @@ class WordAdvancedOperations:
                 raise ValueError(f"不支持的导出格式: {export_format}")
 
             logger.info(f"文档导出成功: {output_path}")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "message": message,
@@ -382,7 +384,7 @@ class WordAdvancedOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if paragraph_index < 0 or paragraph_index >= len(doc.paragraphs):
                 raise ValueError(f"段落索引 {paragraph_index} 超出范围 (0-{len(doc.paragraphs)-1})")
@@ -419,7 +421,7 @@ class WordAdvancedOperations:
             # 注意：完整的批注功能需要在word/comments.xml中添加内容
             # 这里我们标记该段落已添加批注引用
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"批注添加成功: {filename}")
             return {
@@ -544,7 +546,7 @@ class WordAdvancedOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
             section = doc.sections[0]
 
             # 启用奇偶页不同
@@ -585,7 +587,7 @@ class WordAdvancedOperations:
             if even_footer:
                 logger.warning("python-docx 对偶数页页脚的支持有限，建议使用 Microsoft Word 手动设置")
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"奇偶页页眉页脚设置成功: {file_path}")
             return {
@@ -621,7 +623,7 @@ class WordAdvancedOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if paragraph_index >= len(doc.paragraphs):
                 raise ValueError(f"段落索引 {paragraph_index} 超出范围")
@@ -651,7 +653,7 @@ class WordAdvancedOperations:
             run._r.append(instrText)
             run._r.append(fldChar2)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"插入日期时间域成功: {file_path}")
             return {
@@ -2,12 +2,12 @@
 
 from typing import Any, Optional
 
-from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import Inches, Pt, RGBColor
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.word.word_cache import document_cache
 from office_mcp_server.utils.file_manager import FileManager
 from office_mcp_server.utils.format_helper import ColorUtils
 
@@ -224,7 +224,7 @@ class WordAutoFormatOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
             preset = self.PRESETS[format_preset]
 
             stats = {
@@ -256,7 +256,7 @@ class WordAutoFormatOperations:
                     self._apply_format(para, preset["body"])
                     stats["body"] += 1
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"自动格式化成功: {file_path}, 预设: {format_preset}")
             return {
@@ -9,6 +9,7 @@ from docx.oxml.ns import qn
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.word.word_cache import document_cache
 from office_mcp_server.utils.file_manager import FileManager
 
 
@@ -48,7 +49,7 @@ class WordBasicOperations:
                 paragraph = doc.add_paragraph(content)
                 paragraph.paragraph_format.line_spacing = config.word.default_line_spacing
 
-            doc.save(str(output_path))
+            document_cache.save(doc, output_path)
 
             logger.info(f"Word 文档创建成功: {output_path}")
             return {
@@ -70,7 +71,7 @@ class WordBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             # 插入文本
             if position == "start":
@@ -80,7 +81,7 @@ class WordBasicOperations:
 
             paragraph.paragraph_format.line_spacing = config.word.default_line_spacing
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"文本插入成功: {file_path}")
             return {
@@ -104,9 +105,9 @@ class WordBasicOperations:
             if not 1 <= level <= 9:
                 raise ValueError(f"标题级别必须在 1-9 之间")
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
             doc.add_heading(text, level=level)
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"标题添加成功: {file_path}")
             return {
@@ -126,9 +127,9 @@ class WordBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
             doc.add_page_break()
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"分页符添加成功: {file_path}")
             return {
@@ -153,7 +154,7 @@ class WordBasicOperations:
             if not img_path.exists():
                 raise FileNotFoundError(f"图片文件不存在: {image_path}")
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             from docx.shared import Inches
             if width_inches:
@@ -161,7 +162,7 @@ class WordBasicOperations:
             else:
                 doc.add_picture(str(img_path))
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"图片插入成功: {file_path}")
             return {
@@ -181,7 +182,7 @@ class WordBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             paragraph_count = len(doc.paragraphs)
             table_count = len(doc.tables)
@@ -189,6 +190,7 @@ class WordBasicOperations:
             word_count = len(total_text)
 
             logger.info(f"获取文档信息成功: {file_path}")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "filename": str(file_path),
@@ -211,7 +213,7 @@ class WordBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
             core_props = doc.core_properties
 
             properties = {
@@ -267,7 +269,21 @@ class WordBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
+
+            # 没有给出任何属性时文档未改变, 不必重新保存。此时也不能访问
+            # core_properties (可能在内存中新建默认的核心属性部件), 才能归还缓存
+            if all(
+                value is None
+                for value in (author, title, subject, keywords, comments, category)
+            ):
+                document_cache.release(doc, file_path)
+                return {
+                    "success": True,
+                    "message": "设置文档属性成功",
+                    "filename": str(file_path)
+                }
+
             core_props = doc.core_properties
 
             if author is not None:
@@ -283,7 +299,7 @@ class WordBasicOperations:
             if category is not None:
                 core_props.category = category
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"设置文档属性成功: {file_path}")
             return {
@@ -327,7 +343,7 @@ class WordBasicOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             # 收集文档统计信息
             paragraph_count = len(doc.paragraphs)
@@ -391,6 +407,7 @@ class WordBasicOperations:
             }
 
             logger.info(f"页数估算完成: {file_path}, 估算页数: {estimated_pages}")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "message": f"页数估算完成（估算值，误差±2页）",
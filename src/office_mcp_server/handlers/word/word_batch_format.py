@@ -2,12 +2,12 @@
 
 from typing import Any, Optional
 
-from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_UNDERLINE, WD_COLOR_INDEX
 from docx.shared import Inches, Pt, RGBColor
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.word.word_cache import document_cache
 from office_mcp_server.utils.file_manager import FileManager
 from office_mcp_server.utils.format_helper import ColorUtils
 
@@ -49,7 +49,7 @@ class WordBatchFormatOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
             success_count = 0
             failed_indices = []
 
@@ -88,7 +88,7 @@ class WordBatchFormatOperations:
                     logger.warning(f"格式化段落 {idx} 失败: {e}")
                     failed_indices.append(idx)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"批量文本格式化成功: {file_path}, 成功 {success_count}/{len(paragraph_indices)} 个段落")
             return {
@@ -136,7 +136,7 @@ class WordBatchFormatOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
             success_count = 0
             failed_indices = []
 
@@ -177,7 +177,17 @@ class WordBatchFormatOperations:
                     logger.warning(f"格式化段落 {idx} 失败: {e}")
                     failed_indices.append(idx)
 
-            doc.save(str(file_path))
+            # 没有给出任何格式参数时文档未改变, 不必重新保存
+            if alignment is None and all(
+                value is None
+                for value in (
+                    line_spacing, space_before, space_after,
+                    left_indent, right_indent, first_line_indent,
+                )
+            ):
+                document_cache.release(doc, file_path)
+            else:
+                document_cache.save(doc, file_path)
 
             logger.info(f"批量段落格式化成功: {file_path}, 成功 {success_count}/{len(paragraph_indices)} 个段落")
             return {
@@ -233,7 +243,7 @@ class WordBatchFormatOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
             success_count = 0
             failed_indices = []
 
@@ -285,7 +295,7 @@ class WordBatchFormatOperations:
                     logger.warning(f"格式化段落 {idx} 失败: {e}")
                     failed_indices.append(idx)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"批量组合格式化成功: {file_path}, 成功 {success_count}/{len(paragraph_indices)} 个段落")
             return {
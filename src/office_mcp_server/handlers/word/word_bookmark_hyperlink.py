@@ -2,12 +2,12 @@
 
 from typing import Any, Optional, List
 
-from docx import Document
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.word.word_cache import document_cache
 from office_mcp_server.utils.file_manager import FileManager
 
 
@@ -35,7 +35,7 @@ class WordBookmarkHyperlinkOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if paragraph_index >= len(doc.paragraphs):
                 raise ValueError(f"段落索引 {paragraph_index} 超出范围")
@@ -55,7 +55,7 @@ class WordBookmarkHyperlinkOperations:
             paragraph._element.insert(0, bookmark_start)
             paragraph._element.append(bookmark_end)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"书签添加成功: {file_path}")
             return {
@@ -82,7 +82,7 @@ class WordBookmarkHyperlinkOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             # 查找所有书签
             bookmarks = []
@@ -93,6 +93,7 @@ class WordBookmarkHyperlinkOperations:
                         bookmarks.append(bookmark_name)
 
             logger.info(f"书签列表获取成功: {file_path}")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "message": f"找到 {len(bookmarks)} 个书签",
@@ -126,7 +127,7 @@ class WordBookmarkHyperlinkOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if paragraph_index >= len(doc.paragraphs):
                 raise ValueError(f"段落索引 {paragraph_index} 超出范围")
@@ -145,7 +146,7 @@ class WordBookmarkHyperlinkOperations:
             # 注意: python-docx 不直接支持超链接,需要通过 XML 操作
             hyperlink = self._add_hyperlink_to_paragraph(paragraph, text, full_url)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"超链接添加成功: {file_path}")
             return {
@@ -210,7 +211,7 @@ class WordBookmarkHyperlinkOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             hyperlinks = []
 
@@ -236,6 +237,7 @@ class WordBookmarkHyperlinkOperations:
                                 pass
 
             logger.info(f"超链接提取成功: {file_path}")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "message": f"找到 {len(hyperlinks)} 个超链接",
@@ -266,7 +268,7 @@ class WordBookmarkHyperlinkOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             deleted_count = 0
 
@@ -290,7 +292,7 @@ class WordBookmarkHyperlinkOperations:
                     "message": f"未找到书签 '{bookmark_name}'"
                 }
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"删除书签成功: {file_path}, 书签: {bookmark_name}")
             return {
@@ -324,7 +326,7 @@ class WordBookmarkHyperlinkOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             updated_count = 0
 
@@ -347,7 +349,7 @@ class WordBookmarkHyperlinkOperations:
                             except:
                                 pass
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"批量更新超链接成功: {file_path}, 更新 {updated_count} 个")
             return {
@@ -0,0 +1,12 @@
+"""Word 文档缓存模块."""
+
+from docx import Document
+from docx.document import Document as DocumentType
+
+from office_mcp_server.config import config
+from office_mcp_server.utils.document_cache import DocumentCache
+
+# 所有 Word 操作共享的已解析文档缓存
+document_cache: DocumentCache[DocumentType] = DocumentCache(
+    Document, maxsize=config.word.document_cache_size
+)
@@ -2,10 +2,10 @@
 
 from typing import Any, Optional
 
-from docx import Document
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.word.word_cache import document_cache
 from office_mcp_server.utils.file_manager import FileManager
 
 
@@ -31,7 +31,7 @@ class WordCleanupOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
             
             total_before = len(doc.paragraphs)
             deleted_count = 0
@@ -48,7 +48,7 @@ class WordCleanupOperations:
                     deleted_count += 1
                     deleted_indices.append(i)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             total_after = len(doc.paragraphs)
 
@@ -85,7 +85,7 @@ class WordCleanupOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
             
             total_before = len(doc.paragraphs)
             deleted_count = 0
@@ -110,7 +110,7 @@ class WordCleanupOperations:
                     failed_indices.append(idx)
                     logger.warning(f"删除段落 {idx} 失败: {e}")
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             total_after = len(doc.paragraphs)
 
@@ -145,7 +145,7 @@ class WordCleanupOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             analysis = {
                 "empty_paragraphs": 0,
@@ -247,6 +247,7 @@ class WordCleanupOperations:
                 )
 
             logger.info(f"页面浪费分析完成: {file_path}")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "message": "页面浪费分析完成",
@@ -281,7 +282,7 @@ class WordCleanupOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             # 收集文档特征
             all_text = "\n".join([p.text for p in doc.paragraphs]).lower()
@@ -411,6 +412,7 @@ class WordCleanupOperations:
                 )
 
             logger.info(f"压缩策略建议完成: {file_path}, 文档类型: {detected_type}")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "message": "压缩策略建议生成完成",
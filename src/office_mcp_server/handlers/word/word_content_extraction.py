@@ -2,10 +2,10 @@
 
 from typing import Any, Optional, List
 
-from docx import Document
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.word.word_cache import document_cache
 from office_mcp_server.utils.file_manager import FileManager
 
 
@@ -31,7 +31,7 @@ class WordContentExtractionOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             # 提取段落文本
             paragraphs = []
@@ -54,6 +54,7 @@ class WordContentExtractionOperations:
                 all_text += "\n\n" + "\n".join(table_texts)
 
             logger.info(f"文本提取成功: {file_path}")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "message": "文本提取成功",
@@ -83,7 +84,7 @@ class WordContentExtractionOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             headings = []
             for para in doc.paragraphs:
@@ -100,6 +101,7 @@ class WordContentExtractionOperations:
                         pass
 
             logger.info(f"标题提取成功: {file_path}")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "message": f"提取到 {len(headings)} 个标题",
@@ -125,7 +127,7 @@ class WordContentExtractionOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             tables_data = []
             for table_idx, table in enumerate(doc.tables):
@@ -144,6 +146,7 @@ class WordContentExtractionOperations:
                 })
 
             logger.info(f"表格数据提取成功: {file_path}")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "message": f"提取到 {len(tables_data)} 个表格",
@@ -169,7 +172,7 @@ class WordContentExtractionOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             images = []
             for rel in doc.part.rels.values():
@@ -181,6 +184,7 @@ class WordContentExtractionOperations:
                     })
 
             logger.info(f"图片信息提取成功: {file_path}")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "message": f"找到 {len(images)} 张图片",
@@ -206,7 +210,7 @@ class WordContentExtractionOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             # 统计段落、表格、图片等
             paragraph_count = len(doc.paragraphs)
@@ -227,6 +231,7 @@ class WordContentExtractionOperations:
             image_count = sum(1 for rel in doc.part.rels.values() if "image" in rel.target_ref)
 
             logger.info(f"文档统计信息获取成功: {file_path}")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "message": "文档统计信息获取成功",
@@ -3,10 +3,10 @@
 from typing import Any, Optional, List
 import re
 
-from docx import Document
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.word.word_cache import document_cache
 from office_mcp_server.utils.file_manager import FileManager
 
 
@@ -36,7 +36,7 @@ class WordEditOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
             matches = []
 
             # 准备搜索模式
@@ -73,6 +73,7 @@ class WordEditOperations:
                                 })
 
             logger.info(f"文本查找完成: {file_path}, 找到 {len(matches)} 处匹配")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "message": f"找到 {len(matches)} 处匹配",
@@ -109,7 +110,7 @@ class WordEditOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
             replacement_count = 0
 
             # 准备搜索模式
@@ -178,7 +179,7 @@ class WordEditOperations:
 
                                 replacement_count += 1
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"文本替换完成: {file_path}, 替换 {replacement_count} 处")
             return {
@@ -233,7 +234,7 @@ class WordEditOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
             matches = []
 
             flags = 0 if case_sensitive else re.IGNORECASE
@@ -276,6 +277,7 @@ class WordEditOperations:
                                 pass
 
             logger.info(f"正则表达式查找完成: {file_path}, 找到 {len(matches)} 处匹配")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "message": f"找到 {len(matches)} 处匹配",
@@ -313,7 +315,7 @@ class WordEditOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
             replacement_count = 0
 
             flags = 0 if case_sensitive else re.IGNORECASE
@@ -393,7 +395,7 @@ class WordEditOperations:
                             except re.error:
                                 pass
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"正则表达式替换完成: {file_path}, 替换 {replacement_count} 处")
             return {
@@ -487,7 +489,7 @@ class WordEditOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if paragraph_index >= len(doc.paragraphs):
                 return {
@@ -517,7 +519,7 @@ class WordEditOperations:
                 else:
                     paragraph.add_run(new_text)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"插入特殊字符完成: {file_path}, 字符: {char}")
             return {
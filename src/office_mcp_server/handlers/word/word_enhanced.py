@@ -9,7 +9,32 @@ from docx.enum.text import WD_BREAK
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.word.word_cache import document_cache
 from office_mcp_server.utils.file_manager import FileManager
+from office_mcp_server.utils.parallel import map_in_processes, total_size
+
+
+def _replace_in_file(job: tuple[str, str, str]) -> dict[str, Any]:
+    """替换单个文档中的文本并返回结果摘要 (在子进程中执行, 因此定义在模块级)."""
+    file_path, search_text, replace_text = job
+    try:
+        doc = document_cache.load(file_path)
+        replacement_count = 0
+
+        # 在段落中替换
+        for paragraph in doc.paragraphs:
+            if search_text in paragraph.text:
+                # 简单替换
+                for run in paragraph.runs:
+                    if search_text in run.text:
+                        run.text = run.text.replace(search_text, replace_text)
+                        replacement_count += 1
+
+        document_cache.save(doc, file_path)
+        return {"success": True, "replacement_count": replacement_count}
+
+    except Exception as e:
+        return {"success": False, "error": str(e)}
 
 
 class WordEnhancedOperations:
@@ -41,7 +66,7 @@ class WordEnhancedOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             # 查找所有图片
             images = []
@@ -70,7 +95,7 @@ class WordEnhancedOperations:
             # 注意: python-docx 对图片编辑的支持有限
             # 完整功能需要更底层的 XML 操作或使用 python-docx-template
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"图片大小调整成功: {file_path}")
             return {
@@ -99,43 +124,35 @@ class WordEnhancedOperations:
             replace_text: 替换为的文本
         """
         try:
-            results = []
-            success_count = 0
-            fail_count = 0
-
+            results: list[Optional[dict[str, Any]]] = []
+            jobs = []
             for filename in filenames:
                 try:
                     file_path = config.paths.output_dir / filename
                     self.file_manager.validate_file_path(file_path, must_exist=True)
-
-                    doc = Document(str(file_path))
-                    replacement_count = 0
-
-                    # 在段落中替换
-                    for paragraph in doc.paragraphs:
-                        if search_text in paragraph.text:
-                            # 简单替换
-                            for run in paragraph.runs:
-                                if search_text in run.text:
-                                    run.text = run.text.replace(search_text, replace_text)
-                                    replacement_count += 1
-
-                    doc.save(str(file_path))
-
-                    results.append({
-                        "filename": filename,
-                        "success": True,
-                        "replacement_count": replacement_count
-                    })
-                    success_count += 1
-
+                    # 子进程直接读写文件, 先写入本进程缓存中未写盘的修改
+                    document_cache.flush(file_path)
+                    jobs.append((str(file_path), search_text, replace_text))
+                    results.append(None)
                 except Exception as e:
-                    results.append({
-                        "filename": filename,
-                        "success": False,
-                        "error": str(e)
-                    })
-                    fail_count += 1
+                    results.append({"filename": filename, "success": False, "error": str(e)})
+
+            # 各文件相互独立, 文件多且总量大时分发到多个进程并行处理. 同一文件出现
+            # 多次时必须依次替换 (后一次基于前一次的结果), 此时串行执行
+            paths = [file_path for file_path, _, _ in jobs]
+            unique = len({str(Path(path).resolve()) for path in paths}) == len(paths)
+            replaced = iter(map_in_processes(
+                _replace_in_file,
+                jobs,
+                config.word.batch_workers if unique else 1,
+                total_size(paths),
+            ))
+            results = [
+                result if result is not None else {"filename": filename, **next(replaced)}
+                for filename, result in zip(filenames, results, strict=True)
+            ]
+            success_count = sum(1 for result in results if result["success"])
+            fail_count = len(results) - success_count
 
             logger.info(f"批量替换完成: 成功 {success_count}, 失败 {fail_count}")
             return {
@@ -175,7 +192,7 @@ class WordEnhancedOperations:
                     file_path = config.paths.output_dir / filename
                     self.file_manager.validate_file_path(file_path, must_exist=True)
 
-                    doc = Document(str(file_path))
+                    doc = document_cache.load(file_path)
                     affected_count = 0
 
                     for para in doc.paragraphs:
@@ -186,7 +203,7 @@ class WordEnhancedOperations:
                             para.style = style_name
                             affected_count += 1
 
-                    doc.save(str(file_path))
+                    document_cache.save(doc, file_path)
 
                     results.append({
                         "filename": filename,
@@ -238,7 +255,7 @@ class WordEnhancedOperations:
                 file_path = config.paths.output_dir / filename
                 self.file_manager.validate_file_path(file_path, must_exist=True)
 
-                source_doc = Document(str(file_path))
+                source_doc = document_cache.load(file_path)
 
                 # 添加分页符(除了第一个文档)
                 if idx > 0 and add_page_breaks:
@@ -256,6 +273,8 @@ class WordEnhancedOperations:
                         for j, cell in enumerate(row.cells):
                             new_table.rows[i].cells[j].text = cell.text
 
+                document_cache.release(source_doc, file_path)
+
             # 保存合并后的文档
             output_path = config.paths.output_dir / output_filename
             merged_doc.save(str(output_path))
@@ -289,7 +308,7 @@ class WordEnhancedOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             # 查找指定级别的标题
             sections = []
@@ -322,6 +341,7 @@ class WordEnhancedOperations:
                 output_files.append(output_filename)
 
             logger.info(f"文档拆分成功: {file_path}")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "message": f"文档已拆分为 {len(sections)} 个部分",
@@ -492,7 +512,7 @@ class WordEnhancedOperations:
                     file_path = config.paths.output_dir / filename
                     self.file_manager.validate_file_path(file_path, must_exist=True)
 
-                    doc = Document(str(file_path))
+                    doc = document_cache.load(file_path)
 
                     if position == "start":
                         # 在开头插入
@@ -507,7 +527,7 @@ class WordEnhancedOperations:
                         else:
                             doc.add_paragraph(content)
 
-                    doc.save(str(file_path))
+                    document_cache.save(doc, file_path)
 
                     success_count += 1
                     results.append({
@@ -2,13 +2,13 @@
 
 from typing import Any, Optional
 
-from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_UNDERLINE, WD_COLOR_INDEX
 from docx.oxml.ns import qn
 from docx.shared import Inches, Pt, RGBColor
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.word.word_cache import document_cache
 from office_mcp_server.utils.file_manager import FileManager
 from office_mcp_server.utils.format_helper import ColorUtils
 
@@ -43,7 +43,7 @@ class WordFormatOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if paragraph_index >= len(doc.paragraphs):
                 raise ValueError(f"段落索引 {paragraph_index} 超出范围")
@@ -111,7 +111,7 @@ class WordFormatOperations:
 
                 run.font.shadow = shadow
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"文本格式化成功: {file_path}")
             return {
@@ -141,7 +141,7 @@ class WordFormatOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if paragraph_index >= len(doc.paragraphs):
                 raise ValueError(f"段落索引 {paragraph_index} 超出范围")
@@ -178,7 +178,17 @@ class WordFormatOperations:
             if first_line_indent is not None:
                 fmt.first_line_indent = Inches(first_line_indent)
 
-            doc.save(str(file_path))
+            # 没有给出任何格式参数时文档未改变, 不必重新保存
+            if alignment is None and all(
+                value is None
+                for value in (
+                    line_spacing, space_before, space_after,
+                    left_indent, right_indent, first_line_indent,
+                )
+            ):
+                document_cache.release(doc, file_path)
+            else:
+                document_cache.save(doc, file_path)
 
             logger.info(f"段落格式化成功: {file_path}")
             return {
@@ -199,7 +209,7 @@ class WordFormatOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if paragraph_index >= len(doc.paragraphs):
                 raise ValueError(f"段落索引 {paragraph_index} 超出范围")
@@ -207,7 +217,7 @@ class WordFormatOperations:
             paragraph = doc.paragraphs[paragraph_index]
             paragraph.style = style_name
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"样式应用成功: {file_path}")
             return {
@@ -1,11 +1,11 @@
 """Word文档格式检查器."""
 
 from typing import Any, Optional
-from docx import Document
 from docx.shared import RGBColor
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.word.word_cache import document_cache
 from office_mcp_server.utils.file_manager import FileManager
 
 
@@ -34,7 +34,7 @@ class WordFormatInspector:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if paragraph_index < 0 or paragraph_index >= len(doc.paragraphs):
                 raise ValueError(f"段落索引 {paragraph_index} 超出范围 (0-{len(doc.paragraphs)-1})")
@@ -67,6 +67,7 @@ class WordFormatInspector:
             }
 
             logger.info(f"获取段落格式成功: {filename}, 段落 {paragraph_index}")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "paragraph_index": paragraph_index,
@@ -98,7 +99,7 @@ class WordFormatInspector:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if check_items is None:
                 check_items = ["font", "alignment", "spacing"]
@@ -136,6 +137,7 @@ class WordFormatInspector:
                 })
 
             logger.info(f"文档格式检查完成: {filename}")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "total_paragraphs": len(doc.paragraphs),
@@ -169,7 +171,7 @@ class WordFormatInspector:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if table_index < 0 or table_index >= len(doc.tables):
                 raise ValueError(f"表格索引 {table_index} 超出范围 (0-{len(doc.tables)-1})")
@@ -204,6 +206,7 @@ class WordFormatInspector:
                     cell_formats.append(cell_info)
 
             logger.info(f"获取表格格式成功: {filename}, 表格 {table_index}")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "table_index": table_index,
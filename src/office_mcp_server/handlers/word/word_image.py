@@ -3,14 +3,13 @@
 from typing import Any, Optional
 from pathlib import Path
 import io
-import requests
 
-from docx import Document
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.word.word_cache import document_cache
 from office_mcp_server.utils.file_manager import FileManager
 
 
@@ -41,6 +40,9 @@ class WordImageOperations:
         Returns:
             dict: 操作结果
         """
+        # requests 仅在从 URL 插入图片时需要, 延迟导入以免拖慢服务启动
+        import requests
+
         try:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
@@ -53,7 +55,7 @@ class WordImageOperations:
             # 创建图片流
             image_stream = io.BytesIO(response.content)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             # 添加段落用于放置图片
             paragraph = doc.add_paragraph()
@@ -77,7 +79,7 @@ class WordImageOperations:
             else:
                 run.add_picture(image_stream)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"从 URL 插入图片成功: {file_path}")
             return {
@@ -125,7 +127,7 @@ class WordImageOperations:
             if not img_path.exists():
                 raise FileNotFoundError(f"图片文件不存在: {image_path}")
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             # 添加段落用于放置图片
             paragraph = doc.add_paragraph()
@@ -149,7 +151,7 @@ class WordImageOperations:
             else:
                 picture = run.add_picture(str(img_path))
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"插入图片成功: {file_path}")
             return {
@@ -2,12 +2,12 @@
 
 from typing import Any, Optional
 
-from docx import Document
 from docx.enum.section import WD_ORIENT, WD_SECTION
 from docx.shared import Inches, Pt
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.word.word_cache import document_cache
 from office_mcp_server.utils.file_manager import FileManager
 
 
@@ -46,7 +46,7 @@ class WordPageSetupOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             # 纸张尺寸映射 (宽度, 高度) 单位: 英寸
             paper_sizes = {
@@ -79,7 +79,7 @@ class WordPageSetupOperations:
                 section.top_margin = Inches(top_margin)
                 section.bottom_margin = Inches(bottom_margin)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"页面设置成功: {file_path}")
             return {
@@ -130,7 +130,7 @@ class WordPageSetupOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             # 设置所有节的页边距
             for section in doc.sections:
@@ -142,7 +142,7 @@ class WordPageSetupOperations:
                 section.header_distance = Inches(header)
                 section.footer_distance = Inches(footer)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"页边距设置成功: {file_path}")
             return {
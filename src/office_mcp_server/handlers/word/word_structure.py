@@ -2,11 +2,11 @@
 
 from typing import Any, Optional
 
-from docx import Document
 from docx.shared import Inches
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.word.word_cache import document_cache
 from office_mcp_server.utils.file_manager import FileManager
 
 
@@ -25,7 +25,7 @@ class WordStructureOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             table = doc.add_table(rows=rows, cols=cols)
             table.style = "Table Grid"
@@ -40,7 +40,7 @@ class WordStructureOperations:
                             break
                         table.rows[i].cells[j].text = str(cell_data)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"表格创建成功: {file_path}")
             return {
@@ -68,7 +68,7 @@ class WordStructureOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if table_index >= len(doc.tables):
                 raise ValueError(f"表格索引 {table_index} 超出范围")
@@ -103,7 +103,7 @@ class WordStructureOperations:
             else:
                 raise ValueError(f"不支持的操作类型: {operation}")
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"表格编辑成功: {file_path}")
             return {
@@ -131,7 +131,7 @@ class WordStructureOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if table_index >= len(doc.tables):
                 raise ValueError(f"表格索引 {table_index} 超出范围")
@@ -149,7 +149,7 @@ class WordStructureOperations:
             end_cell = table.cell(end_row, end_col)
             start_cell.merge(end_cell)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"单元格合并成功: {file_path}")
             return {
@@ -174,7 +174,7 @@ class WordStructureOperations:
             if not 0 <= level <= 8:
                 raise ValueError(f"列表级别必须在 0-8 之间")
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             # 添加列表段落
             if list_type == "bullet":
@@ -187,7 +187,7 @@ class WordStructureOperations:
             # 设置列表级别
             paragraph.paragraph_format.left_indent = Inches(0.5 * level)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"列表段落添加成功: {file_path}")
             return {
@@ -227,7 +227,7 @@ class WordStructureOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             for item in items:
                 text = item.get('text', '')
@@ -248,7 +248,7 @@ class WordStructureOperations:
                 # 设置列表级别
                 paragraph.paragraph_format.left_indent = Inches(0.5 * level)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"多级列表添加成功: {file_path}, 共 {len(items)} 项")
             return {
@@ -292,7 +292,7 @@ class WordStructureOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if table_index >= len(doc.tables):
                 raise ValueError(f"表格索引 {table_index} 超出范围")
@@ -348,7 +348,7 @@ class WordStructureOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if table_index >= len(doc.tables):
                 raise ValueError(f"表格索引 {table_index} 超出范围")
@@ -389,7 +389,7 @@ class WordStructureOperations:
                 for col_idx, cell_text in enumerate(row_data):
                     table.rows[actual_row].cells[col_idx].text = cell_text
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"表格排序成功: {file_path}")
             return {
@@ -432,7 +432,7 @@ class WordStructureOperations:
             if not data or not data[0]:
                 raise ValueError("数据不能为空")
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             rows = len(data)
             cols = len(data[0])
@@ -476,7 +476,7 @@ class WordStructureOperations:
                                 for run in paragraph.runs:
                                     run.bold = True
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"表格数据导入成功: {file_path}, {rows}x{cols}, 插入位置: {insert_position}")
             return {
@@ -2,12 +2,12 @@
 
 from typing import Any, Optional
 
-from docx import Document
 from docx.shared import Pt, RGBColor
 from docx.enum.style import WD_STYLE_TYPE
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.word.word_cache import document_cache
 from office_mcp_server.utils.file_manager import FileManager
 
 
@@ -36,7 +36,7 @@ class WordStyleManagement:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             style_type_map = {
                 'paragraph': WD_STYLE_TYPE.PARAGRAPH,
@@ -66,6 +66,7 @@ class WordStyleManagement:
                 styles_list.append(style_info)
 
             logger.info(f"列出样式成功: {file_path}, 共 {len(styles_list)} 个样式")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "message": f"找到 {len(styles_list)} 个样式",
@@ -108,7 +109,7 @@ class WordStyleManagement:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             # 检查样式是否已存在
             if style_name in [s.name for s in doc.styles]:
@@ -141,7 +142,7 @@ class WordStyleManagement:
             style.font.bold = bold
             style.font.italic = italic
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"创建段落样式成功: {file_path}, 样式: {style_name}")
             return {
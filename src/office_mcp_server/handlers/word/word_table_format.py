@@ -2,7 +2,6 @@
 
 from typing import Any, Optional
 
-from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
@@ -10,6 +9,7 @@ from docx.oxml import OxmlElement
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.word.word_cache import document_cache
 from office_mcp_server.utils.file_manager import FileManager
 from office_mcp_server.utils.format_helper import ColorUtils
 
@@ -50,7 +50,7 @@ class WordTableFormatOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if table_index >= len(doc.tables):
                 raise ValueError(f"表格索引 {table_index} 超出范围")
@@ -91,7 +91,7 @@ class WordTableFormatOperations:
                     if font_size:
                         run.font.size = Pt(font_size)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"单元格格式化成功: {file_path}")
             return {
@@ -121,7 +121,7 @@ class WordTableFormatOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if table_index >= len(doc.tables):
                 raise ValueError(f"表格索引 {table_index} 超出范围")
@@ -152,7 +152,7 @@ class WordTableFormatOperations:
 
             table.style = style_name
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"表格样式应用成功: {file_path}")
             return {
@@ -188,7 +188,7 @@ class WordTableFormatOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if table_index >= len(doc.tables):
                 raise ValueError(f"表格索引 {table_index} 超出范围")
@@ -214,7 +214,7 @@ class WordTableFormatOperations:
 
             tblPr.append(tblBorders)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"表格边框设置成功: {file_path}")
             return {
@@ -246,7 +246,7 @@ class WordTableFormatOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if table_index >= len(doc.tables):
                 raise ValueError(f"表格索引 {table_index} 超出范围")
@@ -260,7 +260,7 @@ class WordTableFormatOperations:
             for row in table.rows:
                 row.cells[col_index].width = Inches(width_inches)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"列宽设置成功: {file_path}")
             return {
@@ -292,7 +292,7 @@ class WordTableFormatOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if table_index >= len(doc.tables):
                 raise ValueError(f"表格索引 {table_index} 超出范围")
@@ -305,7 +305,7 @@ class WordTableFormatOperations:
             # 设置行高
             table.rows[row_index].height = Inches(height_inches)
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"行高设置成功: {file_path}")
             return {
@@ -333,7 +333,7 @@ class WordTableFormatOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
 
             if table_index >= len(doc.tables):
                 raise ValueError(f"表格索引 {table_index} 超出范围")
@@ -349,6 +349,7 @@ class WordTableFormatOperations:
                 data.append(row_data)
 
             logger.info(f"表格数据读取成功: {file_path}")
+            document_cache.release(doc, file_path)
             return {
                 "success": True,
                 "message": "表格数据读取成功",
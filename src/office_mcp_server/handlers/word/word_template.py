@@ -2,12 +2,12 @@
 
 from typing import Any
 
-from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import Inches, Pt, RGBColor
 from loguru import logger
 
 from office_mcp_server.config import config
+from office_mcp_server.handlers.word.word_cache import document_cache
 from office_mcp_server.utils.file_manager import FileManager
 from office_mcp_server.utils.format_helper import ColorUtils
 
@@ -303,7 +303,7 @@ class WordTemplateOperations:
             file_path = config.paths.output_dir / filename
             self.file_manager.validate_file_path(file_path, must_exist=True)
 
-            doc = Document(str(file_path))
+            doc = document_cache.load(file_path)
             template = self.EDUCATION_TEMPLATES[template_name]
 
             stats = {
@@ -335,7 +335,7 @@ class WordTemplateOperations:
                     self._apply_format(para, template["body"])
                     stats["body"] += 1
 
-            doc.save(str(file_path))
+            document_cache.save(doc, file_path)
 
             logger.info(f"应用教育模板成功: {file_path}, 模板: {template_name}")
             return {
@@ -6,21 +6,16 @@ from fastmcp import FastMCP
 from loguru import logger
 
 from office_mcp_server.handlers.excel_handler import ExcelHandler
+from office_mcp_server.tools.registry import register_tools
 
 
 def register_analysis_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
     """注册 Excel 数据分析工具."""
 
-    @mcp.tool()
-    def excel_descriptive_statistics(
-        filename: str,
-        sheet_name: str,
-        data_range: str,
-        output_cell: Optional[str] = None,
-    ) -> dict[str, Any]:
-        """Excel 描述性统计分析."""
-        logger.info(f"MCP工具调用: excel_descriptive_statistics(filename={filename})")
-        return excel_handler.descriptive_statistics(filename, sheet_name, data_range, output_cell)
+    register_tools(mcp, [
+        ("excel_descriptive_statistics", excel_handler.descriptive_statistics, "Excel 描述性统计分析."),
+        ("excel_exponential_smoothing", excel_handler.exponential_smoothing, "Excel 指数平滑."),
+    ])
 
     @mcp.tool()
     def excel_correlation_analysis(
@@ -37,7 +32,7 @@ def register_analysis_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
             data_range1: 第一组数据范围 (如 'A1:A10')
             data_range2: 第二组数据范围 (如 'B1:B10')
         """
-        logger.info(f"MCP工具调用: excel_correlation_analysis(filename={filename})")
+        logger.info("MCP工具调用: excel_correlation_analysis(filename={})", filename)
         return excel_handler.correlation_analysis(filename, sheet_name, data_range1, data_range2)
 
     @mcp.tool()
@@ -49,7 +44,7 @@ def register_analysis_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         variable_cell: str,
     ) -> dict[str, Any]:
         """Excel 单变量求解."""
-        logger.info(f"MCP工具调用: excel_goal_seek(filename={filename})")
+        logger.info("MCP工具调用: excel_goal_seek(filename={})", filename)
         return excel_handler.goal_seek(filename, sheet_name, formula_cell, target_value, variable_cell)
 
     @mcp.tool()
@@ -62,7 +57,7 @@ def register_analysis_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         confidence_level: float = 0.95,
     ) -> dict[str, Any]:
         """Excel 回归分析."""
-        logger.info(f"MCP工具调用: excel_regression_analysis(filename={filename})")
+        logger.info("MCP工具调用: excel_regression_analysis(filename={})", filename)
         return excel_handler.regression_analysis(
             filename, sheet_name, y_range, x_range, output_cell, confidence_level
         )
@@ -76,7 +71,7 @@ def register_analysis_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         alpha: float = 0.05,
     ) -> dict[str, Any]:
         """Excel 方差分析 (ANOVA)."""
-        logger.info(f"MCP工具调用: excel_anova(filename={filename})")
+        logger.info("MCP工具调用: excel_anova(filename={})", filename)
         return excel_handler.anova(filename, sheet_name, data_ranges, output_cell, alpha)
 
     @mcp.tool()
@@ -90,7 +85,7 @@ def register_analysis_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         alpha: float = 0.05,
     ) -> dict[str, Any]:
         """Excel t检验."""
-        logger.info(f"MCP工具调用: excel_t_test(filename={filename}, type={test_type})")
+        logger.info("MCP工具调用: excel_t_test(filename={}, type={})", filename, test_type)
         return excel_handler.t_test(filename, sheet_name, range1, range2, test_type, output_cell, alpha)
 
     @mcp.tool()
@@ -102,7 +97,7 @@ def register_analysis_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         output_cell: Optional[str] = None,
     ) -> dict[str, Any]:
         """Excel 卡方检验."""
-        logger.info(f"MCP工具调用: excel_chi_square_test(filename={filename})")
+        logger.info("MCP工具调用: excel_chi_square_test(filename={})", filename)
         return excel_handler.chi_square_test(filename, sheet_name, observed_range, expected_range, output_cell)
 
     @mcp.tool()
@@ -114,7 +109,7 @@ def register_analysis_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         output_cell: Optional[str] = None,
     ) -> dict[str, Any]:
         """Excel 趋势分析."""
-        logger.info(f"MCP工具调用: excel_trend_analysis(filename={filename}, forecast={forecast_periods})")
+        logger.info("MCP工具调用: excel_trend_analysis(filename={}, forecast={})", filename, forecast_periods)
         return excel_handler.trend_analysis(filename, sheet_name, data_range, forecast_periods, output_cell)
 
     @mcp.tool()
@@ -126,17 +121,5 @@ def register_analysis_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         output_cell: Optional[str] = None,
     ) -> dict[str, Any]:
         """Excel 移动平均."""
-        logger.info(f"MCP工具调用: excel_moving_average(filename={filename}, window={window_size})")
+        logger.info("MCP工具调用: excel_moving_average(filename={}, window={})", filename, window_size)
         return excel_handler.moving_average(filename, sheet_name, data_range, window_size, output_cell)
-
-    @mcp.tool()
-    def excel_exponential_smoothing(
-        filename: str,
-        sheet_name: str,
-        data_range: str,
-        alpha: float = 0.3,
-        output_cell: Optional[str] = None,
-    ) -> dict[str, Any]:
-        """Excel 指数平滑."""
-        logger.info(f"MCP工具调用: excel_exponential_smoothing(filename={filename}, alpha={alpha})")
-        return excel_handler.exponential_smoothing(filename, sheet_name, data_range, alpha, output_cell)
@@ -1,16 +1,30 @@
 """Excel 自动化工具."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional, Union
 
 from fastmcp import FastMCP
 from loguru import logger
 
 from office_mcp_server.handlers.excel_handler import ExcelHandler
+from office_mcp_server.tools.registry import register_tools
+
+# 备份类工具的 I/O 线程池, 大文件复制不阻塞事件循环
+_BACKUP_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="excel-backup")
 
 
 def register_automation_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
     """注册 Excel 自动化工具."""
 
+    register_tools(mcp, [
+        ("copy_fill_excel", excel_handler.copy_fill, "Excel 复制填充."),
+        ("merge_excel_workbooks", excel_handler.merge_workbooks, "合并多个 Excel 工作簿."),
+    ])
+
+    register_tools(mcp, [
+        ("auto_save_excel_workbook", excel_handler.auto_save_workbook, "自动保存 Excel 工作簿并创建备份."),
+    ], executor=_BACKUP_POOL)
+
     @mcp.tool()
     def fill_excel_series(
         filename: str,
@@ -32,17 +46,9 @@ def register_automation_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None
             start_value: 起始值 (默认 1)
             step: 步长 (默认 1)
         """
-        logger.info(f"MCP工具调用: fill_excel_series(filename={filename}, fill_type={fill_type})")
+        logger.info("MCP工具调用: fill_excel_series(filename={}, fill_type={})", filename, fill_type)
         return excel_handler.fill_series(filename, sheet_name, start_cell, end_cell, fill_type, start_value, step)
 
-    @mcp.tool()
-    def copy_fill_excel(
-        filename: str, sheet_name: str, source_cell: str, target_range: str
-    ) -> dict[str, Any]:
-        """Excel 复制填充."""
-        logger.info(f"MCP工具调用: copy_fill_excel(filename={filename}, source={source_cell}, target={target_range})")
-        return excel_handler.copy_fill(filename, sheet_name, source_cell, target_range)
-
     @mcp.tool()
     def formula_fill_excel(
         filename: str,
@@ -62,7 +68,7 @@ def register_automation_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None
             fill_direction: 填充方向 ('down'向下, 'right'向右, 默认 'down')
             count: 填充数量 (默认 10)
         """
-        logger.info(f"MCP工具调用: formula_fill_excel(filename={filename}, direction={fill_direction}, count={count})")
+        logger.info("MCP工具调用: formula_fill_excel(filename={}, direction={}, count={})", filename, fill_direction, count)
         return excel_handler.formula_fill(filename, sheet_name, start_cell, formula, fill_direction, count)
 
     @mcp.tool()
@@ -84,7 +90,7 @@ def register_automation_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None
             font_size: 字体大小 (用于format操作, 可选)
             export_format: 导出格式 (用于export操作, 可选, 如 'csv', 'pdf')
         """
-        logger.info(f"MCP工具调用: batch_process_excel_files(operation={operation}, patterns={len(file_patterns)})")
+        logger.info("MCP工具调用: batch_process_excel_files(operation={}, patterns={})", operation, len(file_patterns))
 
         # 构建 kwargs
         kwargs = {}
@@ -101,16 +107,6 @@ def register_automation_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None
         pattern = file_patterns[0] if file_patterns else "*.xlsx"
         return excel_handler.batch_process_files(pattern, operation, **kwargs)
 
-    @mcp.tool()
-    def merge_excel_workbooks(
-        source_files: list[str],
-        output_file: str,
-        merge_mode: str = "sheets",
-    ) -> dict[str, Any]:
-        """合并多个 Excel 工作簿."""
-        logger.info(f"MCP工具调用: merge_excel_workbooks(files={len(source_files)}, output={output_file})")
-        return excel_handler.merge_workbooks(source_files, output_file, merge_mode)
-
     @mcp.tool()
     def generate_excel_report_from_template(
         template_file: str,
@@ -118,7 +114,7 @@ def register_automation_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None
         output_file: str,
     ) -> dict[str, Any]:
         """基于模板生成 Excel 报表."""
-        logger.info(f"MCP工具调用: generate_excel_report_from_template(template={template_file})")
+        logger.info("MCP工具调用: generate_excel_report_from_template(template={})", template_file)
         return excel_handler.generate_report_from_template(template_file, data_source, output_file)
 
     @mcp.tool()
@@ -127,7 +123,7 @@ def register_automation_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None
         data_mappings: dict[str, Any],
     ) -> dict[str, Any]:
         """更新 Excel 报表数据."""
-        logger.info(f"MCP工具调用: update_excel_report_data(filename={filename})")
+        logger.info("MCP工具调用: update_excel_report_data(filename={})", filename)
         return excel_handler.update_report_data(filename, data_mappings)
 
     @mcp.tool()
@@ -137,7 +133,7 @@ def register_automation_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None
         consolidation_function: str = "sum",
     ) -> dict[str, Any]:
         """合并多个 Excel 报表."""
-        logger.info(f"MCP工具调用: consolidate_excel_reports(files={len(source_files)})")
+        logger.info("MCP工具调用: consolidate_excel_reports(files={})", len(source_files))
         return excel_handler.consolidate_reports(source_files, output_file, consolidation_function)
 
     @mcp.tool()
@@ -148,24 +144,5 @@ def register_automation_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None
         schedule_cron: str,
     ) -> dict[str, Any]:
         """定时生成 Excel 报表."""
-        logger.info(f"MCP工具调用: schedule_excel_report_generation(template={template_file}, schedule={schedule_cron})")
+        logger.info("MCP工具调用: schedule_excel_report_generation(template={}, schedule={})", template_file, schedule_cron)
         return excel_handler.schedule_report_generation(template_file, data_source_query, output_pattern, schedule_cron)
-
-    @mcp.tool()
-    def auto_save_excel_workbook(
-        filename: str,
-        backup_dir: Optional[str] = None,
-        version_suffix: Optional[str] = None,
-    ) -> dict[str, Any]:
-        """自动保存 Excel 工作簿并创建备份.
-
-        Args:
-            filename: 文件名
-            backup_dir: 备份目录 (可选, 默认为output_dir/backups)
-            version_suffix: 版本后缀 (可选, 默认为时间戳)
-
-        Returns:
-            dict: 操作结果
-        """
-        logger.info(f"MCP工具调用: auto_save_excel_workbook(filename={filename}, backup_dir={backup_dir})")
-        return excel_handler.auto_save_workbook(filename, backup_dir, version_suffix)
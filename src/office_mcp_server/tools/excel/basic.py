@@ -1,43 +1,24 @@
 """Excel 基础操作工具."""
 
-from typing import Any, Optional, Union
+from typing import Any, Optional
 
 from fastmcp import FastMCP
 from loguru import logger
 
 from office_mcp_server.handlers.excel_handler import ExcelHandler
+from office_mcp_server.tools.registry import register_tools
 
 
 def register_basic_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
     """注册 Excel 基础操作工具."""
 
-    @mcp.tool()
-    def create_excel_workbook(filename: str, sheet_name: Optional[str] = None) -> dict[str, Any]:
-        """创建 Excel 工作簿."""
-        logger.info(f"MCP工具调用: create_excel_workbook(filename={filename})")
-        return excel_handler.create_workbook(filename, sheet_name)
-
-    @mcp.tool()
-    def write_excel_cell(
-        filename: str, sheet_name: str, cell: str, value: Union[str, int, float]
-    ) -> dict[str, Any]:
-        """写入 Excel 单元格数据."""
-        logger.info(f"MCP工具调用: write_excel_cell(filename={filename}, cell={cell})")
-        return excel_handler.write_cell(filename, sheet_name, cell, value)
-
-    @mcp.tool()
-    def write_excel_range(
-        filename: str, sheet_name: str, start_cell: str, data: list[list[Any]]
-    ) -> dict[str, Any]:
-        """批量写入 Excel 数据."""
-        logger.info(f"MCP工具调用: write_excel_range(filename={filename})")
-        return excel_handler.write_range(filename, sheet_name, start_cell, data)
-
-    @mcp.tool()
-    def read_excel_cell(filename: str, sheet_name: str, cell: str) -> dict[str, Any]:
-        """读取 Excel 单元格数据."""
-        logger.info(f"MCP工具调用: read_excel_cell(filename={filename}, cell={cell})")
-        return excel_handler.read_cell(filename, sheet_name, cell)
+    register_tools(mcp, [
+        ("create_excel_workbook", excel_handler.create_workbook, "创建 Excel 工作簿."),
+        ("write_excel_cell", excel_handler.write_cell, "写入 Excel 单元格数据."),
+        ("write_excel_range", excel_handler.write_range, "批量写入 Excel 数据."),
+        ("read_excel_cell", excel_handler.read_cell, "读取 Excel 单元格数据."),
+        ("get_excel_workbook_info", excel_handler.get_workbook_info, "获取 Excel 工作簿信息."),
+    ])
 
     @mcp.tool()
     def format_excel_cell(
@@ -77,13 +58,58 @@ def register_basic_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         Returns:
             dict: 操作结果
         """
-        logger.info(f"MCP工具调用: format_excel_cell(filename={filename}, cell={cell})")
+        logger.info("MCP工具调用: format_excel_cell(filename={}, cell={})", filename, cell)
         return excel_handler.format_cell(
             filename, sheet_name, cell, font_name, font_size, bold, color, bg_color,
             number_format, horizontal_alignment, vertical_alignment, wrap_text,
             border_style, border_color
         )
 
+    @mcp.tool()
+    def format_excel_range(
+        filename: str,
+        sheet_name: str,
+        cell_range: str,
+        font_name: Optional[str] = None,
+        font_size: Optional[int] = None,
+        bold: bool = False,
+        color: Optional[str] = None,
+        bg_color: Optional[str] = None,
+        number_format: Optional[str] = None,
+        horizontal_alignment: Optional[str] = None,
+        vertical_alignment: Optional[str] = None,
+        wrap_text: bool = False,
+        border_style: Optional[str] = None,
+        border_color: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """批量格式化 Excel 单元格范围 (范围内单元格共享同一组样式).
+
+        Args:
+            filename: 文件名
+            sheet_name: 工作表名称
+            cell_range: 单元格范围 (如 'A1:D10')
+            font_name: 字体名称 (可选)
+            font_size: 字号 (可选)
+            bold: 是否加粗 (默认 False)
+            color: 文字颜色 HEX格式 (如 '#FF0000', 可选)
+            bg_color: 背景颜色 HEX格式 (如 '#FFFF00', 可选)
+            number_format: 数字格式 ('0.00'小数, '#,##0'千分位, '0%'百分比, 'yyyy-mm-dd'日期, '$#,##0.00'货币, '@'文本, 可选)
+            horizontal_alignment: 水平对齐 ('left', 'center', 'right', 'justify', 可选)
+            vertical_alignment: 垂直对齐 ('top', 'center', 'bottom', 可选)
+            wrap_text: 是否自动换行 (默认 False)
+            border_style: 边框样式 ('thin', 'medium', 'thick', 'double', 可选)
+            border_color: 边框颜色 HEX格式 (可选)
+
+        Returns:
+            dict: 操作结果
+        """
+        logger.info("MCP工具调用: format_excel_range(filename={}, cell_range={})", filename, cell_range)
+        return excel_handler.format_range(
+            filename, sheet_name, cell_range, font_name, font_size, bold, color, bg_color,
+            number_format, horizontal_alignment, vertical_alignment, wrap_text,
+            border_style, border_color
+        )
+
     @mcp.tool()
     def create_excel_chart(
         filename: str,
@@ -115,14 +141,8 @@ def register_basic_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         Returns:
             dict: 操作结果
         """
-        logger.info(f"MCP工具调用: create_excel_chart(filename={filename})")
+        logger.info("MCP工具调用: create_excel_chart(filename={})", filename)
         return excel_handler.create_chart(
             filename, sheet_name, chart_type, data_range, title, position,
             x_axis_title, y_axis_title, legend_position, show_data_labels
         )
-
-    @mcp.tool()
-    def get_excel_workbook_info(filename: str) -> dict[str, Any]:
-        """获取 Excel 工作簿信息."""
-        logger.info(f"MCP工具调用: get_excel_workbook_info(filename={filename})")
-        return excel_handler.get_workbook_info(filename)
@@ -1,9 +1,16 @@
 """Excel批量操作优化器"""
 from typing import List, Dict, Any, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import asyncio
+import re
 
-@dataclass
+from office_mcp_server.utils.cell_ref import COLUMN_INDEX
+
+# 单元格地址 (列字母 + 行号), 用于批处理排序
+_CELL_ADDR_RE = re.compile(r'([A-Z]+)(\d+)')
+
+@dataclass(slots=True)
 class ExcelOperation:
     type: str  # 'merge_cells', 'set_value', 'format', 'formula'
     range: str
@@ -91,13 +98,17 @@ class ExcelBatchOptimizer:
 
         return batches
 
-    def _get_cell_index(self, range_addr: str) -> Tuple[int, int]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _get_cell_index(range_addr: str) -> Tuple[int, int]:
         """获取单元格索引用于排序"""
-        # 简化实现：提取行列号
-        import re
-        match = re.match(r'([A-Z]+)(\d+)', range_addr.split('!')[-1])
+        # 简化实现：提取行列号 (列号查表, 同一地址在排序和相邻判断中只解析一次)
+        match = _CELL_ADDR_RE.match(range_addr.split('!')[-1])
         if match:
-            col = sum((ord(c) - ord('A') + 1) * (26 ** i) for i, c in enumerate(reversed(match.group(1))))
+            letters = match.group(1)
+            col = COLUMN_INDEX.get(letters)
+            if col is None:
+                col = sum((ord(c) - ord('A') + 1) * (26 ** i) for i, c in enumerate(reversed(letters)))
             row = int(match.group(2))
             return (row, col)
         return (0, 0)
@@ -1,48 +1,21 @@
 """Excel 图表工具."""
 
-from typing import Any, Optional
+from typing import Any
 
 from fastmcp import FastMCP
 from loguru import logger
 
 from office_mcp_server.handlers.excel_handler import ExcelHandler
+from office_mcp_server.tools.registry import register_tools
 
 
 def register_chart_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
     """注册 Excel 图表工具."""
 
-    @mcp.tool()
-    def format_excel_chart(
-        filename: str,
-        sheet_name: str,
-        chart_index: int = 0,
-        title_font_size: Optional[int] = None,
-        title_font_bold: bool = False,
-        chart_style: Optional[int] = None,
-        color_scheme: Optional[list[str]] = None,
-    ) -> dict[str, Any]:
-        """格式化 Excel 图表."""
-        logger.info(f"MCP工具调用: format_excel_chart(filename={filename}, chart_index={chart_index})")
-        return excel_handler.format_chart(
-            filename, sheet_name, chart_index, title_font_size, title_font_bold, chart_style, color_scheme
-        )
-
-    @mcp.tool()
-    def create_excel_combination_chart(
-        filename: str,
-        sheet_name: str,
-        data_range1: str,
-        data_range2: str,
-        chart_type1: str = "bar",
-        chart_type2: str = "line",
-        title: str = "",
-        position: str = "E5",
-    ) -> dict[str, Any]:
-        """创建 Excel 组合图表."""
-        logger.info(f"MCP工具调用: create_excel_combination_chart(filename={filename})")
-        return excel_handler.create_combination_chart(
-            filename, sheet_name, data_range1, data_range2, chart_type1, chart_type2, title, position
-        )
+    register_tools(mcp, [
+        ("format_excel_chart", excel_handler.format_chart, "格式化 Excel 图表."),
+        ("create_excel_combination_chart", excel_handler.create_combination_chart, "创建 Excel 组合图表."),
+    ])
 
     @mcp.tool()
     def add_excel_chart_trendline(
@@ -69,7 +42,7 @@ def register_chart_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         Returns:
             dict: 操作结果
         """
-        logger.info(f"MCP工具调用: add_excel_chart_trendline(filename={filename}, type={trendline_type})")
+        logger.info("MCP工具调用: add_excel_chart_trendline(filename={}, type={})", filename, trendline_type)
         return excel_handler.add_trendline_to_chart(
             filename, sheet_name, chart_index, series_index,
             trendline_type, display_equation, display_r_squared
@@ -6,11 +6,18 @@ from fastmcp import FastMCP
 from loguru import logger
 
 from office_mcp_server.handlers.excel_handler import ExcelHandler
+from office_mcp_server.tools.registry import register_tools
 
 
 def register_collaboration_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
     """注册 Excel 协作工具."""
 
+    register_tools(mcp, [
+        ("get_excel_comment", excel_handler.get_comment, "获取 Excel 批注."),
+        ("delete_excel_comment", excel_handler.delete_comment, "删除 Excel 批注."),
+        ("list_all_excel_comments", excel_handler.list_all_comments, "列出 Excel 所有批注."),
+    ])
+
     @mcp.tool()
     def add_excel_comment(
         filename: str,
@@ -20,29 +27,5 @@ def register_collaboration_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> N
         author: Optional[str] = None,
     ) -> dict[str, Any]:
         """添加 Excel 批注."""
-        logger.info(f"MCP工具调用: add_excel_comment(filename={filename}, cell={cell})")
+        logger.info("MCP工具调用: add_excel_comment(filename={}, cell={})", filename, cell)
         return excel_handler.add_comment(filename, sheet_name, cell, comment, author)
-
-    @mcp.tool()
-    def get_excel_comment(
-        filename: str, sheet_name: str, cell: str
-    ) -> dict[str, Any]:
-        """获取 Excel 批注."""
-        logger.info(f"MCP工具调用: get_excel_comment(filename={filename}, cell={cell})")
-        return excel_handler.get_comment(filename, sheet_name, cell)
-
-    @mcp.tool()
-    def delete_excel_comment(
-        filename: str, sheet_name: str, cell: str
-    ) -> dict[str, Any]:
-        """删除 Excel 批注."""
-        logger.info(f"MCP工具调用: delete_excel_comment(filename={filename}, cell={cell})")
-        return excel_handler.delete_comment(filename, sheet_name, cell)
-
-    @mcp.tool()
-    def list_all_excel_comments(
-        filename: str, sheet_name: Optional[str] = None
-    ) -> dict[str, Any]:
-        """列出 Excel 所有批注."""
-        logger.info(f"MCP工具调用: list_all_excel_comments(filename={filename})")
-        return excel_handler.list_all_comments(filename, sheet_name)
@@ -6,11 +6,21 @@ from fastmcp import FastMCP
 from loguru import logger
 
 from office_mcp_server.handlers.excel_handler import ExcelHandler
+from office_mcp_server.tools.registry import register_tools
 
 
 def register_data_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
     """注册 Excel 数据操作工具."""
 
+    register_tools(mcp, [
+        ("read_excel_range", excel_handler.read_range, "读取 Excel 单元格范围数据."),
+        ("read_excel_row", excel_handler.read_row, "读取 Excel 整行数据."),
+        ("read_excel_column", excel_handler.read_column, "读取 Excel 整列数据."),
+        ("read_all_excel_data", excel_handler.read_all_data, "读取 Excel 整表数据."),
+        ("clear_excel_cell", excel_handler.clear_cell, "清除 Excel 单元格内容."),
+        ("clear_excel_range", excel_handler.clear_range, "清除 Excel 单元格范围内容."),
+    ])
+
     @mcp.tool()
     def insert_excel_formula(
         filename: str, sheet_name: str, cell: str, formula: str
@@ -26,7 +36,7 @@ def register_data_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         Returns:
             dict: 操作结果
         """
-        logger.info(f"MCP工具调用: insert_excel_formula(filename={filename})")
+        logger.info("MCP工具调用: insert_excel_formula(filename={})", filename)
         return excel_handler.insert_formula(filename, sheet_name, cell, formula)
 
     @mcp.tool()
@@ -49,7 +59,7 @@ def register_data_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         Returns:
             dict: 操作结果
         """
-        logger.info(f"MCP工具调用: sort_excel_data(filename={filename})")
+        logger.info("MCP工具调用: sort_excel_data(filename={})", filename)
         return excel_handler.sort_data(filename, sheet_name, data_range, sort_by_column, ascending)
 
     @mcp.tool()
@@ -72,7 +82,7 @@ def register_data_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         Returns:
             dict: 操作结果
         """
-        logger.info(f"MCP工具调用: manage_excel_worksheets(filename={filename})")
+        logger.info("MCP工具调用: manage_excel_worksheets(filename={})", filename)
         return excel_handler.manage_worksheets(
             filename, operation, sheet_name, new_name, target_index
         )
@@ -117,7 +127,7 @@ def register_data_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         Returns:
             dict: 操作结果,包含生成的公式
         """
-        logger.info(f"MCP工具调用: apply_excel_function(filename={filename}, function={function_name})")
+        logger.info("MCP工具调用: apply_excel_function(filename={}, function={})", filename, function_name)
         return excel_handler.apply_function(
             filename, sheet_name, cell, function_name, range1, range2,
             condition, value_if_true, value_if_false, lookup_value,
@@ -151,7 +161,7 @@ def register_data_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         Returns:
             dict: 操作结果
         """
-        logger.info(f"MCP工具调用: filter_excel_data(filename={filename})")
+        logger.info("MCP工具调用: filter_excel_data(filename={})", filename)
         return excel_handler.filter_data(
             filename, sheet_name, data_range, filter_column,
             filter_value, filter_operator, enable_autofilter
@@ -189,7 +199,7 @@ def register_data_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         Returns:
             dict: 操作结果
         """
-        logger.info(f"MCP工具调用: apply_excel_conditional_formatting(filename={filename})")
+        logger.info("MCP工具调用: apply_excel_conditional_formatting(filename={})", filename)
         return excel_handler.apply_conditional_formatting(
             filename, sheet_name, cell_range, rule_type, format_type,
             color, operator, formula, value1, value2
@@ -234,57 +244,9 @@ def register_data_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         Returns:
             dict: 操作结果
         """
-        logger.info(f"MCP工具调用: set_excel_data_validation(filename={filename})")
+        logger.info("MCP工具调用: set_excel_data_validation(filename={})", filename)
         return excel_handler.set_data_validation(
             filename, sheet_name, cell_range, validation_type, operator,
             formula1, formula2, allow_blank, show_dropdown,
             prompt_title, prompt, error_title, error
         )
-
-    @mcp.tool()
-    def read_excel_range(
-        filename: str, sheet_name: str, cell_range: str
-    ) -> dict[str, Any]:
-        """读取 Excel 单元格范围数据."""
-        logger.info(f"MCP工具调用: read_excel_range(filename={filename}, cell_range={cell_range})")
-        return excel_handler.read_range(filename, sheet_name, cell_range)
-
-    @mcp.tool()
-    def read_excel_row(
-        filename: str, sheet_name: str, row_index: int
-    ) -> dict[str, Any]:
-        """读取 Excel 整行数据."""
-        logger.info(f"MCP工具调用: read_excel_row(filename={filename}, row_index={row_index})")
-        return excel_handler.read_row(filename, sheet_name, row_index)
-
-    @mcp.tool()
-    def read_excel_column(
-        filename: str, sheet_name: str, col_index: int
-    ) -> dict[str, Any]:
-        """读取 Excel 整列数据."""
-        logger.info(f"MCP工具调用: read_excel_column(filename={filename}, col_index={col_index})")
-        return excel_handler.read_column(filename, sheet_name, col_index)
-
-    @mcp.tool()
-    def read_all_excel_data(
-        filename: str, sheet_name: str, include_empty: bool = False
-    ) -> dict[str, Any]:
-        """读取 Excel 整表数据."""
-        logger.info(f"MCP工具调用: read_all_excel_data(filename={filename}, sheet_name={sheet_name})")
-        return excel_handler.read_all_data(filename, sheet_name, include_empty)
-
-    @mcp.tool()
-    def clear_excel_cell(
-        filename: str, sheet_name: str, cell: str
-    ) -> dict[str, Any]:
-        """清除 Excel 单元格内容."""
-        logger.info(f"MCP工具调用: clear_excel_cell(filename={filename}, cell={cell})")
-        return excel_handler.clear_cell(filename, sheet_name, cell)
-
-    @mcp.tool()
-    def clear_excel_range(
-        filename: str, sheet_name: str, cell_range: str
-    ) -> dict[str, Any]:
-        """清除 Excel 单元格范围内容."""
-        logger.info(f"MCP工具调用: clear_excel_range(filename={filename}, cell_range={cell_range})")
-        return excel_handler.clear_range(filename, sheet_name, cell_range)
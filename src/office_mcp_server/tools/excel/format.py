@@ -35,7 +35,7 @@ def register_format_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         Returns:
             dict: 操作结果
         """
-        logger.info(f"MCP工具调用: create_excel_table(filename={filename}, table_name={table_name})")
+        logger.info("MCP工具调用: create_excel_table(filename={}, table_name={})", filename, table_name)
         return excel_handler.create_table(
             filename, sheet_name, table_range, table_name,
             style, show_header, show_totals
@@ -72,7 +72,7 @@ def register_format_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         Note:
             此功能需要 Windows 环境和 Microsoft Excel 应用程序，或安装 pywin32 库
         """
-        logger.info(f"MCP工具调用: create_excel_pivot_table(filename={filename})")
+        logger.info("MCP工具调用: create_excel_pivot_table(filename={})", filename)
         return excel_handler.create_pivot_table(
             filename, source_sheet, source_range, pivot_sheet, pivot_location,
             row_fields, col_fields, data_fields, filter_fields
@@ -99,5 +99,5 @@ def register_format_tools(mcp: FastMCP, excel_handler: ExcelHandler) -> None:
         Note:
             此功能需要 Windows 环境和 Microsoft Excel 应用程序，或安装 pywin32 库
         """
-        logger.info(f"MCP工具调用: change_excel_pivot_data_source(filename={filename}, pivot_table={pivot_table_name})")
+        logger.info("MCP工具调用: change_excel_pivot_data_source(filename={}, pivot_table={})", filename, pivot_table_name)
         return excel_handler.change_pivot_data_source(filename, pivot_sheet, pivot_table_name, new_source_range)
@@ -1,10 +1,19 @@
 """操作队列管理器"""
 import asyncio
-from typing import List, Dict, Any, Optional, Callable
+import itertools
+from collections import deque
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Callable, Sequence, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import time
-import uuid
+
+# 待执行队列中失效条目 (已取消操作) 超过一半且队列不小于该值时压缩队列
+_MIN_COMPACT_SIZE = 64
+
+# 未传参数时共用的不可变空参数, 避免每个操作都新建空列表/字典
+_EMPTY_ARGS: Tuple[Any, ...] = ()
+_EMPTY_KWARGS: Mapping[str, Any] = MappingProxyType({})
 
 class OperationStatus(Enum):
     PENDING = "pending"
@@ -18,42 +27,86 @@ class OperationType(Enum):
     POWERPOINT = "powerpoint"
     WORD = "word"
 
-@dataclass
+@dataclass(slots=True)
 class QueuedOperation:
     id: str
     type: OperationType
     priority: int
     handler: str
     method: str
-    args: List[Any]
-    kwargs: Dict[str, Any]
+    args: Sequence[Any]
+    kwargs: Mapping[str, Any]
     status: OperationStatus = OperationStatus.PENDING
     created_at: float = field(default_factory=time.time)
     started_at: Optional[float] = None
     completed_at: Optional[float] = None
     result: Any = None
     error: Optional[str] = None
+    # 进入 COMPLETED/FAILED/CANCELLED 状态时置位, 等待方无需轮询
+    done_event: asyncio.Event = field(default_factory=asyncio.Event, repr=False, compare=False)
 
 class OperationQueue:
-    """批量操作队列管理器"""
+    """批量操作队列管理器
+
+    待执行操作放在 asyncio.PriorityQueue 中, 由 max_concurrent 个工作协程
+    取出执行 (首次入队时惰性启动)。同一时刻只在一个事件循环中使用 (不跨线程),
+    队列状态的修改都在两次 await 之间同步完成, 本身就是原子的, 因此不再用
+    asyncio.Lock 保护。待执行队列和工作协程绑定在创建时的事件循环上, 换了事件
+    循环 (如先后多次 asyncio.run) 时会重新创建。
+    """
 
-    def __init__(self, max_concurrent: int = 3):
+    def __init__(self, max_concurrent: int = 3, max_history: int = 10000):
         self.max_concurrent = max_concurrent
         self.operations: Dict[str, QueuedOperation] = {}
-        self.pending_queue: List[str] = []
+        # 待执行操作: (-优先级, 入队序号, 操作ID), 同优先级按入队顺序执行
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        # 创建待执行队列和工作协程时所在的事件循环
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._workers: List[asyncio.Task] = []
+        self._counter = itertools.count()
+        # 操作ID 只用作队列内部的字典键, 用自增序号生成即可
+        self._id_counter = itertools.count()
+        # 各状态的操作数, 随状态变化实时维护
+        self._status_counts: Dict[OperationStatus, int] = dict.fromkeys(OperationStatus, 0)
         self.running_operations: Dict[str, asyncio.Task] = {}
+        # 已结束操作的ID (按结束顺序), 超过 max_history 时淘汰最早的记录,
+        # 长时间运行时 operations 不会无限增长; 待执行/运行中的操作不会被淘汰
+        self._finished_ids: deque = deque(maxlen=max_history)
         self.handlers: Dict[str, Any] = {}
-        self._lock = asyncio.Lock()
+        # (处理器名, 方法名) -> 是否为协程函数, 避免每个操作都重新检查
+        self._coro_cache: Dict[Tuple[str, str], bool] = {}
 
     def register_handler(self, name: str, handler: Any):
         """注册操作处理器"""
         self.handlers[name] = handler
+        self._coro_cache.clear()
+
+    def _next_id(self) -> str:
+        """生成队列内唯一的操作ID"""
+        return f"op-{next(self._id_counter)}"
+
+    def _set_status(self, operation: QueuedOperation, status: OperationStatus):
+        """更新操作状态并同步状态计数"""
+        self._status_counts[operation.status] -= 1
+        self._status_counts[status] += 1
+        operation.status = status
+
+    def _finish(self, operation: QueuedOperation, status: OperationStatus):
+        """将操作置为结束状态, 唤醒等待方并记入有界历史"""
+        self._set_status(operation, status)
+        operation.done_event.set()
+
+        if self._finished_ids and len(self._finished_ids) == self._finished_ids.maxlen:
+            evicted = self.operations.pop(self._finished_ids[0], None)
+            if evicted is not None:
+                self._status_counts[evicted.status] -= 1
+        self._finished_ids.append(operation.id)
 
     async def add_operation(self, op_type: OperationType, handler: str, method: str,
                           args: List[Any] = None, kwargs: Dict[str, Any] = None,
                           priority: int = 0) -> str:
         """添加操作到队列"""
-        op_id = str(uuid.uuid4())
+        op_id = self._next_id()
 
         operation = QueuedOperation(
             id=op_id,
@@ -61,51 +114,70 @@ class OperationQueue:
             priority=priority,
             handler=handler,
             method=method,
-            args=args or [],
-            kwargs=kwargs or {}
+            args=args if args is not None else _EMPTY_ARGS,
+            kwargs=kwargs if kwargs is not None else _EMPTY_KWARGS
         )
 
-        async with self._lock:
-            self.operations[op_id] = operation
-            self.pending_queue.append(op_id)
-            self.pending_queue.sort(key=lambda x: self.operations[x].priority, reverse=True)
-
-        # 尝试启动操作
-        await self._process_queue()
+        await self._enqueue_many([operation])
         return op_id
 
     async def add_batch_operations(self, operations: List[Dict[str, Any]]) -> List[str]:
         """批量添加操作"""
-        op_ids = []
-
-        for op_data in operations:
-            op_id = await self.add_operation(
-                op_type=OperationType(op_data['type']),
+        queued = [
+            QueuedOperation(
+                id=self._next_id(),
+                type=OperationType(op_data['type']),
+                priority=op_data.get('priority', 0),
                 handler=op_data['handler'],
                 method=op_data['method'],
-                args=op_data.get('args', []),
-                kwargs=op_data.get('kwargs', {}),
-                priority=op_data.get('priority', 0)
+                args=op_data.get('args', _EMPTY_ARGS),
+                kwargs=op_data.get('kwargs', _EMPTY_KWARGS)
             )
-            op_ids.append(op_id)
-
-        return op_ids
-
-    async def _process_queue(self):
-        """处理队列中的操作"""
-        async with self._lock:
-            # 检查是否可以启动新操作
-            while (len(self.running_operations) < self.max_concurrent and
-                   self.pending_queue):
-
-                op_id = self.pending_queue.pop(0)
-                operation = self.operations[op_id]
+            for op_data in operations
+        ]
+
+        await self._enqueue_many(queued)
+        return [operation.id for operation in queued]
+
+    async def _enqueue_many(self, operations: List[QueuedOperation]):
+        """登记一批操作并全部入队"""
+        self._ensure_workers()
+        for operation in operations:
+            self.operations[operation.id] = operation
+            self._status_counts[operation.status] += 1
+            self._queue.put_nowait((-operation.priority, next(self._counter), operation.id))
+
+    def _ensure_workers(self):
+        """按 max_concurrent 补足工作协程, 事件循环变化时重建待执行队列"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # 旧队列和旧工作协程属于之前的事件循环, 不能再使用; 尚未执行的条目转入新队列
+            previous, self._queue = self._queue, asyncio.PriorityQueue()
+            self._loop = loop
+            self._workers = []
+            while previous is not None and not previous.empty():
+                self._queue.put_nowait(previous.get_nowait())
+
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        while len(self._workers) < self.max_concurrent:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def _worker(self):
+        """工作协程: 按优先级依次取出待执行操作并执行"""
+        queue = self._queue
+        while True:
+            _, _, op_id = await queue.get()
+            operation = self.operations.get(op_id)
+            # 已取消 (或已被清理) 的操作留在队列中, 出队时跳过
+            if operation is None or operation.status != OperationStatus.PENDING:
+                continue
 
-                # 启动操作
-                task = asyncio.create_task(self._execute_operation(operation))
-                self.running_operations[op_id] = task
-                operation.status = OperationStatus.RUNNING
-                operation.started_at = time.time()
+            # 每个操作在单独的任务中执行, 取消运行中的操作不会影响工作协程
+            task = asyncio.create_task(self._execute_operation(operation))
+            self.running_operations[op_id] = task
+            self._set_status(operation, OperationStatus.RUNNING)
+            operation.started_at = time.time()
+            await asyncio.wait((task,))
 
     async def _execute_operation(self, operation: QueuedOperation):
         """执行单个操作"""
@@ -118,80 +190,86 @@ class OperationQueue:
             method = getattr(handler, operation.method)
 
             # 执行操作
-            if asyncio.iscoroutinefunction(method):
+            key = (operation.handler, operation.method)
+            is_coro = self._coro_cache.get(key)
+            if is_coro is None:
+                is_coro = self._coro_cache[key] = asyncio.iscoroutinefunction(method)
+            if is_coro:
                 result = await method(*operation.args, **operation.kwargs)
             else:
                 result = method(*operation.args, **operation.kwargs)
 
             # 更新操作状态
             operation.result = result
-            operation.status = OperationStatus.COMPLETED
             operation.completed_at = time.time()
+            self._finish(operation, OperationStatus.COMPLETED)
 
         except Exception as e:
             operation.error = str(e)
-            operation.status = OperationStatus.FAILED
             operation.completed_at = time.time()
+            self._finish(operation, OperationStatus.FAILED)
 
         finally:
             # 清理运行中的操作
-            async with self._lock:
-                if operation.id in self.running_operations:
-                    del self.running_operations[operation.id]
-
-            # 继续处理队列
-            await self._process_queue()
+            if operation.id in self.running_operations:
+                del self.running_operations[operation.id]
 
     async def wait_for_operation(self, op_id: str, timeout: Optional[float] = None) -> QueuedOperation:
         """等待操作完成"""
-        start_time = time.time()
-
-        while True:
-            operation = self.operations.get(op_id)
-            if not operation:
-                raise ValueError(f"Operation {op_id} not found")
-
-            if operation.status in [OperationStatus.COMPLETED, OperationStatus.FAILED, OperationStatus.CANCELLED]:
-                return operation
-
-            if timeout and (time.time() - start_time) > timeout:
-                raise asyncio.TimeoutError(f"Operation {op_id} timed out")
+        operation = self.operations.get(op_id)
+        if not operation:
+            raise ValueError(f"Operation {op_id} not found")
 
-            await asyncio.sleep(0.1)
+        try:
+            await asyncio.wait_for(operation.done_event.wait(), timeout or None)
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(f"Operation {op_id} timed out") from None
+        return operation
 
     async def wait_for_all(self, op_ids: List[str], timeout: Optional[float] = None) -> List[QueuedOperation]:
         """等待多个操作完成"""
-        results = []
-        for op_id in op_ids:
-            result = await self.wait_for_operation(op_id, timeout)
-            results.append(result)
-        return results
+        return list(await asyncio.gather(*(self.wait_for_operation(op_id, timeout) for op_id in op_ids)))
 
     async def cancel_operation(self, op_id: str) -> bool:
         """取消操作"""
-        async with self._lock:
-            operation = self.operations.get(op_id)
-            if not operation:
-                return False
-
-            if operation.status == OperationStatus.PENDING:
-                # 从队列中移除
-                if op_id in self.pending_queue:
-                    self.pending_queue.remove(op_id)
-                operation.status = OperationStatus.CANCELLED
-                return True
-
-            elif operation.status == OperationStatus.RUNNING:
-                # 取消运行中的任务
-                task = self.running_operations.get(op_id)
-                if task:
-                    task.cancel()
-                    del self.running_operations[op_id]
-                operation.status = OperationStatus.CANCELLED
-                return True
-
+        operation = self.operations.get(op_id)
+        if not operation:
             return False
 
+        if operation.status == OperationStatus.PENDING:
+            # 只标记为已取消, 队列中的条目在出队时跳过
+            self._finish(operation, OperationStatus.CANCELLED)
+            self._compact_pending()
+            return True
+
+        elif operation.status == OperationStatus.RUNNING:
+            # 取消运行中的任务
+            task = self.running_operations.get(op_id)
+            if task:
+                task.cancel()
+                del self.running_operations[op_id]
+            self._finish(operation, OperationStatus.CANCELLED)
+            return True
+
+        return False
+
+    def _compact_pending(self):
+        """失效条目过多时重建待执行队列
+
+        每个待执行操作在队列中恰有一个条目, 其余都是已取消操作留下的失效条目。
+        """
+        if self._queue is None:
+            return
+        size = self._queue.qsize()
+        if size < _MIN_COMPACT_SIZE or size <= 2 * self._status_counts[OperationStatus.PENDING]:
+            return
+
+        pending = OperationStatus.PENDING
+        for entry in [self._queue.get_nowait() for _ in range(size)]:
+            operation = self.operations.get(entry[2])
+            if operation is not None and operation.status == pending:
+                self._queue.put_nowait(entry)
+
     def get_operation_status(self, op_id: str) -> Optional[Dict[str, Any]]:
         """获取操作状态"""
         operation = self.operations.get(op_id)
@@ -213,10 +291,10 @@ class OperationQueue:
 
     def get_queue_stats(self) -> Dict[str, Any]:
         """获取队列统计信息"""
-        pending = sum(1 for op in self.operations.values() if op.status == OperationStatus.PENDING)
-        running = sum(1 for op in self.operations.values() if op.status == OperationStatus.RUNNING)
-        completed = sum(1 for op in self.operations.values() if op.status == OperationStatus.COMPLETED)
-        failed = sum(1 for op in self.operations.values() if op.status == OperationStatus.FAILED)
+        pending = self._status_counts[OperationStatus.PENDING]
+        running = self._status_counts[OperationStatus.RUNNING]
+        completed = self._status_counts[OperationStatus.COMPLETED]
+        failed = self._status_counts[OperationStatus.FAILED]
 
         return {
             "total_operations": len(self.operations),
@@ -225,35 +303,48 @@ class OperationQueue:
             "completed": completed,
             "failed": failed,
             "max_concurrent": self.max_concurrent,
-            "queue_length": len(self.pending_queue)
+            "queue_length": pending
         }
 
     async def clear_completed(self):
         """清理已完成的操作"""
-        async with self._lock:
-            completed_ids = [
-                op_id for op_id, op in self.operations.items()
-                if op.status in [OperationStatus.COMPLETED, OperationStatus.FAILED, OperationStatus.CANCELLED]
-            ]
-
-            for op_id in completed_ids:
-                del self.operations[op_id]
-
-    async def shutdown(self):
-        """关闭队列，取消所有操作"""
-        async with self._lock:
-            # 取消所有运行中的任务
-            for task in self.running_operations.values():
-                task.cancel()
-
-            # 等待所有任务完成
-            if self.running_operations:
-                await asyncio.gather(*self.running_operations.values(), return_exceptions=True)
-
-            # 清空队列
-            self.operations.clear()
-            self.pending_queue.clear()
-            self.running_operations.clear()
+        completed_ids = [
+            op_id for op_id, op in self.operations.items()
+            if op.status in [OperationStatus.COMPLETED, OperationStatus.FAILED, OperationStatus.CANCELLED]
+        ]
+
+        for op_id in completed_ids:
+            self._status_counts[self.operations.pop(op_id).status] -= 1
+        self._finished_ids.clear()
+
+    async def shutdown(self, grace_period: Optional[float] = None):
+        """关闭队列，取消所有操作
+
+        Args:
+            grace_period: 等待被取消任务结束的最长秒数 (None 表示一直等待),
+                超时后不再等待仍未退出的任务
+        """
+        # 先把未结束的操作标记为已取消并唤醒等待方, 清空待执行队列
+        for operation in self.operations.values():
+            if not operation.done_event.is_set():
+                self._set_status(operation, OperationStatus.CANCELLED)
+                operation.done_event.set()
+        while self._queue is not None and not self._queue.empty():
+            self._queue.get_nowait()
+
+        # 取消工作协程和所有运行中的任务并等待其结束 (最多等待 grace_period 秒)
+        tasks = [*self._workers, *self.running_operations.values()]
+        self._workers.clear()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks, timeout=grace_period)
+
+        # 清空队列
+        self.operations.clear()
+        self._status_counts = dict.fromkeys(OperationStatus, 0)
+        self.running_operations.clear()
+        self._finished_ids.clear()
 
 # 全局队列实例
 operation_queue = OperationQueue()
\ No newline at end of file
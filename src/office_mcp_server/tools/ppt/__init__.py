@@ -17,14 +17,14 @@ def register_ppt_tools(mcp: FastMCP) -> None:
 
     模块化架构：
     - basic: 基础操作 (6个工具)
-    - content: 内容操作 (7个工具)
+    - content: 内容操作 (8个工具)
     - format: 格式化 (6个工具)
     - media: 媒体操作 (4个工具)
     - animation: 动画和过渡 (3个工具)
     - extract: 内容提取 (6个工具)
     - batch: 批量操作 (2个工具)
 
-    总计：34个工具
+    总计：35个工具
     """
     ppt_handler = PowerPointHandler()
 
@@ -1,9 +1,10 @@
 """PowerPoint批量操作优化器"""
-from typing import List, Dict, Any, Tuple
+from collections import defaultdict
+from typing import Hashable, List, Dict, Any, Tuple
 from dataclasses import dataclass
 import asyncio
 
-@dataclass
+@dataclass(slots=True)
 class PowerPointOperation:
     type: str  # 'add_shape', 'modify_text', 'format_shape', 'move_shape'
     slide_index: int
@@ -45,10 +46,8 @@ class PowerPointBatchOptimizer:
 
     def _group_by_slide(self) -> Dict[int, List[PowerPointOperation]]:
         """按幻灯片分组"""
-        groups = {}
+        groups = defaultdict(list)
         for op in self.operations:
-            if op.slide_index not in groups:
-                groups[op.slide_index] = []
             groups[op.slide_index].append(op)
         return groups
 
@@ -57,34 +56,41 @@ class PowerPointBatchOptimizer:
         if len(ops) <= 1:
             return [ops] if ops else []
 
+        # 同一类型的操作 (最常见的情况) 无需再按类型分组
+        first_type = ops[0].type
+        if all(op.type == first_type for op in ops):
+            return self._dispatch_type_batch(first_type, ops)
+
         # 按操作类型分组
-        type_groups = {}
+        type_groups = defaultdict(list)
         for op in ops:
-            if op.type not in type_groups:
-                type_groups[op.type] = []
             type_groups[op.type].append(op)
 
+        # 形状添加、文本修改、格式化操作依次在前, 其他操作类型按出现顺序在后
         batches = []
-
-        # 形状添加操作可以批量执行
-        if 'add_shape' in type_groups:
-            batches.extend(self._batch_shape_operations(type_groups['add_shape']))
-
-        # 文本修改操作按形状分组
-        if 'modify_text' in type_groups:
-            batches.extend(self._batch_text_operations(type_groups['modify_text']))
-
-        # 格式化操作可以批量执行
-        if 'format_shape' in type_groups:
-            batches.extend(self._batch_format_operations(type_groups['format_shape']))
-
-        # 其他操作类型
+        for op_type in ('add_shape', 'modify_text', 'format_shape'):
+            if op_type in type_groups:
+                batches.extend(self._dispatch_type_batch(op_type, type_groups.pop(op_type)))
         for op_type, type_ops in type_groups.items():
-            if op_type not in ['add_shape', 'modify_text', 'format_shape']:
-                batches.append(type_ops)
+            batches.extend(self._dispatch_type_batch(op_type, type_ops))
 
         return batches
 
+    def _dispatch_type_batch(self, op_type: str,
+                             ops: List[PowerPointOperation]) -> List[List[PowerPointOperation]]:
+        """按操作类型选择批处理方式"""
+        if op_type == 'add_shape':
+            # 形状添加操作可以批量执行
+            return self._batch_shape_operations(ops)
+        if op_type == 'modify_text':
+            # 文本修改操作按形状分组
+            return self._batch_text_operations(ops)
+        if op_type == 'format_shape':
+            # 格式化操作可以批量执行
+            return self._batch_format_operations(ops)
+        # 其他操作类型整体作为一批
+        return [ops]
+
     def _batch_shape_operations(self, ops: List[PowerPointOperation]) -> List[List[PowerPointOperation]]:
         """批量处理形状操作"""
         # 同一幻灯片的形状添加可以合并
@@ -100,25 +106,33 @@ class PowerPointBatchOptimizer:
     def _batch_text_operations(self, ops: List[PowerPointOperation]) -> List[List[PowerPointOperation]]:
         """批量处理文本操作"""
         # 按形状ID分组
-        shape_groups = {}
+        shape_groups = defaultdict(list)
         for op in ops:
-            if op.shape_id not in shape_groups:
-                shape_groups[op.shape_id] = []
             shape_groups[op.shape_id].append(op)
 
-        return [group for group in shape_groups.values()]
+        return list(shape_groups.values())
 
     def _batch_format_operations(self, ops: List[PowerPointOperation]) -> List[List[PowerPointOperation]]:
         """批量处理格式化操作"""
         # 相同格式的操作可以合并
-        format_groups = {}
+        format_groups = defaultdict(list)
         for op in ops:
-            format_key = str(sorted(op.options.items())) if op.options else 'default'
-            if format_key not in format_groups:
-                format_groups[format_key] = []
-            format_groups[format_key].append(op)
+            format_groups[self._format_key(op.options)].append(op)
+
+        return list(format_groups.values())
 
-        return [group for group in format_groups.values()]
+    @staticmethod
+    def _format_key(options: Dict[str, Any]) -> Hashable:
+        """格式化选项的分组键"""
+        if not options:
+            return 'default'
+        key = tuple(sorted(options.items()))
+        try:
+            hash(key)
+        except TypeError:
+            # 选项值中含有字典/列表等不可哈希对象时退回字符串形式
+            return str(key)
+        return key
 
     async def execute_batch(self, batch: List[PowerPointOperation], ppt_handler) -> Dict[str, Any]:
         """执行一批操作"""
@@ -136,10 +150,10 @@ class PowerPointBatchOptimizer:
             elif op_type == 'format_shape':
                 results = await self._execute_format_batch(batch, ppt_handler)
             else:
-                # 逐个执行其他类型操作
-                for op in batch:
-                    result = await self._execute_single_operation(op, ppt_handler)
-                    results.append(result)
+                # 其他类型操作逐个并发执行
+                results = list(await asyncio.gather(
+                    *(self._execute_single_operation(op, ppt_handler) for op in batch)
+                ))
 
             return {
                 "success": True,
@@ -169,21 +183,15 @@ class PowerPointBatchOptimizer:
                 'size': op.options.get('size', {})
             })
 
-        try:
-            if hasattr(ppt_handler, 'batch_add_shapes'):
-                result = await ppt_handler.batch_add_shapes(batch[0].slide_index, shapes_data)
-                results.append(result)
-            else:
-                # 回退到逐个执行
-                for op in batch:
-                    result = await ppt_handler.add_text_box(
-                        batch[0].slide_index,
-                        op.content or "",
-                        **op.options
-                    )
-                    results.append(result)
-        except Exception as e:
-            results.append({"success": False, "error": str(e)})
+        if hasattr(ppt_handler, 'batch_add_shapes'):
+            result = await ppt_handler.batch_add_shapes(batch[0].slide_index, shapes_data)
+            results.append(result)
+        else:
+            # 回退到逐个并发执行
+            results = await self._gather_results(
+                ppt_handler.add_text_box(batch[0].slide_index, op.content or "", **op.options)
+                for op in batch
+            )
 
         return results
 
@@ -192,27 +200,19 @@ class PowerPointBatchOptimizer:
         results = []
 
         # 按形状分组的文本更新
-        text_updates = {}
+        text_updates = defaultdict(list)
         for op in batch:
-            if op.shape_id not in text_updates:
-                text_updates[op.shape_id] = []
             text_updates[op.shape_id].append(op.content)
 
-        try:
-            if hasattr(ppt_handler, 'batch_update_text'):
-                result = await ppt_handler.batch_update_text(batch[0].slide_index, text_updates)
-                results.append(result)
-            else:
-                # 回退到逐个执行
-                for op in batch:
-                    result = await ppt_handler.update_shape_text(
-                        batch[0].slide_index,
-                        op.shape_id,
-                        op.content
-                    )
-                    results.append(result)
-        except Exception as e:
-            results.append({"success": False, "error": str(e)})
+        if hasattr(ppt_handler, 'batch_update_text'):
+            result = await ppt_handler.batch_update_text(batch[0].slide_index, text_updates)
+            results.append(result)
+        else:
+            # 回退到逐个并发执行
+            results = await self._gather_results(
+                ppt_handler.update_shape_text(batch[0].slide_index, op.shape_id, op.content)
+                for op in batch
+            )
 
         return results
 
@@ -228,24 +228,27 @@ class PowerPointBatchOptimizer:
                 'format': op.options or {}
             })
 
-        try:
-            if hasattr(ppt_handler, 'batch_format_shapes'):
-                result = await ppt_handler.batch_format_shapes(batch[0].slide_index, format_data)
-                results.append(result)
-            else:
-                # 回退到逐个执行
-                for op in batch:
-                    result = await ppt_handler.format_shape(
-                        batch[0].slide_index,
-                        op.shape_id,
-                        op.options or {}
-                    )
-                    results.append(result)
-        except Exception as e:
-            results.append({"success": False, "error": str(e)})
+        if hasattr(ppt_handler, 'batch_format_shapes'):
+            result = await ppt_handler.batch_format_shapes(batch[0].slide_index, format_data)
+            results.append(result)
+        else:
+            # 回退到逐个并发执行
+            results = await self._gather_results(
+                ppt_handler.format_shape(batch[0].slide_index, op.shape_id, op.options or {})
+                for op in batch
+            )
 
         return results
 
+    @staticmethod
+    async def _gather_results(coros) -> List[Dict]:
+        """并发执行回退路径的单个操作, 失败的操作记为错误结果而不中断其余操作"""
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        return [
+            {"success": False, "error": str(result)} if isinstance(result, Exception) else result
+            for result in results
+        ]
+
     async def _execute_single_operation(self, op: PowerPointOperation, ppt_handler) -> Dict:
         """执行单个操作"""
         try:
@@ -270,12 +273,16 @@ class PowerPointBatchOptimizer:
             return {"total_operations": 0, "batches": 0, "slides": 0}
 
         batches = self.optimize_operations()
-        slides = set(op.slide_index for op in self.operations)
+        slides = set()
+        operation_types = set()
+        for op in self.operations:
+            slides.add(op.slide_index)
+            operation_types.add(op.type)
 
         return {
             "total_operations": len(self.operations),
             "batches": len(batches),
             "slides": len(slides),
             "avg_batch_size": len(self.operations) / len(batches) if batches else 0,
-            "operation_types": list(set(op.type for op in self.operations))
+            "operation_types": list(operation_types)
         }
\ No newline at end of file
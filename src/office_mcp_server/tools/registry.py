@@ -0,0 +1,76 @@
+"""MCP 工具声明式注册模块.
+
+只做参数透传的工具不再逐个手写包装函数, 而是由
+(工具名, 处理器方法, 工具描述) 表统一生成。包装函数的签名和类型注解
+直接取自处理器方法, FastMCP 据此生成与手写版本一致的参数 schema。
+"""
+
+import asyncio
+import functools
+import inspect
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
+from typing import Any, Optional
+
+from fastmcp import FastMCP
+from loguru import logger
+
+ToolMethod = Callable[..., dict[str, Any]]
+ToolSpec = tuple[str, ToolMethod, str]
+
+
+def make_tool(
+    name: str,
+    method: ToolMethod,
+    description: str,
+    executor: Optional[Executor] = None,
+) -> Callable[..., Any]:
+    """根据处理器方法生成 MCP 工具函数.
+
+    Args:
+        name: 工具名称
+        method: 处理器的绑定方法 (参数即工具参数)
+        description: 工具描述
+        executor: 线程池 (可选). 指定时生成异步工具函数, 处理器方法在
+            线程池中执行, 耗时的文件 I/O 不会阻塞事件循环
+
+    Returns:
+        Callable: 可交给 ``mcp.tool()`` 注册的工具函数
+    """
+    # 日志模板在注册时生成一次, 调用时只填入文件名
+    log_template = f"MCP工具调用: {name}(filename={{}})"
+
+    if executor is None:
+
+        def tool(**kwargs: Any) -> dict[str, Any]:
+            logger.info(log_template, kwargs.get('filename'))
+            return method(**kwargs)
+
+    else:
+
+        async def tool(**kwargs: Any) -> dict[str, Any]:
+            logger.info(log_template, kwargs.get('filename'))
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, functools.partial(method, **kwargs))
+
+    tool.__name__ = tool.__qualname__ = name
+    tool.__doc__ = description
+    tool.__signature__ = inspect.signature(method)  # type: ignore[attr-defined]
+    tool.__annotations__ = dict(method.__annotations__)
+    return tool
+
+
+def register_tools(
+    mcp: FastMCP,
+    specs: Iterable[ToolSpec],
+    executor: Optional[Executor] = None,
+) -> None:
+    """按声明表批量注册 MCP 工具.
+
+    Args:
+        mcp: FastMCP 服务器实例
+        specs: (工具名, 处理器方法, 工具描述) 列表
+        executor: 线程池 (可选), 指定时注册为在线程池中执行的异步工具
+    """
+    for name, method, description in specs:
+        mcp.tool()(make_tool(name, method, description, executor))
@@ -0,0 +1,82 @@
+"""单元格引用解析模块.
+
+工具参数中的 'A1'、'A1:D10' 等引用会被反复解析, 这里使用预编译正则
+加 LRU 缓存, 相同引用只解析一次。
+"""
+
+import re
+import string
+from functools import lru_cache
+from itertools import product
+from typing import Optional
+
+from openpyxl.utils.cell import range_boundaries
+
+# 单元格引用 (允许 '$' 绝对引用标记)
+CELL_RE = re.compile(r"^\$?([A-Z]{1,3})\$?(\d+)$")
+
+# Excel 最大列号 (XFD)
+MAX_COLUMN = 16384
+
+# 列字母 -> 列号 的稠密查找表 ('A'..'ZZZ', 按 1..3 位字母顺序依次编号)
+COLUMN_INDEX: dict[str, int] = {
+    "".join(letters): index
+    for index, letters in enumerate(
+        (
+            letters
+            for width in (1, 2, 3)
+            for letters in product(string.ascii_uppercase, repeat=width)
+        ),
+        start=1,
+    )
+}
+
+RangeBounds = tuple[Optional[int], Optional[int], Optional[int], Optional[int]]
+
+
+@lru_cache(maxsize=4096)
+def parse_cell(ref: str) -> tuple[int, int]:
+    """解析单元格引用.
+
+    Args:
+        ref: 单元格引用 (如 'B2', 不区分大小写)
+
+    Returns:
+        tuple: (列号, 行号), 均从 1 开始
+
+    Raises:
+        ValueError: 引用格式无效
+    """
+    match = CELL_RE.match(ref.upper())
+    if not match:
+        raise ValueError(f"无效的单元格格式: {ref}")
+
+    col = COLUMN_INDEX[match.group(1)]
+    row = int(match.group(2))
+    if row < 1 or col > MAX_COLUMN:
+        raise ValueError(f"无效的单元格格式: {ref}")
+    return col, row
+
+
+@lru_cache(maxsize=4096)
+def parse_range(ref: str) -> RangeBounds:
+    """解析范围引用.
+
+    返回值顺序与 openpyxl ``range_boundaries`` 一致, 整行/整列引用
+    (如 'A:B'、'2:3') 中缺失的边界为 None。
+
+    Args:
+        ref: 范围引用 (如 'A1:D10'、'A1')
+
+    Returns:
+        tuple: (起始列, 起始行, 结束列, 结束行)
+
+    Raises:
+        ValueError: 引用格式无效
+    """
+    start, sep, end = ref.partition(":")
+    if CELL_RE.match(start.upper()) and (not sep or CELL_RE.match(end.upper())):
+        min_col, min_row = parse_cell(start)
+        max_col, max_row = parse_cell(end) if sep else (min_col, min_row)
+        return min_col, min_row, max_col, max_row
+    return range_boundaries(ref.upper())
@@ -0,0 +1,364 @@
+"""文档对象缓存模块.
+
+在同一进程内复用已解析的 Office 文档对象 (openpyxl Workbook 等),
+避免连续多次工具调用反复解析同一文件的 ZIP/XML。
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Generic, Optional, TypeVar, Union
+
+from loguru import logger
+
+T = TypeVar("T")
+
+# 文件状态戳: (修改时间纳秒, 文件大小)
+FileStamp = tuple[int, int]
+
+
+# 文件锁: 路径 -> 锁。缓存写盘与直接读取文件的操作 (导出、复制、备份等,
+# 可能在线程池中执行) 共用, 后者不会读到写了一半的文件
+_file_locks: dict[str, threading.RLock] = {}
+_file_locks_guard = threading.Lock()
+
+
+def file_lock(file_path: Union[str, Path]) -> threading.RLock:
+    """获取文件对应的锁 (同一路径总是返回同一把锁).
+
+    需要同时持有缓存内部锁时, 必须先取文件锁, 避免死锁。
+    """
+    key = str(Path(file_path).resolve())
+    with _file_locks_guard:
+        lock = _file_locks.get(key)
+        if lock is None:
+            lock = _file_locks[key] = threading.RLock()
+        return lock
+
+
+def _file_stamp(file_path: Path) -> FileStamp:
+    """获取文件状态戳."""
+    stat = file_path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+class DocumentCache(Generic[T]):
+    """按 (路径, 修改时间, 大小) 复用已解析文档的 LRU 缓存.
+
+    采用"借出/归还"模型:
+    - load() 命中时把对象从缓存中取出, 同一对象不会同时被两个调用方修改;
+    - save() 写盘后把对象连同新的文件状态戳放回缓存;
+    - release() 供只读操作归还未修改的对象。
+    操作中途失败的对象不会被归还, 因此缓存中的对象始终与磁盘内容一致。
+    写入默认同步落盘, 写盘时持有 file_lock(); 直接读取文件的工具应在
+    reading() 中读取, 不会读到写了一半的文件。
+
+    begin() 开启的编辑会话中, save() 只记录待写盘的对象, 后续 load() 借出
+    该对象, 直到 flush()/end() 时才写盘一次; 会话期间磁盘上仍是旧内容。
+    会话中的操作应在 exclusive() 中执行: 同一文件的操作串行执行, 借出的待写盘
+    对象未被 save()/release() 交还 (操作失败, 对象可能已被改动一半) 时中止会话。
+    """
+
+    def __init__(self, loader: Callable[[str], T], maxsize: int = 8) -> None:
+        """初始化缓存.
+
+        Args:
+            loader: 从文件路径解析文档的函数
+            maxsize: 最大缓存文档数 (0 表示禁用缓存)
+        """
+        self._loader = loader
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[T, FileStamp]] = OrderedDict()
+        # 按 id 记录 (python-pptx 的 Presentation 等对象不可哈希), 对象回收时自动移除
+        self._stamps: dict[int, FileStamp] = {}
+        # 编辑会话: 路径 -> 尚未写盘的文档 (None 表示会话中暂无未写盘的修改)
+        self._sessions: dict[str, Optional[T]] = {}
+        # 会话中被操作借出、尚未交还的待写盘文档
+        self._borrowed: dict[str, T] = {}
+        # 会话操作锁, 同一文件的会话操作串行执行
+        self._session_locks: dict[str, threading.RLock] = {}
+        # 因操作失败而中止的会话
+        self._aborted: set[str] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, file_path: Union[str, Path]) -> T:
+        """加载文档, 文件未变化时直接取出缓存对象.
+
+        Args:
+            file_path: 文件路径
+
+        Returns:
+            解析后的文档对象
+        """
+        path = Path(file_path)
+        key = str(path.resolve())
+        stamp = _file_stamp(path)
+
+        with self._lock:
+            pending = self._borrow_pending(key)
+            if pending is not None:
+                self.hits += 1
+                return pending
+            entry = self._entries.pop(key, None)
+            if entry is not None and entry[1] == stamp:
+                self.hits += 1
+                self._remember(entry[0], stamp)
+                return entry[0]
+            self.misses += 1
+
+        doc = self._loader(str(path))
+        self._remember(doc, stamp)
+        return doc
+
+    def lookup(self, file_path: Union[str, Path]) -> Optional[T]:
+        """仅在缓存命中时取出文档, 未命中时不解析文件.
+
+        Args:
+            file_path: 文件路径
+
+        Returns:
+            缓存的文档对象, 未命中时返回 None
+        """
+        path = Path(file_path)
+        key = str(path.resolve())
+        stamp = _file_stamp(path)
+
+        with self._lock:
+            pending = self._borrow_pending(key)
+            if pending is not None:
+                self.hits += 1
+                return pending
+            entry = self._entries.get(key)
+            if entry is None or entry[1] != stamp:
+                return None
+            del self._entries[key]
+            self.hits += 1
+        self._remember(entry[0], stamp)
+        return entry[0]
+
+    def save(self, doc: T, file_path: Union[str, Path]) -> None:
+        """保存文档并放回缓存.
+
+        Args:
+            doc: 文档对象
+            file_path: 保存路径
+        """
+        path = Path(file_path)
+        key = str(path.resolve())
+        with self._lock:
+            if key in self._sessions:
+                # 编辑会话中只记录修改, 提交时统一写盘
+                self._sessions[key] = doc
+                self._borrowed.pop(key, None)
+                return
+        with file_lock(path):
+            doc.save(str(path))  # type: ignore[attr-defined]
+            stamp = _file_stamp(path)
+        self._store(key, doc, stamp)
+
+    def release(self, doc: T, file_path: Union[str, Path]) -> None:
+        """归还未修改的文档 (只读操作使用).
+
+        Args:
+            doc: load() 取得的文档对象
+            file_path: 文件路径
+        """
+        path = Path(file_path)
+        key = str(path.resolve())
+        with self._lock:
+            # 会话中未写盘的对象交还给会话, 不能作为与磁盘一致的缓存放回
+            if self._borrowed.get(key) is doc:
+                del self._borrowed[key]
+                self._sessions[key] = doc
+                return
+        stamp = self._stamps.get(id(doc))
+        try:
+            current = _file_stamp(path)
+        except OSError:
+            return
+        # 借出期间文件被其他进程修改过, 对象已过期
+        if stamp is not None and stamp == current:
+            self._store(str(path.resolve()), doc, current)
+
+    def begin(self, file_path: Union[str, Path]) -> bool:
+        """开启编辑会话, 会话期间的 save() 延迟到提交时统一写盘.
+
+        Args:
+            file_path: 文件路径
+
+        Returns:
+            bool: 是否新开启 (已在会话中时返回 False)
+        """
+        key = str(Path(file_path).resolve())
+        with self._lock:
+            if key in self._sessions:
+                return False
+            self._sessions[key] = None
+            self._session_locks[key] = threading.RLock()
+            self._aborted.discard(key)
+            return True
+
+    def in_session(self, file_path: Union[str, Path]) -> bool:
+        """判断文件是否处于编辑会话中."""
+        with self._lock:
+            return str(Path(file_path).resolve()) in self._sessions
+
+    def flush(self, file_path: Union[str, Path]) -> bool:
+        """把会话中未写盘的修改写入磁盘, 会话保持开启.
+
+        直接读写文件 (而非通过本缓存) 的操作应先调用此方法。
+
+        Args:
+            file_path: 文件路径
+
+        Returns:
+            bool: 是否执行了写盘
+        """
+        path = Path(file_path)
+        key = str(path.resolve())
+        with file_lock(path), self._lock:
+            doc = self._sessions.get(key)
+            if doc is None:
+                return False
+            # 持锁写盘, 避免其他调用在写盘完成前读到旧文件
+            doc.save(str(path))  # type: ignore[attr-defined]
+            self._sessions[key] = None
+            stamp = _file_stamp(path)
+        self._store(key, doc, stamp)
+        return True
+
+    def end(self, file_path: Union[str, Path], commit: bool = True) -> bool:
+        """结束编辑会话.
+
+        Args:
+            file_path: 文件路径
+            commit: True 时写入未写盘的修改, False 时丢弃
+
+        Returns:
+            bool: 是否执行了写盘
+        """
+        saved = self.flush(file_path) if commit else False
+        key = str(Path(file_path).resolve())
+        with self._lock:
+            self._sessions.pop(key, None)
+            self._borrowed.pop(key, None)
+            self._session_locks.pop(key, None)
+            self._aborted.discard(key)
+        return saved
+
+    @contextmanager
+    def reading(self, file_path: Union[str, Path]) -> Iterator[None]:
+        """直接读取磁盘文件 (导出、复制等) 期间持有文件锁.
+
+        先写入会话中未写盘的修改, 读取期间本缓存 (及其他线程) 不会写入该文件。
+
+        Args:
+            file_path: 文件路径
+        """
+        self.flush(file_path)
+        with file_lock(file_path):
+            yield
+
+    @contextmanager
+    def exclusive(self, file_path: Union[str, Path]) -> Iterator[None]:
+        """在编辑会话中独占执行一次操作 (不在会话中时直接执行).
+
+        同一文件的会话操作串行执行, 不会同时改动待写盘的对象。操作结束时
+        (包括抛出异常) 借出的待写盘对象仍未交还, 说明操作中途失败且可能已改动
+        该对象, 此时中止会话并丢弃未写盘的修改, 磁盘上保持会话开始 (或上次
+        flush) 时的内容。
+
+        Args:
+            file_path: 文件路径
+        """
+        key = str(Path(file_path).resolve())
+        with self._lock:
+            lock = self._session_locks.get(key)
+        if lock is None:
+            yield
+            return
+
+        with lock:
+            try:
+                yield
+            finally:
+                with self._lock:
+                    failed = key in self._borrowed and key in self._sessions
+                if failed:
+                    self.end(key, commit=False)
+                    with self._lock:
+                        self._aborted.add(key)
+                    logger.warning(f"会话中的操作失败, 编辑会话已中止: {key}")
+
+    def aborted(self, file_path: Union[str, Path]) -> bool:
+        """判断文件的编辑会话是否因操作失败而中止 (重新 begin() 或 end() 后清除)."""
+        with self._lock:
+            return str(Path(file_path).resolve()) in self._aborted
+
+    def flush_all(self) -> None:
+        """写入所有会话中未写盘的修改 (进程退出时调用)."""
+        with self._lock:
+            keys = [key for key, doc in self._sessions.items() if doc is not None]
+        for key in keys:
+            try:
+                self.flush(key)
+            except Exception as e:
+                logger.error(f"编辑会话写盘失败: {key}: {e}")
+
+    def invalidate(self, file_path: Optional[Union[str, Path]] = None) -> None:
+        """使缓存失效.
+
+        Args:
+            file_path: 文件路径 (为 None 时清空全部缓存)
+        """
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(Path(file_path).resolve()), None)
+
+    def stats(self) -> dict[str, int]:
+        """获取缓存统计信息."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "pending": sum(doc is not None for doc in self._sessions.values()),
+            }
+
+    def _borrow_pending(self, key: str) -> Optional[T]:
+        """借出会话中待写盘的文档 (调用方持有 self._lock)."""
+        pending = self._sessions.get(key)
+        if pending is not None:
+            self._sessions[key] = None
+            self._borrowed[key] = pending
+        return pending
+
+    def _remember(self, doc: T, stamp: FileStamp) -> None:
+        """记录对象加载时对应的文件状态戳."""
+        key = id(doc)
+        if key not in self._stamps:
+            try:
+                weakref.finalize(doc, self._stamps.pop, key, None)
+            except TypeError:
+                return
+        self._stamps[key] = stamp
+
+    def _store(self, key: str, doc: T, stamp: FileStamp) -> None:
+        """写入缓存并按 LRU 淘汰."""
+        if self.maxsize <= 0:
+            return
+        self._remember(doc, stamp)
+        with self._lock:
+            self._entries[key] = (doc, stamp)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                evicted, _ = self._entries.popitem(last=False)
+                logger.debug(f"文档缓存淘汰: {evicted}")
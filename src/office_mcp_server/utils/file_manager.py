@@ -160,6 +160,42 @@ class FileManager:
         logger.info(f"文件复制成功: {src} -> {dst}")
         return dst_path
 
+    @staticmethod
+    def clone_file(src: Union[str, Path], dst: Union[str, Path]) -> Path:
+        """在内核中复制文件内容 (用于备份等大文件整体复制).
+
+        Linux 上使用 os.copy_file_range, 数据不经过用户态缓冲区, 在 Btrfs/XFS
+        等写时复制文件系统上直接共享数据块 (reflink); 不支持时回退到 shutil.copy。
+        不使用硬链接: 原文件会被原地覆盖保存, 硬链接的备份会随之改变。
+
+        Args:
+            src: 源文件路径
+            dst: 目标文件路径
+
+        Returns:
+            Path: 目标文件路径
+        """
+        src_path = Path(src)
+        dst_path = Path(dst)
+
+        if hasattr(os, "copy_file_range"):
+            try:
+                with open(src_path, "rb") as fsrc, open(dst_path, "wb") as fdst:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                shutil.copymode(src_path, dst_path)
+                return dst_path
+            except OSError as e:
+                # 旧内核不支持跨文件系统, 或文件系统不支持该调用
+                logger.debug("copy_file_range 不可用, 回退到普通复制: {}", e)
+
+        shutil.copy(src_path, dst_path)
+        return dst_path
+
     @staticmethod
     def move_file(src: Union[str, Path], dst: Union[str, Path]) -> Path:
         """移动文件.
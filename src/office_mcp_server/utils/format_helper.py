@@ -4,18 +4,27 @@
 """
 
 import re
+from functools import lru_cache
 from typing import Optional, Tuple, Union
 
 from loguru import logger
 
+# 预编译的格式校验模式
+_HEX_COLOR_RE = re.compile(r"^[0-9A-Fa-f]{6}$")
+_CELL_REF_RE = re.compile(r"^[A-Z]+\d+$")
+_RANGE_REF_RE = re.compile(r"^[A-Z]+\d+:[A-Z]+\d+$")
+
 
 class ColorUtils:
     """颜色工具类."""
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
         """将 HEX 颜色转换为 RGB.
 
+        同一调色板的颜色会被反复传入, 解析结果按原字符串缓存。
+
         Args:
             hex_color: HEX 颜色字符串 (如 '#FF0000' 或 'FF0000')
 
@@ -29,14 +38,14 @@ class ColorUtils:
         hex_color = hex_color.lstrip("#")
 
         # 验证格式
-        if not re.match(r"^[0-9A-Fa-f]{6}$", hex_color):
+        if not _HEX_COLOR_RE.match(hex_color):
             raise ValueError(f"无效的 HEX 颜色格式: {hex_color}")
 
         r = int(hex_color[0:2], 16)
         g = int(hex_color[2:4], 16)
         b = int(hex_color[4:6], 16)
 
-        logger.debug(f"HEX 转 RGB: #{hex_color} -> ({r}, {g}, {b})")
+        logger.debug("HEX 转 RGB: #{} -> ({}, {}, {})", hex_color, r, g, b)
         return (r, g, b)
 
     @staticmethod
@@ -60,7 +69,7 @@ class ColorUtils:
                 raise ValueError(f"{name} 值必须在 0-255 范围内,当前值: {value}")
 
         hex_color = f"#{r:02X}{g:02X}{b:02X}"
-        logger.debug(f"RGB 转 HEX: ({r}, {g}, {b}) -> {hex_color}")
+        logger.debug("RGB 转 HEX: ({}, {}, {}) -> {}", r, g, b, hex_color)
         return hex_color
 
     @staticmethod
@@ -74,7 +83,7 @@ class ColorUtils:
             bool: 是否为有效的 HEX 颜色
         """
         hex_color = hex_color.lstrip("#")
-        return bool(re.match(r"^[0-9A-Fa-f]{6}$", hex_color))
+        return bool(_HEX_COLOR_RE.match(hex_color))
 
     @staticmethod
     def validate_rgb_color(r: int, g: int, b: int) -> bool:
@@ -269,7 +278,7 @@ class FormatValidator:
         Raises:
             ValueError: 当单元格引用无效时
         """
-        if not re.match(r"^[A-Z]+\d+$", cell_ref.upper()):
+        if not _CELL_REF_RE.match(cell_ref.upper()):
             raise ValueError(f"无效的单元格引用: {cell_ref}")
         return True
 
@@ -286,6 +295,6 @@ class FormatValidator:
         Raises:
             ValueError: 当范围引用无效时
         """
-        if not re.match(r"^[A-Z]+\d+:[A-Z]+\d+$", range_ref.upper()):
+        if not _RANGE_REF_RE.match(range_ref.upper()):
             raise ValueError(f"无效的范围引用: {range_ref}")
         return True
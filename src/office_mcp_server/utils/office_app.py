@@ -0,0 +1,103 @@
+"""Office COM 应用实例复用模块.
+
+启动 PowerPoint 等 Office 应用需要数秒, 每次调用都创建实例再 Quit 会让导出等
+操作的大部分时间花在启动上。这里为每种应用保留一个实例反复使用, 进程退出时
+再关闭。COM 对象只能在创建它的线程 (单线程套间) 中使用, 而工具调用可能来自
+线程池中的任意线程, 因此所有 COM 调用都交给一个专用线程串行执行。
+"""
+
+import atexit
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any, Optional, TypeVar
+
+from loguru import logger
+
+R = TypeVar("R")
+
+
+def _is_alive(app: Any) -> bool:
+    """检查应用实例是否仍可用 (用户可能已手动关闭应用)."""
+    try:
+        app.Name  # noqa: B018 - 访问任意属性即可探测实例是否存活
+        return True
+    except Exception:
+        return False
+
+
+class OfficeApplication:
+    """在专用线程中持有并复用一个 Office COM 应用实例."""
+
+    def __init__(self, factory: Callable[[], Any], name: str) -> None:
+        """初始化.
+
+        Args:
+            factory: 创建应用实例的函数 (在专用线程中调用)
+            name: 专用线程名称
+        """
+        self._factory = factory
+        self._name = name
+        self._tasks: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def run(self, func: Callable[[Any], R]) -> R:
+        """在专用线程中以应用实例调用 func 并返回其结果.
+
+        实例在首次调用时创建, 已失效时重新创建。func 抛出的异常
+        (包括创建实例时的 ImportError 等) 原样传给调用方。
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._worker, name=self._name, daemon=True)
+                self._thread.start()
+            self._tasks.put((func, future))
+        return future.result()
+
+    def quit(self) -> None:
+        """退出应用实例并结束专用线程 (之后的调用会重新启动)."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            self._tasks.put((None, None))
+        thread.join()
+
+    def _worker(self) -> None:
+        """专用线程: 依次执行任务, 收到退出标记后关闭应用实例."""
+        app = None
+        while True:
+            func, future = self._tasks.get()
+            if func is None:
+                break
+            try:
+                if app is None or not _is_alive(app):
+                    app = self._factory()
+                future.set_result(func(app))
+            except BaseException as e:
+                future.set_exception(e)
+
+        if app is not None:
+            try:
+                app.Quit()
+            except Exception as e:
+                logger.warning(f"关闭 Office 应用实例失败: {e}")
+
+
+def _create_powerpoint() -> Any:
+    """创建 PowerPoint 应用实例 (需要 Windows 和 comtypes)."""
+    import comtypes
+    import comtypes.client
+
+    comtypes.CoInitialize()
+    powerpoint = comtypes.client.CreateObject("Powerpoint.Application")
+    powerpoint.Visible = 1
+    return powerpoint
+
+
+# 全局 PowerPoint 实例, 进程退出时关闭
+powerpoint_app = OfficeApplication(_create_powerpoint, "powerpoint-com")
+atexit.register(powerpoint_app.quit)
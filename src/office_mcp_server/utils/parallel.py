@@ -0,0 +1,83 @@
+"""多进程并行执行模块.
+
+批量处理多个文件时, 每个文件的解析、处理和保存相互独立且受 GIL 限制,
+这里用进程池并行执行。每个子进程启动时要重新导入处理模块 (约 0.5 秒),
+因此只有文件足够多、总量足够大时才并行, 否则直接串行。
+"""
+
+import multiprocessing
+import os
+import sys
+import types
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# 任务数少于该值时串行执行
+PARALLEL_MIN_ITEMS = 4
+
+# 输入文件总大小少于该值时串行执行. openpyxl/python-docx 解析压缩后的文件约
+# 0.1~0.5 MB/s, 低于该量时串行处理的耗时不超过子进程启动的开销
+PARALLEL_MIN_BYTES = 2 << 20
+
+
+def total_size(paths: Iterable[str]) -> int:
+    """计算文件总大小 (不存在的文件按 0 计)."""
+    total = 0
+    for path in paths:
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+    return total
+
+
+@contextmanager
+def _bare_main() -> Iterator[None]:
+    """临时替换 __main__ 模块.
+
+    spawn 方式启动的子进程会重新导入父进程的 __main__ (即服务入口, 包括
+    FastMCP、全部工具注册和 pandas/scipy 等), 而工作函数只需要其所在的
+    处理模块。启动子进程期间换成空模块, 子进程就不会导入服务入口。
+    """
+    main_module = sys.modules["__main__"]
+    sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        yield
+    finally:
+        sys.modules["__main__"] = main_module
+
+
+def map_in_processes(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = 0,
+    input_bytes: int = 0,
+) -> list[R]:
+    """按输入顺序返回 func(item) 的结果, 任务足够多、足够大时在进程池中并行执行.
+
+    Args:
+        func: 模块级函数 (需可被 pickle, 不能定义在 __main__ 中)
+        items: 任务参数 (需可被 pickle)
+        max_workers: 最大进程数 (0 表示按 CPU 核数, 1 表示串行)
+        input_bytes: 输入文件总大小, 少于 PARALLEL_MIN_BYTES 时串行执行
+
+    Returns:
+        list: 各任务结果
+    """
+    items = list(items)
+    workers = min(max_workers or os.cpu_count() or 1, len(items))
+    if workers < 2 or len(items) < PARALLEL_MIN_ITEMS or input_bytes < PARALLEL_MIN_BYTES:
+        return [func(item) for item in items]
+
+    # 服务进程中还有其他线程在运行, 使用 spawn 避免子进程继承被占用的锁
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        # 子进程在 submit 时启动
+        with _bare_main():
+            futures = [executor.submit(func, item) for item in items]
+        return [future.result() for future in futures]
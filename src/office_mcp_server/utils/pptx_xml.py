@@ -0,0 +1,538 @@
+"""pptx 幻灯片 XML 直接读取模块.
+
+只读取文本、标题和备注时, 不必用 python-pptx 加载整个演示文稿并为每个
+形状、段落、文本段创建代理对象: 这里直接在 ZIP 中按演示顺序定位幻灯片
+XML 部件, 用 lxml 解析后以预编译的 XPath 取出所需内容。取值规则与
+python-pptx 保持一致 (段落以换行连接, 软回车记为 '\\v')。
+
+只改动单张幻灯片或备注页时, 同样只改写该部件 (见 ``patch_slide_xml``);
+批量修改多张幻灯片时在一次写入中完成 (见 ``patch_slides_xml``、``patch_slide_edits``)。
+"""
+
+import posixpath
+import zipfile
+import zlib
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from lxml import etree
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.opc.spec import default_content_types
+from pptx.oxml import parse_xml
+from pptx.parts.image import Image, ImagePart
+from pptx.util import Length
+
+from office_mcp_server.utils.xlsx_patch import (
+    PartMutator,
+    part_relationships,
+    patch_package,
+    patch_part_xml,
+    rels_path,
+    serialize_xml,
+)
+
+_NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+}
+_OFFICE_DOCUMENT = f"{_NS['r']}/officeDocument"
+_NOTES_SLIDE = f"{_NS['r']}/notesSlide"
+_HYPERLINK = f"{_NS['r']}/hyperlink"
+
+# 幻灯片形状树中属于形状的子元素 (与 python-pptx 的 slide.shapes 一致)
+_SHAPE_TAGS = frozenset(
+    f"{{{_NS['p']}}}{name}"
+    for name in ("sp", "grpSp", "graphicFrame", "cxnSp", "pic", "contentPart")
+)
+_SP_TAG = f"{{{_NS['p']}}}sp"
+_PIC_TAG = f"{{{_NS['p']}}}pic"
+_GRP_SP_TAG = f"{{{_NS['p']}}}grpSp"
+_R_TAG = f"{{{_NS['a']}}}r"
+_BR_TAG = f"{{{_NS['a']}}}br"
+_FLD_TAG = f"{{{_NS['a']}}}fld"
+
+_SLIDE_IDS = etree.XPath("p:sldIdLst/p:sldId/@r:id", namespaces=_NS)
+_SHAPE_TREE = etree.XPath("p:cSld/p:spTree/*", namespaces=_NS)
+_PLACEHOLDER = etree.XPath("./*[1]/p:nvPr/p:ph", namespaces=_NS)
+_PARAGRAPHS = etree.XPath("p:txBody/a:p", namespaces=_NS)
+_RUN_TEXT = etree.XPath("string(a:t)", namespaces=_NS)
+_SHAPE_NAME = etree.XPath("string(./*[1]/p:cNvPr/@name)", namespaces=_NS)
+_SHAPE_LINK = etree.XPath("./*[1]/p:cNvPr/a:hlinkClick", namespaces=_NS)
+_RUN_LINKS = etree.XPath("p:txBody/a:p/a:r[a:rPr/a:hlinkClick/@r:id]", namespaces=_NS)
+_RUN_LINK_ID = etree.XPath("string(a:rPr/a:hlinkClick/@r:id)", namespaces=_NS)
+_VIDEO_FILE = etree.XPath("./p:nvPicPr/p:nvPr/a:videoFile", namespaces=_NS)
+_XFRM_OFF = etree.XPath("p:spPr/a:xfrm/a:off", namespaces=_NS)
+_XFRM_EXT = etree.XPath("p:spPr/a:xfrm/a:ext", namespaces=_NS)
+_BLIP_ID = etree.XPath("string(p:blipFill/a:blip/@r:embed)", namespaces=_NS)
+_R_ID = f"{{{_NS['r']}}}id"
+_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+_MEDIA_IMAGE_PREFIX = "ppt/media/image"
+
+
+class SlideXml:
+    """单张幻灯片的 XML 视图."""
+
+    __slots__ = ("_archive", "_media", "part", "root")
+
+    def __init__(
+        self,
+        archive: zipfile.ZipFile,
+        part: str,
+        media: Optional[dict[str, dict[str, str]]] = None,
+    ) -> None:
+        """初始化幻灯片 XML 视图.
+
+        Args:
+            archive: pptx ZIP 包
+            part: 幻灯片部件路径
+            media: 图片部件 -> 格式信息 的缓存 (同一演示文稿的各幻灯片共享)
+        """
+        self._archive = archive
+        self._media = {} if media is None else media
+        self.part = part
+        self.root = etree.fromstring(archive.read(part))
+
+    def shape_texts(self) -> list[str]:
+        """按文档顺序返回各文本形状 (p:sp) 的文本, 与 python-pptx 的 shape.text 一致."""
+        return [_shape_text(shape) for shape in _iter_shapes(self.root) if shape.tag == _SP_TAG]
+
+    def title(self) -> str:
+        """返回标题占位符 (idx 为 0) 的文本, 没有标题时返回空字符串."""
+        for shape in _iter_shapes(self.root):
+            placeholder = _placeholder(shape)
+            if placeholder is not None and int(placeholder.get("idx", "0")) == 0:
+                return _shape_text(shape)
+        return ""
+
+    def notes(self) -> Optional[str]:
+        """返回备注页正文占位符的文本, 幻灯片没有备注页时返回 None."""
+        notes_part = _notes_part(self._archive, self.part)
+        return None if notes_part is None else _notes_text(self._archive, notes_part)
+
+    def pictures(self) -> list[dict[str, Any]]:
+        """返回图片形状 (不含占位符和视频) 的位置、尺寸、名称及图片格式."""
+        pictures = []
+        rels = self._relationships()
+        for shape_idx, shape in enumerate(_iter_shapes(self.root)):
+            if shape.tag != _PIC_TAG or _placeholder(shape) is not None or _VIDEO_FILE(shape):
+                continue
+
+            off = _XFRM_OFF(shape)
+            ext = _XFRM_EXT(shape)
+            info: dict[str, Any] = {
+                "shape_index": shape_idx,
+                "left": int(off[0].get("x")) if off else None,
+                "top": int(off[0].get("y")) if off else None,
+                "width": int(ext[0].get("cx")) if ext else None,
+                "height": int(ext[0].get("cy")) if ext else None,
+                "name": _SHAPE_NAME(shape),
+            }
+
+            blip_id = _BLIP_ID(shape)
+            if blip_id and blip_id in rels:
+                info.update(self._image_format(rels[blip_id][1]))
+
+            pictures.append(info)
+        return pictures
+
+    def _image_format(self, image_part: str) -> dict[str, str]:
+        """返回图片部件的格式信息, 同一图片部件 (模板、徽标等) 只解压、识别一次."""
+        image_format = self._media.get(image_part)
+        if image_format is None:
+            try:
+                image = Image(self._archive.read(image_part), None)
+                image_format = {"content_type": image.content_type, "ext": image.ext}
+            except (KeyError, ValueError):
+                # 图片缺失或格式无法识别时只返回形状信息
+                image_format = {}
+            self._media[image_part] = image_format
+        return image_format
+
+    def hyperlinks(self) -> list[dict[str, Any]]:
+        """返回形状级单击超链接和文本段超链接, 按形状顺序排列."""
+        links = []
+        rels = self._relationships()
+        for shape_idx, shape in enumerate(_iter_shapes(self.root)):
+            if shape.tag == _GRP_SP_TAG:
+                continue
+            name = _SHAPE_NAME(shape)
+
+            shape_link = _SHAPE_LINK(shape)
+            if shape_link:
+                info = {
+                    "shape_index": shape_idx,
+                    "shape_name": name,
+                    "url": self._link_target(rels, shape_link[0].get(_R_ID)),
+                }
+                if shape.tag == _SP_TAG:
+                    info["text"] = _shape_text(shape)
+                links.append(info)
+
+            for run in _RUN_LINKS(shape) if shape.tag == _SP_TAG else ():
+                url = self._link_target(rels, _RUN_LINK_ID(run))
+                if url:
+                    links.append({
+                        "shape_index": shape_idx,
+                        "shape_name": name,
+                        "text": _RUN_TEXT(run),
+                        "url": url,
+                    })
+        return links
+
+    def _relationships(self) -> dict[str, tuple[str, str]]:
+        """读取幻灯片部件的关系."""
+        return part_relationships(self._archive, self.part)
+
+    def _link_target(self, rels: dict[str, tuple[str, str]], rel_id: Optional[str]) -> str:
+        """返回超链接地址, 与 python-pptx 一致: 外部链接原样返回, 内部跳转为相对路径."""
+        if not rel_id or rel_id not in rels:
+            return ""
+        rel_type, target = rels[rel_id]
+        if rel_type == _HYPERLINK:
+            return target
+        return posixpath.relpath(target, posixpath.dirname(self.part))
+
+
+def _iter_shapes(root: etree._Element) -> Iterator[etree._Element]:
+    """按文档顺序生成形状树中的形状元素."""
+    return (elm for elm in _SHAPE_TREE(root) if elm.tag in _SHAPE_TAGS)
+
+
+def _placeholder(shape: etree._Element) -> Optional[etree._Element]:
+    """返回形状的 p:ph 元素 (非占位符时为 None)."""
+    found = _PLACEHOLDER(shape)
+    return found[0] if found else None
+
+
+def _shape_text(shape: etree._Element) -> str:
+    """返回形状文本框的文本."""
+    return "\n".join(_paragraph_text(paragraph) for paragraph in _PARAGRAPHS(shape))
+
+
+def _paragraph_text(paragraph: etree._Element) -> str:
+    """返回段落文本 (文本段、域文本和软回车)."""
+    parts = []
+    for child in paragraph:
+        if child.tag == _R_TAG or child.tag == _FLD_TAG:
+            parts.append(_RUN_TEXT(child))
+        elif child.tag == _BR_TAG:
+            parts.append("\v")
+    return "".join(parts)
+
+
+def _notes_text(archive: zipfile.ZipFile, notes_part: str) -> str:
+    """返回备注页正文占位符的文本, 没有正文占位符时返回空字符串."""
+    notes_root = etree.fromstring(archive.read(notes_part))
+    for shape in _iter_shapes(notes_root):
+        placeholder = _placeholder(shape)
+        if placeholder is not None and placeholder.get("type") == "body":
+            return _shape_text(shape)
+    return ""
+
+
+def _notes_part(archive: zipfile.ZipFile, slide_part: str) -> Optional[str]:
+    """返回幻灯片备注页的部件路径, 没有备注页时返回 None."""
+    return next(
+        (
+            target
+            for rel_type, target in part_relationships(archive, slide_part).values()
+            if rel_type == _NOTES_SLIDE
+        ),
+        None,
+    )
+
+
+def _slide_parts(archive: zipfile.ZipFile) -> list[str]:
+    """按演示顺序返回各幻灯片的部件路径."""
+    presentation_part = next(
+        target
+        for rel_type, target in part_relationships(archive, "").values()
+        if rel_type == _OFFICE_DOCUMENT
+    )
+    presentation = etree.fromstring(archive.read(presentation_part))
+    rels = part_relationships(archive, presentation_part)
+    return [rels[rel_id][1] for rel_id in _SLIDE_IDS(presentation)]
+
+
+def _slide_part(archive: zipfile.ZipFile, slide_index: int) -> Optional[str]:
+    """返回指定幻灯片的部件路径, 索引超出范围时返回 None."""
+    parts = _slide_parts(archive)
+    return parts[slide_index] if -len(parts) <= slide_index < len(parts) else None
+
+
+def read_slide_notes(file_path: Union[str, Path], slide_index: int) -> Optional[str]:
+    """只读取单张幻灯片的备注文本 (不解析其他幻灯片).
+
+    Args:
+        file_path: pptx 文件路径
+        slide_index: 幻灯片索引
+
+    Returns:
+        Optional[str]: 备注文本 (没有备注页时为空字符串), 索引超出范围时返回 None
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        slide_part = _slide_part(archive, slide_index)
+        if slide_part is None:
+            return None
+        notes_part = _notes_part(archive, slide_part)
+        return "" if notes_part is None else _notes_text(archive, notes_part)
+
+
+def patch_slide_xml(
+    file_path: Union[str, Path], slide_index: int, mutate: PartMutator
+) -> bool:
+    """局部修改单张幻灯片的 XML 并原子替换原文件.
+
+    mutate 收到的是 python-pptx 的 oxml 元素 (可直接套用其文本框、字体等代理类),
+    因此修改结果与经由 Presentation 修改后保存的一致。
+
+    Args:
+        file_path: pptx 文件路径
+        slide_index: 幻灯片索引
+        mutate: 修改函数 (接收 p:sld 根元素)
+
+    Returns:
+        bool: 是否已修改 (索引超出范围或 mutate 返回 False 时文件保持不变)
+    """
+    return patch_part_xml(
+        file_path, lambda archive: _slide_part(archive, slide_index), mutate, parse_xml
+    )
+
+
+def patch_slide_edits(
+    file_path: Union[str, Path], edits: list[tuple[int, PartMutator]]
+) -> bool:
+    """依次对多张幻灯片执行修改, 只写入一次文件.
+
+    同一幻灯片只解析一次, 其上的多个修改按顺序作用于同一元素。
+
+    Args:
+        file_path: pptx 文件路径
+        edits: (幻灯片索引, 修改函数) 列表
+
+    Returns:
+        bool: 是否已修改 (任一索引超出范围或 mutate 返回 False 时文件保持不变)
+    """
+
+    def update(archive: zipfile.ZipFile) -> Optional[dict[str, bytes]]:
+        parts = _slide_parts(archive)
+        slides: dict[str, etree._Element] = {}
+        for slide_index, mutate in edits:
+            if not -len(parts) <= slide_index < len(parts):
+                return None
+            part = parts[slide_index]
+            if part not in slides:
+                slides[part] = parse_xml(archive.read(part))
+            if not mutate(slides[part]):
+                return None
+        return {part: serialize_xml(slide) for part, slide in slides.items()}
+
+    return patch_package(file_path, update)
+
+
+def patch_slides_xml(
+    file_path: Union[str, Path],
+    slide_indices: Optional[list[int]],
+    mutate: Callable[[etree._Element], None],
+) -> int:
+    """一次性修改多张幻灯片的 XML, 只写入一次文件.
+
+    超出范围的索引被忽略, 重复的索引对同一幻灯片重复调用 mutate。
+
+    Args:
+        file_path: pptx 文件路径
+        slide_indices: 幻灯片索引列表 (None 表示所有幻灯片)
+        mutate: 修改函数 (接收 p:sld 根元素)
+
+    Returns:
+        int: 处理的幻灯片数 (为 0 时文件保持不变)
+    """
+    processed = 0
+
+    def update(archive: zipfile.ZipFile) -> Optional[dict[str, bytes]]:
+        nonlocal processed
+        parts = _slide_parts(archive)
+        if slide_indices is not None:
+            parts = [parts[i] for i in slide_indices if i < len(parts)]
+
+        slides: dict[str, etree._Element] = {}
+        for part in parts:
+            if part not in slides:
+                slides[part] = parse_xml(archive.read(part))
+            mutate(slides[part])
+        processed = len(parts)
+        return {part: serialize_xml(slide) for part, slide in slides.items()} or None
+
+    patch_package(file_path, update)
+    return processed
+
+
+def patch_notes_xml(
+    file_path: Union[str, Path], slide_index: int, mutate: PartMutator
+) -> bool:
+    """局部修改单张幻灯片备注页的 XML 并原子替换原文件.
+
+    Args:
+        file_path: pptx 文件路径
+        slide_index: 幻灯片索引
+        mutate: 修改函数 (接收 p:notes 根元素)
+
+    Returns:
+        bool: 是否已修改 (幻灯片不存在、没有备注页或 mutate 返回 False 时文件保持不变)
+    """
+
+    def locate(archive: zipfile.ZipFile) -> Optional[str]:
+        slide_part = _slide_part(archive, slide_index)
+        return None if slide_part is None else _notes_part(archive, slide_part)
+
+    return patch_part_xml(file_path, locate, mutate, parse_xml)
+
+
+def add_picture_xml(
+    file_path: Union[str, Path],
+    slide_index: int,
+    image: Image,
+    left: Length,
+    top: Length,
+    width: Optional[Length] = None,
+) -> bool:
+    """在单张幻灯片上添加图片, 只改写该幻灯片、其关系文件和内容类型并追加图片部件.
+
+    结果与 python-pptx 的 ``shapes.add_picture`` 一致: 形状编号、名称、描述和缩放
+    规则相同, 包内已有相同内容的图片时复用该部件, 不再写入重复的图片。
+
+    Args:
+        file_path: pptx 文件路径
+        slide_index: 幻灯片索引
+        image: 图片
+        left: 左边距
+        top: 上边距
+        width: 宽度 (为 None 时使用图片原始尺寸, 否则按比例计算高度)
+
+    Returns:
+        bool: 是否已添加 (幻灯片索引超出范围时文件保持不变)
+    """
+
+    def update(archive: zipfile.ZipFile) -> Optional[dict[str, bytes]]:
+        slide_part = _slide_part(archive, slide_index)
+        if slide_part is None:
+            return None
+
+        parts: dict[str, bytes] = {}
+        image_part = _find_image_part(archive, image)
+        if image_part is None:
+            image_part = _next_image_part(archive, image.ext)
+            parts[image_part] = image.blob
+            parts["[Content_Types].xml"] = _add_content_type(
+                archive.read("[Content_Types].xml"), image_part, image.content_type
+            )
+
+        rels = etree.fromstring(archive.read(rels_path(slide_part)))
+        rel_id = _get_or_add_image_rel(rels, slide_part, image_part)
+        parts[rels_path(slide_part)] = serialize_xml(rels)
+
+        # ImagePart 只用于按 python-pptx 的规则计算尺寸和描述
+        scaler = ImagePart(
+            PackURI(f"/{image_part}"), image.content_type, None, image.blob, image.filename
+        )
+        cx, cy = scaler.scale(width, None)
+        slide = parse_xml(archive.read(slide_part))
+        shape_tree = slide.cSld.spTree
+        shape_id = shape_tree.max_shape_id + 1
+        shape_tree.add_pic(
+            shape_id, f"Picture {shape_id - 1}", scaler.desc, rel_id, left, top, cx, cy
+        )
+        parts[slide_part] = serialize_xml(slide)
+        return parts
+
+    return patch_package(file_path, update)
+
+
+def _find_image_part(archive: zipfile.ZipFile, image: Image) -> Optional[str]:
+    """返回包内内容相同的图片部件路径 (先比较目录中的 CRC 和大小, 再比较内容)."""
+    blob = image.blob
+    crc = zlib.crc32(blob)
+    for info in archive.infolist():
+        if (
+            info.filename.startswith(_MEDIA_IMAGE_PREFIX)
+            and info.file_size == len(blob)
+            and info.CRC == crc
+            and archive.read(info) == blob
+        ):
+            return info.filename
+    return None
+
+
+def _next_image_part(archive: zipfile.ZipFile, ext: str) -> str:
+    """返回下一个可用的图片部件路径 (与 python-pptx 一样优先使用空缺的序号)."""
+    used = {
+        PackURI(f"/{name}").idx
+        for name in archive.namelist()
+        if name.startswith(_MEDIA_IMAGE_PREFIX)
+    }
+    idx = next(i for i in range(1, len(used) + 2) if i not in used)
+    return f"{_MEDIA_IMAGE_PREFIX}{idx}.{ext}"
+
+
+def _get_or_add_image_rel(rels: etree._Element, slide_part: str, image_part: str) -> str:
+    """返回幻灯片到图片部件的关系 Id, 不存在时按 python-pptx 的编号规则新增."""
+    folder = posixpath.dirname(slide_part)
+    target = posixpath.relpath(image_part, folder)
+    used = set()
+    for rel in rels.iter(f"{{{_REL_NS}}}Relationship"):
+        used.add(rel.get("Id"))
+        if (
+            rel.get("Type") == RT.IMAGE
+            and rel.get("TargetMode") != "External"
+            and posixpath.normpath(posixpath.join(folder, rel.get("Target", ""))) == image_part
+        ):
+            return rel.get("Id")
+
+    rel_id = next(
+        f"rId{n}" for n in range(len(used) + 1, 0, -1) if f"rId{n}" not in used
+    )
+    etree.SubElement(
+        rels, f"{{{_REL_NS}}}Relationship", Id=rel_id, Type=RT.IMAGE, Target=target
+    )
+    return rel_id
+
+
+def _add_content_type(types_xml: bytes, part: str, content_type: str) -> bytes:
+    """为新部件登记内容类型 (扩展名已有相同的默认类型时不变)."""
+    types = etree.fromstring(types_xml)
+    ext = posixpath.splitext(part)[1][1:].lower()
+    defaults = {
+        default.get("Extension", "").lower(): default.get("ContentType")
+        for default in types.iter(f"{{{_CT_NS}}}Default")
+    }
+    if defaults.get(ext) == content_type:
+        return types_xml
+    if ext not in defaults and (ext, content_type) in default_content_types:
+        etree.SubElement(
+            types, f"{{{_CT_NS}}}Default", Extension=ext, ContentType=content_type
+        )
+    else:
+        etree.SubElement(
+            types, f"{{{_CT_NS}}}Override", PartName=f"/{part}", ContentType=content_type
+        )
+    return serialize_xml(types)
+
+
+@contextmanager
+def open_slides(file_path: Union[str, Path]) -> Iterator[list[SlideXml]]:
+    """按演示顺序打开所有幻灯片 XML.
+
+    Args:
+        file_path: pptx 文件路径
+
+    Yields:
+        list: 各幻灯片的 SlideXml (仅在上下文内可读取备注)
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        media: dict[str, dict[str, str]] = {}
+        yield [SlideXml(archive, part, media) for part in _slide_parts(archive)]
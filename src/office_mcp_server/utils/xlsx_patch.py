@@ -0,0 +1,228 @@
+"""xlsx 工作表 XML 局部修改模块.
+
+只改动单个工作表的少量属性 (页边距、冻结窗格等) 时, 不必用 openpyxl 解析
+整个工作簿 (样式、共享字符串、所有工作表) 再全部重新序列化: 这里直接在
+ZIP 中定位该工作表的 XML 部件, 用 lxml 修改后写入新 ZIP, 其余条目按压缩后的
+字节原样复制 (不解压、不重新压缩), 最后原子替换原文件。通用的 ``patch_part_xml`` 也用于 pptx 的单个
+幻灯片/备注页部件, ``patch_package`` 则可同时改写或新增多个部件。
+"""
+
+import copy
+import os
+import posixpath
+import re
+import shutil
+import struct
+import tempfile
+import zipfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+from lxml import etree
+
+# 工作表 XML 命名空间
+SHEET_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_DOC_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_OFFICE_DOCUMENT = f"{_DOC_REL_NS}/officeDocument"
+
+# 修改函数: 接收部件根元素, 返回 False 表示无法局部修改 (调用方应回退到完整的对象模型)
+PartMutator = Callable[[etree._Element], bool]
+SheetMutator = PartMutator
+
+# 部件定位函数: 返回要修改的部件路径, None 表示无法局部修改
+PartLocator = Callable[[zipfile.ZipFile], Optional[str]]
+
+# 单元格公式元素 <f> (可带命名空间前缀)
+_FORMULA_RE = re.compile(rb"<(?:\w+:)?f[\s/>]")
+
+
+def sheet_tag(name: str) -> str:
+    """返回工作表命名空间下的元素标签."""
+    return f"{{{SHEET_NS}}}{name}"
+
+
+def rels_path(part: str) -> str:
+    """获取部件对应的关系文件路径."""
+    folder, name = posixpath.split(part)
+    return posixpath.join(folder, "_rels", f"{name}.rels")
+
+
+def part_relationships(archive: zipfile.ZipFile, part: str) -> dict[str, tuple[str, str]]:
+    """读取部件的关系 (Id -> (类型, 目标部件路径), 外部目标保持原样)."""
+    root = etree.fromstring(archive.read(rels_path(part)))
+    folder = posixpath.dirname(part)
+    rels = {}
+    for rel in root.iter(f"{{{_REL_NS}}}Relationship"):
+        target = rel.get("Target", "")
+        if rel.get("TargetMode") == "External":
+            pass
+        elif target.startswith("/"):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(folder, target))
+        rels[rel.get("Id")] = (rel.get("Type"), target)
+    return rels
+
+
+def _copy_entry_raw(source: BinaryIO, info: zipfile.ZipInfo, output: zipfile.ZipFile) -> None:
+    """把条目的压缩数据原样追加到输出 ZIP.
+
+    zipfile 没有公开的原样复制接口, 这里按本地文件头定位压缩数据, 写入新的
+    本地文件头和数据后登记到输出 ZIP 的条目表, 关闭时由 zipfile 写出中央目录。
+    """
+    source.seek(info.header_offset)
+    header = source.read(zipfile.sizeFileHeader)
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    source.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+
+    entry = copy.copy(info)
+    # CRC 和大小直接写在本地文件头中, 不再使用数据描述符
+    entry.flag_bits &= ~0x08
+    entry.header_offset = output.fp.tell()
+    zip64 = max(entry.file_size, entry.compress_size) > zipfile.ZIP64_LIMIT
+    output.fp.write(entry.FileHeader(zip64))
+
+    remaining = entry.compress_size
+    while remaining:
+        chunk = source.read(min(remaining, 1 << 20))
+        if not chunk:
+            raise zipfile.BadZipFile(f"条目数据不完整: {entry.filename}")
+        output.fp.write(chunk)
+        remaining -= len(chunk)
+
+    output.filelist.append(entry)
+    output.NameToInfo[entry.filename] = entry
+    output.start_dir = output.fp.tell()
+    output._didModify = True
+
+
+def _find_sheet_part(archive: zipfile.ZipFile, sheet_name: str) -> str:
+    """根据工作表名称定位其 XML 部件路径.
+
+    Raises:
+        ValueError: 工作表不存在
+    """
+    workbook_part = next(
+        target
+        for rel_type, target in part_relationships(archive, "").values()
+        if rel_type == _OFFICE_DOCUMENT
+    )
+    workbook = etree.fromstring(archive.read(workbook_part))
+    for sheet in workbook.iter(sheet_tag("sheet")):
+        if sheet.get("name") == sheet_name:
+            rel_id = sheet.get(f"{{{_DOC_REL_NS}}}id")
+            return part_relationships(archive, workbook_part)[rel_id][1]
+    raise ValueError(f"工作表 '{sheet_name}' 不存在")
+
+
+def sheet_has_formulas(file_path: Union[str, Path], sheet_name: str) -> bool:
+    """判断工作表中是否有公式单元格 (只在 XML 文本中查找 <f> 元素, 不解析).
+
+    Raises:
+        ValueError: 工作表不存在
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        xml = archive.read(_find_sheet_part(archive, sheet_name))
+    return _FORMULA_RE.search(xml) is not None
+
+
+def patch_package(
+    file_path: Union[str, Path],
+    update: Callable[[zipfile.ZipFile], Optional[dict[str, bytes]]],
+) -> bool:
+    """局部改写 ZIP 包中的若干部件并原子替换原文件.
+
+    Args:
+        file_path: 文件路径
+        update: 更新函数, 返回 {部件路径: 新内容}, 不存在的部件追加为新条目;
+            返回 None 表示无法局部修改
+
+    Returns:
+        bool: 是否已修改 (update 返回 None 时文件保持不变)
+    """
+    path = Path(file_path)
+    with zipfile.ZipFile(path) as archive:
+        parts = update(archive)
+        if parts is None:
+            return False
+
+        # 写入同目录下的临时文件, 完成后再替换, 中途失败不会损坏原文件
+        fd, tmp_name = tempfile.mkstemp(suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as tmp_file, zipfile.ZipFile(tmp_file, "w") as output:
+                for info in archive.infolist():
+                    if info.filename not in parts:
+                        _copy_entry_raw(archive.fp, info, output)
+                        continue
+                    entry = zipfile.ZipInfo(info.filename, info.date_time)
+                    entry.compress_type = info.compress_type
+                    entry.external_attr = info.external_attr
+                    output.writestr(entry, parts[info.filename])
+                for name, data in parts.items():
+                    if name not in archive.NameToInfo:
+                        output.writestr(name, data, compress_type=zipfile.ZIP_DEFLATED)
+            shutil.copymode(path, tmp_name)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    os.replace(tmp_name, path)
+    return True
+
+
+def serialize_xml(root: etree._Element) -> bytes:
+    """按 Office 部件的惯例序列化 XML (带 standalone 声明)."""
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def patch_part_xml(
+    file_path: Union[str, Path],
+    locate: PartLocator,
+    mutate: PartMutator,
+    parse: Callable[[bytes], etree._Element] = etree.fromstring,
+) -> bool:
+    """局部修改 ZIP 包中单个 XML 部件并原子替换原文件.
+
+    Args:
+        file_path: 文件路径
+        locate: 部件定位函数
+        mutate: 修改函数 (接收部件根元素)
+        parse: XML 解析函数 (如 python-pptx 的 parse_xml, 以便复用其元素类)
+
+    Returns:
+        bool: 是否已修改 (无法定位部件或 mutate 返回 False 时文件保持不变)
+    """
+
+    def update(archive: zipfile.ZipFile) -> Optional[dict[str, bytes]]:
+        part = locate(archive)
+        if part is None:
+            return None
+        root = parse(archive.read(part))
+        if not mutate(root):
+            return None
+        return {part: serialize_xml(root)}
+
+    return patch_package(file_path, update)
+
+
+def patch_sheet_xml(
+    file_path: Union[str, Path], sheet_name: str, mutate: SheetMutator
+) -> bool:
+    """局部修改指定工作表的 XML 并原子替换原文件.
+
+    Args:
+        file_path: xlsx 文件路径
+        sheet_name: 工作表名称
+        mutate: 修改函数 (接收工作表根元素)
+
+    Returns:
+        bool: 是否已修改 (mutate 返回 False 时文件保持不变)
+
+    Raises:
+        ValueError: 工作表不存在
+    """
+    return patch_part_xml(
+        file_path, lambda archive: _find_sheet_part(archive, sheet_name), mutate
+    )
@@ -90,6 +90,29 @@ class TestPowerPointBatchOptimizer:
 
         assert result["success"] is True
 
+    @pytest.mark.asyncio
+    async def test_execute_text_batch_fallback(self):
+        optimizer = PowerPointBatchOptimizer()
+
+        class TextHandler:
+            async def update_shape_text(self, slide_index, shape_id, content):
+                if shape_id == 'bad':
+                    raise ValueError("shape not found")
+                return {"success": True, "shape_id": shape_id}
+
+        operations = [
+            PowerPointOperation('modify_text', 0, shape_id=shape_id, content='text')
+            for shape_id in ('s1', 'bad', 's2')
+        ]
+        result = await optimizer.execute_batch(operations, TextHandler())
+
+        assert result["success"] is True
+        assert result["results"] == [
+            {"success": True, "shape_id": 's1'},
+            {"success": False, "error": "shape not found"},
+            {"success": True, "shape_id": 's2'},
+        ]
+
     def test_get_stats(self):
         optimizer = PowerPointBatchOptimizer()
         optimizer.add_operation('add_shape', 0)
@@ -98,6 +121,22 @@ class TestPowerPointBatchOptimizer:
         stats = optimizer.get_stats()
         assert stats["total_operations"] == 2
         assert stats["slides"] == 2
+        # 修改返回值不影响之后的统计
+        stats["operation_types"].append('mutated')
+        assert 'mutated' not in optimizer.get_stats()["operation_types"]
+
+        # 直接替换或原地修改操作 (操作数不变) 后统计随之变化
+        optimizer.operations[-1] = PowerPointOperation('format_shape', 0)
+        stats = optimizer.get_stats()
+        assert stats["slides"] == 1
+        assert sorted(stats["operation_types"]) == ['add_shape', 'format_shape']
+        optimizer.operations[-1].slide_index = 4
+        assert optimizer.get_stats()["slides"] == 2
+
+        optimizer.add_operation('add_shape', 2)
+        assert optimizer.get_stats()["slides"] == 3
+        optimizer.clear()
+        assert optimizer.get_stats()["total_operations"] == 0
 
 
 class TestOperationQueue:
@@ -154,6 +193,169 @@ class TestOperationQueue:
         assert success is True
         assert queue.operations[op_id].status == OperationStatus.CANCELLED
 
+    @pytest.mark.asyncio
+    async def test_priority_order(self):
+        queue = OperationQueue(max_concurrent=0)  # 先全部入队
+        executed = []
+        mock_handler = Mock()
+        mock_handler.run = Mock(side_effect=executed.append)
+        queue.register_handler('test_handler', mock_handler)
+
+        op_ids = []
+        for name, priority in [("low", 1), ("high_a", 5), ("high_b", 5), ("mid", 3), ("dropped", 4)]:
+            op_ids.append(await queue.add_operation(
+                OperationType.EXCEL, 'test_handler', 'run', args=[name], priority=priority
+            ))
+        await queue.cancel_operation(op_ids[-1])
+
+        queue.max_concurrent = 1
+        queue._ensure_workers()
+        await queue.wait_for_all(op_ids[:-1], timeout=1.0)
+
+        assert executed == ["high_a", "high_b", "mid", "low"]
+        stats = queue.get_queue_stats()
+        assert (stats["pending"], stats["running"], stats["completed"]) == (0, 0, 4)
+
+        await queue.clear_completed()
+        assert queue.get_queue_stats()["completed"] == 0
+
+    def test_queue_survives_event_loop_change(self):
+        queue = OperationQueue(max_concurrent=1)
+        mock_handler = Mock()
+        mock_handler.run = Mock(side_effect=lambda name: name)
+        queue.register_handler('test_handler', mock_handler)
+
+        async def run(name):
+            op_id = await queue.add_operation(OperationType.EXCEL, 'test_handler', 'run', args=[name])
+            return await queue.wait_for_operation(op_id, timeout=1.0)
+
+        async def run_and_idle(name):
+            operation = await run(name)
+            # 工作协程执行完后阻塞在待执行队列上, 不应因队列属于旧事件循环而退出
+            await asyncio.sleep(0.01)
+            return operation, [worker.done() for worker in queue._workers]
+
+        first = asyncio.run(run("first"))
+        second, workers_done = asyncio.run(run_and_idle("second"))
+
+        assert (first.result, second.result) == ("first", "second")
+        assert workers_done == [False]
+
+    @pytest.mark.asyncio
+    async def test_cancel_compacts_pending_heap(self):
+        queue = OperationQueue(max_concurrent=0)  # 阻止自动执行
+        queue.register_handler('test_handler', Mock())
+
+        op_ids = await queue.add_batch_operations([
+            {'type': 'excel', 'handler': 'test_handler', 'method': 'test_method'}
+            for _ in range(100)
+        ])
+        for op_id in op_ids[:60]:
+            await queue.cancel_operation(op_id)
+
+        entries = list(queue._queue._queue)
+        assert len(entries) < 100
+        assert set(op_ids[60:]) <= {entry[2] for entry in entries}
+        assert queue.get_queue_stats()["pending"] == 40
+
+    @pytest.mark.asyncio
+    async def test_wait_for_cancelled_operation(self):
+        queue = OperationQueue(max_concurrent=0)  # 阻止自动执行
+        queue.register_handler('test_handler', Mock())
+
+        op_id = await queue.add_operation(OperationType.EXCEL, 'test_handler', 'test_method')
+
+        with pytest.raises(asyncio.TimeoutError):
+            await queue.wait_for_operation(op_id, timeout=0.05)
+        waiter = asyncio.create_task(queue.wait_for_operation(op_id))
+        await queue.cancel_operation(op_id)
+        operation = await asyncio.wait_for(waiter, timeout=1.0)
+
+        assert operation.status == OperationStatus.CANCELLED
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_running_and_pending(self):
+        queue = OperationQueue(max_concurrent=1)
+        started = []
+
+        class SlowHandler:
+            async def slow(self):
+                started.append(True)
+                await asyncio.sleep(10)
+
+        queue.register_handler('test_handler', SlowHandler())
+
+        op_ids = [
+            await queue.add_operation(OperationType.EXCEL, 'test_handler', 'slow')
+            for _ in range(3)
+        ]
+        waiter = asyncio.create_task(queue.wait_for_all(op_ids))
+        await asyncio.sleep(0)
+        await asyncio.wait_for(queue.shutdown(), timeout=1.0)
+        operations = await asyncio.wait_for(waiter, timeout=1.0)
+
+        assert all(op.status == OperationStatus.CANCELLED for op in operations)
+        assert len(started) == 1
+        assert queue.get_queue_stats()["total_operations"] == 0
+
+    @pytest.mark.asyncio
+    async def test_shutdown_grace_period(self):
+        queue = OperationQueue(max_concurrent=1)
+
+        class StubbornHandler:
+            async def stubborn(self):
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    await asyncio.sleep(10)
+
+        queue.register_handler('test_handler', StubbornHandler())
+        op_id = await queue.add_operation(OperationType.EXCEL, 'test_handler', 'stubborn')
+        operation = queue.operations[op_id]
+        await asyncio.sleep(0.01)
+        task = queue.running_operations[op_id]
+
+        await asyncio.wait_for(queue.shutdown(grace_period=0.05), timeout=1.0)
+
+        assert operation.status == OperationStatus.CANCELLED
+        assert not task.done()
+        task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_add_batch_operations(self):
+        queue = OperationQueue(max_concurrent=1)
+        executed = []
+        mock_handler = Mock()
+        mock_handler.run = Mock(side_effect=executed.append)
+        queue.register_handler('test_handler', mock_handler)
+
+        op_ids = await queue.add_batch_operations([
+            {'type': 'excel', 'handler': 'test_handler', 'method': 'run', 'args': [name], 'priority': priority}
+            for name, priority in [("low", 0), ("high", 9), ("mid", 5)]
+        ])
+        await queue.wait_for_all(op_ids, timeout=1.0)
+
+        assert len(op_ids) == 3
+        assert executed == ["high", "mid", "low"]
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded(self):
+        queue = OperationQueue(max_concurrent=0, max_history=2)  # 阻止自动执行
+        queue.register_handler('test_handler', Mock())
+
+        finished = [
+            await queue.add_operation(OperationType.EXCEL, 'test_handler', 'test_method')
+            for _ in range(3)
+        ]
+        pending = await queue.add_operation(OperationType.EXCEL, 'test_handler', 'test_method')
+        for op_id in finished:
+            await queue.cancel_operation(op_id)
+
+        assert finished[0] not in queue.operations
+        assert set(queue.operations) == {*finished[1:], pending}
+        stats = queue.get_queue_stats()
+        assert (stats["total_operations"], stats["pending"]) == (3, 1)
+
     def test_get_queue_stats(self):
         queue = OperationQueue()
         stats = queue.get_queue_stats()
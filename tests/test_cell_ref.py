@@ -0,0 +1,27 @@
+"""测试单元格引用解析."""
+
+import pytest
+
+from office_mcp_server.utils.cell_ref import parse_cell, parse_range
+
+
+def test_parse_cell() -> None:
+    """测试解析单元格引用."""
+    assert parse_cell("A1") == (1, 1)
+    assert parse_cell("b2") == (2, 2)
+    assert parse_cell("$AA$10") == (27, 10)
+    assert parse_cell("XFD1048576") == (16384, 1048576)
+
+
+def test_parse_cell_invalid() -> None:
+    """测试解析无效单元格引用."""
+    for ref in ("A0", "1A", "A", "A1:B2", "XFE1", "ZZZ1"):
+        with pytest.raises(ValueError):
+            parse_cell(ref)
+
+
+def test_parse_range() -> None:
+    """测试解析范围引用."""
+    assert parse_range("A1:D10") == (1, 1, 4, 10)
+    assert parse_range("C3") == (3, 3, 3, 3)
+    assert parse_range("A:B") == (1, None, 2, None)
@@ -0,0 +1,152 @@
+"""测试文档对象缓存."""
+
+from pathlib import Path
+
+from openpyxl import Workbook, load_workbook
+
+from office_mcp_server.utils.document_cache import DocumentCache
+
+
+def _create_workbook(path: Path, value: str) -> None:
+    """创建测试工作簿."""
+    wb = Workbook()
+    wb.active["A1"] = value
+    wb.save(str(path))
+
+
+def test_load_reuses_saved_workbook(tmp_path: Path) -> None:
+    """测试保存后再次加载直接复用缓存对象."""
+    path = tmp_path / "cache.xlsx"
+    _create_workbook(path, "原始")
+    cache = DocumentCache(load_workbook)
+
+    wb = cache.load(path)
+    wb.active["A1"] = "修改"
+    cache.save(wb, path)
+
+    assert cache.load(path) is wb
+    assert cache.stats()["hits"] == 1
+
+
+def test_load_detects_external_change(tmp_path: Path) -> None:
+    """测试文件被外部修改后重新解析."""
+    path = tmp_path / "cache.xlsx"
+    _create_workbook(path, "原始")
+    cache = DocumentCache(load_workbook)
+
+    wb = cache.load(path)
+    cache.save(wb, path)
+    _create_workbook(path, "外部修改后的内容")
+
+    reloaded = cache.load(path)
+    assert reloaded is not wb
+    assert reloaded.active["A1"].value == "外部修改后的内容"
+
+
+def test_unreleased_workbook_is_not_reused(tmp_path: Path) -> None:
+    """测试未归还的对象 (如操作失败) 不会被复用."""
+    path = tmp_path / "cache.xlsx"
+    _create_workbook(path, "原始")
+    cache = DocumentCache(load_workbook)
+
+    wb = cache.load(path)
+    cache.save(wb, path)
+    failed = cache.load(path)
+    failed.active["A1"] = "未保存的修改"
+
+    assert cache.load(path).active["A1"].value == "原始"
+
+
+def test_lru_eviction(tmp_path: Path) -> None:
+    """测试超过容量时淘汰最久未使用的对象."""
+    cache = DocumentCache(load_workbook, maxsize=1)
+    first, second = tmp_path / "a.xlsx", tmp_path / "b.xlsx"
+    _create_workbook(first, "a")
+    _create_workbook(second, "b")
+
+    cache.release(cache.load(first), first)
+    cache.release(cache.load(second), second)
+
+    assert cache.stats()["size"] == 1
+    cache.load(first)
+    assert cache.stats()["hits"] == 0
+
+
+def test_session_defers_save(tmp_path: Path) -> None:
+    """测试编辑会话中的保存延迟到提交时写盘, 丢弃时恢复磁盘内容."""
+    path = tmp_path / "cache.xlsx"
+    _create_workbook(path, "原始")
+    cache = DocumentCache(load_workbook)
+    cache.begin(path)
+
+    wb = cache.load(path)
+    wb.active["A1"] = "会话"
+    cache.save(wb, path)
+    cache.release(cache.load(path), path)
+
+    assert cache.load(path) is wb
+    cache.release(wb, path)
+    assert load_workbook(path).active["A1"].value == "原始"
+    assert cache.stats()["pending"] == 1
+    assert cache.end(path) is True
+    assert load_workbook(path).active["A1"].value == "会话"
+
+    cache.begin(path)
+    wb = cache.load(path)
+    wb.active["A1"] = "丢弃"
+    cache.save(wb, path)
+    assert cache.end(path, commit=False) is False
+    assert cache.load(path).active["A1"].value == "会话"
+
+
+def test_failed_session_operation_aborts_session(tmp_path: Path) -> None:
+    """测试会话中的操作失败 (借出的对象未交还) 时中止会话并丢弃未写盘的修改."""
+    path = tmp_path / "cache.xlsx"
+    _create_workbook(path, "原始")
+    cache = DocumentCache(load_workbook)
+    cache.begin(path)
+
+    with cache.exclusive(path):
+        wb = cache.load(path)
+        wb.active["A1"] = "会话"
+        cache.save(wb, path)
+
+    with cache.exclusive(path):
+        wb = cache.load(path)
+        wb.active["A1"] = "失败的操作改了一半"
+
+    assert cache.aborted(path) is True
+    assert cache.in_session(path) is False
+    assert cache.load(path).active["A1"].value == "原始"
+    assert cache.end(path) is False
+    assert cache.aborted(path) is False
+
+
+
+def test_reading_waits_for_save_and_flushes_session(tmp_path: Path) -> None:
+    """测试 reading() 读取前写入会话中的修改, 读取期间其他线程的写盘需等待."""
+    import threading
+
+    path = tmp_path / "cache.xlsx"
+    _create_workbook(path, "原始")
+    cache = DocumentCache(load_workbook)
+
+    cache.begin(path)
+    wb = cache.load(path)
+    wb.active["A1"] = "会话修改"
+    cache.save(wb, path)
+    with cache.reading(path):
+        assert load_workbook(str(path)).active["A1"].value == "会话修改"
+    cache.end(path)
+
+    wb = cache.load(path)
+    wb.active["A1"] = "并发修改"
+    saver = threading.Thread(target=cache.save, args=(wb, path))
+    with cache.reading(path):
+        saver.start()
+        saver.join(timeout=0.2)
+        assert saver.is_alive()
+        assert load_workbook(str(path)).active["A1"].value == "会话修改"
+    saver.join()
+
+    assert load_workbook(str(path)).active["A1"].value == "并发修改"
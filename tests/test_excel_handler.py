@@ -255,3 +255,608 @@ def test_invalid_file_extension(excel_handler: ExcelHandler) -> None:
     result = excel_handler.create_workbook("test.txt")
 
     assert result["success"] is False
+
+
+def test_import_from_csv(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试从CSV导入数据."""
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    csv_file = config.paths.output_dir / "test_import.csv"
+    csv_file.write_text("姓名,年龄\n张三,25\n李四,30,上海\n", encoding="utf-8")
+
+    try:
+        result = excel_handler.import_from_csv(test_filename, "Sheet1", csv_file.name)
+        read_result = excel_handler.read_range(test_filename, "Sheet1", "A1:C3")
+    finally:
+        csv_file.unlink()
+
+    assert result["success"] is True
+    assert result["rows"] == 3
+    assert read_result["data"][0][:2] == ["姓名", "年龄"]
+    assert read_result["data"][2] == ["李四", "30", "上海"]
+
+
+@pytest.mark.parametrize("start_cell", ["A1", "B2"])
+def test_import_from_csv_short_rows(
+    excel_handler: ExcelHandler, test_filename: str, start_cell: str
+) -> None:
+    """测试导入CSV时短行和空行缺少的字段不写入单元格."""
+    from openpyxl import load_workbook
+
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    csv_file = config.paths.output_dir / "test_import.csv"
+    csv_file.write_text("a,b,c\n1,,3\n4\n\n5,6,7\n", encoding="utf-8")
+
+    try:
+        result = excel_handler.import_from_csv(test_filename, "Sheet1", csv_file.name, start_cell)
+    finally:
+        csv_file.unlink()
+
+    wb = load_workbook(config.paths.output_dir / test_filename)
+    ws = wb["Sheet1"]
+    offset = 0 if start_cell == "A1" else 1
+    values = {
+        (row - offset, col - offset): cell.value for (row, col), cell in ws._cells.items()
+    }
+    wb.close()
+
+    assert result["rows"] == 5
+    assert values == {
+        (1, 1): "a", (1, 2): "b", (1, 3): "c",
+        (2, 1): "1", (2, 3): "3",
+        (3, 1): "4",
+        (5, 1): "5", (5, 2): "6", (5, 3): "7",
+    }
+
+
+def test_export_to_csv(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试导出为CSV."""
+    import csv
+
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    excel_handler.write_range(test_filename, "Sheet1", "A1", [["姓名", "年龄"], ["张,三", 25], [None, 1.5]])
+    csv_file = config.paths.output_dir / "test_export.csv"
+
+    try:
+        result = excel_handler.export_to_csv(test_filename, "Sheet1", csv_file.name)
+        with open(csv_file, encoding="utf-8-sig", newline="") as f:
+            exported = list(csv.reader(f))
+    finally:
+        csv_file.unlink(missing_ok=True)
+
+    assert result["success"] is True
+    assert exported == [["姓名", "年龄"], ["张,三", "25"], ["", "1.5"]]
+
+
+@pytest.mark.parametrize("rows", [
+    [("姓名", "年龄", "分数"), ("张三", 25, 1.5), (None, True, 2 ** 70), ("", -3, None)],
+    [("带,逗号", 1), ('带"引号', 2), ("换\n行", 3)],
+    [("单列",), (None,), ("值",)],
+    [],
+])
+def test_export_csv_same_with_and_without_pyarrow(
+    tmp_path: Path, rows: list[tuple], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """测试 pyarrow 与 csv 模块写出的CSV逐字节相同."""
+    pytest.importorskip("pyarrow")
+    from office_mcp_server.handlers.excel import excel_import_export
+
+    write = excel_import_export.ExcelImportExportOperations._write_csv_rows
+    write(rows, tmp_path / "arrow.csv")
+    monkeypatch.setattr(excel_import_export, "pa", None)
+    write(rows, tmp_path / "stdlib.csv")
+
+    assert (tmp_path / "arrow.csv").read_bytes() == (tmp_path / "stdlib.csv").read_bytes()
+
+
+def test_export_to_json(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试导出为JSON."""
+    import json
+
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    excel_handler.write_range(test_filename, "Sheet1", "A1", [["姓名", "年龄"], ["张三", 25]])
+    json_file = config.paths.output_dir / "test_export.json"
+
+    try:
+        result = excel_handler.export_to_json(test_filename, "Sheet1", json_file.name)
+        exported = json.loads(json_file.read_text(encoding="utf-8"))
+    finally:
+        json_file.unlink(missing_ok=True)
+
+    assert result["success"] is True
+    assert exported == [{"姓名": "张三", "年龄": 25}]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_export_to_json_with_and_without_orjson(
+    excel_handler: ExcelHandler, test_filename: str, use_orjson: bool,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """测试有无 orjson 时导出的JSON解析结果一致, NaN/Infinity 导出为 null."""
+    import json
+    from datetime import datetime
+
+    from office_mcp_server.handlers.excel import excel_import_export
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(excel_import_export, "orjson", None)
+
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    excel_handler.write_range(
+        test_filename, "Sheet1", "A1",
+        [[float("nan"), float("inf"), float("-inf"), 1e20, datetime(2024, 1, 2, 3, 4, 5)]],
+    )
+    json_file = config.paths.output_dir / "test_export.json"
+
+    try:
+        result = excel_handler.export_to_json(
+            test_filename, "Sheet1", json_file.name, has_header=False, orient="values"
+        )
+        exported = json.loads(json_file.read_text(encoding="utf-8"))
+    finally:
+        json_file.unlink(missing_ok=True)
+
+    assert result["success"] is True
+    assert exported == [[None, None, None, 1e20, "2024-01-02 03:04:05"]]
+
+
+def test_read_all_data(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试读取整表数据."""
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    excel_handler.write_range(test_filename, "Sheet1", "A1", [["A", "B"], [None, None], [1]])
+
+    result = excel_handler.read_all_data(test_filename, "Sheet1")
+    result_with_empty = excel_handler.read_all_data(test_filename, "Sheet1", include_empty=True)
+
+    assert result["success"] is True
+    assert result["data"] == [["A", "B"], [1, None]]
+    assert result_with_empty["data"] == [["A", "B"], [None, None], [1, None]]
+
+
+def test_apply_function(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试应用常用函数."""
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+
+    result = excel_handler.apply_function(
+        test_filename, "Sheet1", "C1", "vlookup", lookup_value="A1", table_array="D1:E9", col_index=2
+    )
+    missing = excel_handler.apply_function(test_filename, "Sheet1", "C2", "SUMIF", range1="A1:A9")
+
+    assert result["success"] is True
+    assert result["formula"] == "=VLOOKUP(A1,D1:E9,2,0)"
+    assert missing["success"] is False
+
+
+def test_sort_data_multi_keys(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试多列排序."""
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    excel_handler.write_range(test_filename, "Sheet1", "A1", [["b", 1], ["a", 2], ["b", 3], ["a", 1]])
+
+    result = excel_handler.sort_data(
+        test_filename,
+        "Sheet1",
+        "A1:B4",
+        sort_keys=[{"column": 0, "ascending": True}, {"column": 1, "ascending": False}],
+    )
+    read_result = excel_handler.read_range(test_filename, "Sheet1", "A1:B4")
+
+    assert result["success"] is True
+    assert read_result["data"] == [["a", 2], ["a", 1], ["b", 3], ["b", 1]]
+
+
+def test_format_range(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试批量格式化单元格范围."""
+    from openpyxl import load_workbook
+
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+
+    result = excel_handler.format_range(
+        test_filename, "Sheet1", "A1:C2", bold=True, bg_color="#FFFF00", border_style="thin"
+    )
+    ws = load_workbook(config.paths.output_dir / test_filename)["Sheet1"]
+
+    assert result["success"] is True
+    assert result["cell_count"] == 6
+    assert ws["C2"].font.bold is True
+    assert ws["A1"].fill.fgColor.rgb == "00FFFF00"
+    assert ws["B2"].border.left.style == "thin"
+
+
+def test_write_range_numeric(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试批量写入纯数值数据."""
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    excel_handler.write_cell(test_filename, "Sheet1", "B2", "旧值")
+
+    result = excel_handler.write_range(test_filename, "Sheet1", "A1", [[1, 2.5], [3, 4]])
+    read_result = excel_handler.read_range(test_filename, "Sheet1", "A1:B2")
+
+    assert result["success"] is True
+    assert read_result["data"] == [[1, 2.5], [3, 4]]
+
+
+def test_write_range_numeric_column_limit(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试纯数值数据超出最大列时写入失败."""
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+
+    result = excel_handler.write_range(test_filename, "Sheet1", "XFD1", [[1, 2]])
+
+    assert result["success"] is False
+    assert "最大列数" in result["message"]
+
+
+def test_moving_average_and_smoothing(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试移动平均与指数平滑."""
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    excel_handler.write_range(test_filename, "Sheet1", "A1", [[1], [2], [3], [4], [5]])
+
+    ma_result = excel_handler.moving_average(
+        test_filename, "Sheet1", "A1:A5", window=3, output_cell="AB1"
+    )
+    es_result = excel_handler.exponential_smoothing(test_filename, "Sheet1", "A1:A5", alpha=0.5)
+
+    assert ma_result["success"] is True
+    assert ma_result["moving_average"] == [None, None, 2.0, 3.0, 4.0]
+    assert es_result["success"] is True
+    assert es_result["smoothed_data"] == [1.0, 1.5, 2.25, 3.125, 4.0625]
+    assert excel_handler.read_cell(test_filename, "Sheet1", "AB2")["value"] is None
+    assert excel_handler.read_cell(test_filename, "Sheet1", "AB5")["value"] == 4.0
+
+
+def test_moving_average_and_smoothing_with_jit(
+    excel_handler: ExcelHandler, test_filename: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """测试大数据量时使用 numba 内核, 结果与小数据量实现一致."""
+    pytest.importorskip("numba")
+    from office_mcp_server.handlers.excel import excel_analysis
+
+    monkeypatch.setattr(excel_analysis, "_JIT_MIN_VALUES", 0)
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    excel_handler.write_range(test_filename, "Sheet1", "A1", [[1], [2], [3], [4], [5]])
+
+    ma_result = excel_handler.moving_average(test_filename, "Sheet1", "A1:A5", window=3)
+    es_result = excel_handler.exponential_smoothing(test_filename, "Sheet1", "A1:A5", alpha=0.5)
+
+    assert ma_result["moving_average"] == [None, None, 2.0, 3.0, 4.0]
+    assert es_result["smoothed_data"] == [1.0, 1.5, 2.25, 3.125, 4.0625]
+
+
+def test_regression_analysis(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试线性与多项式回归."""
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    rows = [[x, 2 * x + 1, x * x] for x in range(1, 6)]
+    excel_handler.write_range(test_filename, "Sheet1", "A1", rows)
+
+    linear = excel_handler.regression_analysis(test_filename, "Sheet1", "A1:A5", "B1:B5")
+    poly = excel_handler.regression_analysis(
+        test_filename, "Sheet1", "A1:A5", "C1:C5", regression_type="polynomial"
+    )
+
+    assert linear["success"] is True
+    assert linear["coefficient"] == pytest.approx(2.0)
+    assert linear["intercept"] == pytest.approx(1.0)
+    assert linear["r_squared"] == pytest.approx(1.0)
+    assert poly["success"] is True
+    assert poly["coefficients"] == pytest.approx([0.0, 0.0, 1.0], abs=1e-9)
+
+
+def test_analysis_reuses_cached_workbook(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试连续分析调用复用缓存的工作簿, 且超出数据区的范围不改变表格尺寸."""
+    from office_mcp_server.handlers.excel.excel_cache import workbook_cache
+
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    excel_handler.write_range(test_filename, "Sheet1", "A1", [[1], [2], [3]])
+    hits = workbook_cache.stats()["hits"]
+
+    excel_handler.descriptive_statistics(test_filename, "Sheet1", "A1:A1000")
+    excel_handler.trend_analysis(test_filename, "Sheet1", "A1:A1000")
+    info = excel_handler.get_workbook_info(test_filename)
+
+    assert workbook_cache.stats()["hits"] >= hits + 2
+    assert info["sheets"][0]["rows"] == 3
+
+
+def test_detect_sensitive_data(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试敏感数据分类检测."""
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    rows = [["13812345678"], ["abc@example.com"], ["110101199001011234"],
+            ["6222-0212-3456-7890"], ["普通文本"]]
+    excel_handler.write_range(test_filename, "Sheet1", "A1", rows)
+
+    result = excel_handler.detect_sensitive_data(test_filename, "Sheet1")
+    found = {key: [item["cell"] for item in items]
+             for key, items in result["sensitive_data"].items()}
+
+    assert result["success"] is True
+    assert found == {"phone": ["A1"], "email": ["A2"], "id_card": ["A3"], "credit_card": ["A4"]}
+
+
+def test_mask_data(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试数据脱敏 (重复值、单个单元格范围)."""
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    rows = [["13812345678"], ["13812345678"], ["123"], ["6222 0212 3456 7890"]]
+    excel_handler.write_range(test_filename, "Sheet1", "A1", rows)
+
+    phones = excel_handler.mask_data(test_filename, "Sheet1", "A1:A3", "phone")
+    card = excel_handler.mask_data(test_filename, "Sheet1", "A4", "credit_card")
+    data = excel_handler.read_range(test_filename, "Sheet1", "A1:A4")["data"]
+
+    assert phones["masked_count"] == 2
+    assert card["masked_count"] == 1
+    assert data == [["138****5678"], ["138****5678"], ["123"], ["6222 **** **** 7890"]]
+
+
+def test_consolidate_reports_keeps_file_order(
+    excel_handler: ExcelHandler, test_filename: str
+) -> None:
+    """测试多文件合并 (进程池并行读取) 后按源文件顺序输出."""
+    sources = [f"consolidate_src_{i}.xlsx" for i in range(4)]
+    try:
+        for i, source in enumerate(sources):
+            excel_handler.create_workbook(source, sheet_name="Sheet1")
+            excel_handler.write_range(source, "Sheet1", "A1", [["名称", "数值"], [f"项目{i}", i]])
+
+        result = excel_handler.consolidate_reports(
+            sources, test_filename, include_source_name=False
+        )
+        data = excel_handler.read_range(test_filename, "Consolidated", "A1:B5")["data"]
+
+        assert result["success"] is True
+        assert result["total_rows"] == 5
+        assert data == [["名称", "数值"]] + [[f"项目{i}", i] for i in range(4)]
+    finally:
+        for source in sources:
+            (config.paths.output_dir / source).unlink(missing_ok=True)
+
+
+def test_merge_workbooks(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试合并多个工作簿为多个工作表."""
+    sources = ["merge_src_a.xlsx", "merge_src_b.xlsx"]
+    try:
+        for i, source in enumerate(sources):
+            excel_handler.create_workbook(source, sheet_name="Data")
+            excel_handler.write_range(source, "Data", "A1", [["列1", "列2"], [i, None], ["x", 1.5]])
+
+        result = excel_handler.merge_workbooks(sources + ["missing.xlsx"], test_filename)
+        info = excel_handler.get_workbook_info(test_filename)
+        data = excel_handler.read_range(test_filename, "merge_src_b_Data", "A1:B3")["data"]
+
+        assert result["success"] is True
+        assert info["sheet_names"] == ["merge_src_a_Data", "merge_src_b_Data"]
+        assert data == [["列1", "列2"], [1, None], ["x", 1.5]]
+    finally:
+        for source in sources:
+            (config.paths.output_dir / source).unlink(missing_ok=True)
+
+
+def test_merge_workbooks_ignores_stale_dimension(
+    excel_handler: ExcelHandler, test_filename: str
+) -> None:
+    """测试源文件记录的 dimension 过期时仍合并全部数据."""
+    from office_mcp_server.utils.xlsx_patch import patch_sheet_xml, sheet_tag
+
+    def set_stale_dimension(root) -> bool:
+        root.find(sheet_tag("dimension")).set("ref", "A1")
+        return True
+
+    source = "merge_stale.xlsx"
+    try:
+        excel_handler.create_workbook(source, sheet_name="Data")
+        excel_handler.write_range(source, "Data", "A1", [[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        patch_sheet_xml(config.paths.output_dir / source, "Data", set_stale_dimension)
+
+        assert excel_handler.merge_workbooks([source], test_filename)["success"] is True
+        data = excel_handler.read_all_data(test_filename, "merge_stale_Data")["data"]
+        assert data == [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    finally:
+        (config.paths.output_dir / source).unlink(missing_ok=True)
+
+
+def test_merge_workbooks_closes_source_on_error(
+    excel_handler: ExcelHandler, test_filename: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """测试复制源工作表出错时仍关闭只读源工作簿."""
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+    from openpyxl.workbook.workbook import Workbook
+
+    closed = []
+    original_close = Workbook.close
+
+    def close(self: Workbook) -> None:
+        closed.append(self.read_only)
+        original_close(self)
+
+    def fail(self: ReadOnlyWorksheet, *args: object, **kwargs: object) -> None:
+        raise RuntimeError("读取失败")
+
+    excel_handler.create_workbook(test_filename, sheet_name="Data")
+    monkeypatch.setattr(Workbook, "close", close)
+    monkeypatch.setattr(ReadOnlyWorksheet, "iter_rows", fail)
+
+    result = excel_handler.merge_workbooks([test_filename], "merge_failed.xlsx")
+
+    assert result["success"] is False
+    assert closed == [True]
+
+
+def test_anova_and_t_test(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试方差分析与 t 检验."""
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    rows = [[1, 11, 21], [2, 12, 22], [3, 13, 23], [4, 14, 24]]
+    excel_handler.write_range(test_filename, "Sheet1", "A1", rows)
+
+    anova = excel_handler.anova_analysis(test_filename, "Sheet1", "A1:A4", "B1:B4", "C1:C4")
+    t_result = excel_handler.t_test(test_filename, "Sheet1", "A1:A4", "B1:B4")
+
+    assert anova["success"] is True
+    assert anova["group_means"] == [2.5, 12.5, 22.5]
+    assert anova["grand_mean"] == 12.5
+    assert bool(anova["significant"]) is True
+    assert t_result["success"] is True
+    assert t_result["t_statistic"] == pytest.approx(-10.954451150103322)
+
+
+def test_encrypt_workbook(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试工作簿加密后可用密码解密还原."""
+    import io
+
+    msoffcrypto = pytest.importorskip("msoffcrypto")
+
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    excel_handler.write_cell(test_filename, "Sheet1", "A1", "机密")
+    file_path = config.paths.output_dir / test_filename
+    original = file_path.read_bytes()
+    file_path.chmod(0o644)
+
+    result = excel_handler.encrypt_workbook(test_filename, "secret")
+
+    with open(file_path, "rb") as f:
+        office_file = msoffcrypto.OfficeFile(f)
+        office_file.load_key(password="secret")
+        decrypted = io.BytesIO()
+        office_file.decrypt(decrypted)
+
+    assert result["success"] is True
+    assert decrypted.getvalue() == original
+    assert file_path.stat().st_mode & 0o777 == 0o644
+
+
+def test_goal_seek(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试单变量求解."""
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    excel_handler.write_cell(test_filename, "Sheet1", "B1", 3)
+
+    result = excel_handler.goal_seek(test_filename, "Sheet1", "B1", 42.5, "B1")
+    unreachable = excel_handler.goal_seek(test_filename, "Sheet1", "B1", 5000, "B1")
+
+    assert result["success"] is True
+    assert result["solution"] == pytest.approx(42.5)
+    assert result["iterations"] < 20
+    assert excel_handler.read_cell(test_filename, "Sheet1", "B1")["value"] == pytest.approx(42.5)
+    assert unreachable["success"] is False
+
+
+def test_copy_and_move_rows(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试复制/移动行 (含向上复制)."""
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    excel_handler.write_range(test_filename, "Sheet1", "A1", [["a", 1], ["b", 2], ["c", 3]])
+
+    copied = excel_handler.copy_rows(test_filename, "Sheet1", 3, 1)
+    moved = excel_handler.move_cols(test_filename, "Sheet1", 2, 1)
+
+    assert copied["success"] is True
+    assert moved["success"] is True
+    data = excel_handler.read_all_data(test_filename, "Sheet1")["data"]
+    assert data == [[3, "c"], [1, "a"], [2, "b"], [3, "c"]]
+
+
+def test_analysis_reads_uncached_workbook_with_calamine(
+    excel_handler: ExcelHandler, test_filename: str
+) -> None:
+    """测试工作簿未缓存时用 python-calamine 读取分析数据."""
+    pytest.importorskip("python_calamine")
+    from office_mcp_server.handlers.excel.excel_cache import workbook_cache
+
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    excel_handler.write_range(test_filename, "Sheet1", "B2", [[1, "x"], [None, 4], [3, 5]])
+    workbook_cache.invalidate()
+
+    result = excel_handler.descriptive_statistics(test_filename, "Sheet1", "B1:B10")
+
+    assert result["success"] is True
+    assert result["statistics"]["count"] == 2
+    assert result["statistics"]["sum"] == 4
+    assert workbook_cache.stats()["size"] == 0
+
+
+def test_generate_report_from_template(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试基于模板生成报表 (模板文件本身不被修改)."""
+    template = "report_template.xlsx"
+    try:
+        excel_handler.create_workbook(template, sheet_name="Sheet1")
+        excel_handler.write_range(template, "Sheet1", "A1", [["{{title}}", "合计: {{total}}"]])
+
+        result = excel_handler.generate_report_from_template(
+            template, test_filename, {"title": "月报", "total": 42}
+        )
+
+        assert result["success"] is True
+        assert excel_handler.read_range(test_filename, "Sheet1", "A1:B1")["data"] == [["月报", "合计: 42"]]
+        assert excel_handler.read_cell(template, "Sheet1", "A1")["value"] == "{{title}}"
+    finally:
+        (config.paths.output_dir / template).unlink(missing_ok=True)
+
+
+def test_freeze_panes_and_margins_patch_sheet_xml(
+    excel_handler: ExcelHandler, test_filename: str
+) -> None:
+    """测试未缓存的工作簿直接修改工作表 XML 设置冻结窗格和页边距."""
+    from openpyxl import load_workbook
+
+    from office_mcp_server.handlers.excel.excel_cache import workbook_cache
+
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    excel_handler.write_range(test_filename, "Sheet1", "A1", [["名称", "数值"], ["a", 1]])
+    workbook_cache.invalidate()
+
+    frozen = excel_handler.freeze_panes(test_filename, "Sheet1", freeze_rows=1, freeze_cols=1)
+    margins = excel_handler.set_page_margins(test_filename, "Sheet1", left=0.5, top=0.8)
+    missing = excel_handler.freeze_panes(test_filename, "Missing", cell="B2")
+
+    ws = load_workbook(config.paths.output_dir / test_filename)["Sheet1"]
+    assert frozen["success"] is True
+    assert margins["success"] is True
+    assert missing["success"] is False
+    assert ws.freeze_panes == "B2"
+    assert (ws.page_margins.left, ws.page_margins.top) == (0.5, 0.8)
+    assert [[cell.value for cell in row] for row in ws.iter_rows()] == [["名称", "数值"], ["a", 1]]
+
+
+def test_batch_process_files(excel_handler: ExcelHandler, test_filename: str) -> None:
+    """测试批量处理按操作类型分派 (不支持的类型在处理前直接报错)."""
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+
+    result = excel_handler.batch_process_files(test_filename, "format", font_name="Arial")
+    unsupported = excel_handler.batch_process_files(test_filename, "unknown")
+
+    assert result["success"] is True
+    assert result["success_count"] == 1
+    assert unsupported["success"] is False
+
+
+def test_reads_do_not_grow_cached_workbook(
+    excel_handler: ExcelHandler, test_filename: str
+) -> None:
+    """测试读取已用区域之外的单元格不会撑大缓存中的工作簿."""
+    excel_handler.create_workbook(test_filename, sheet_name="数据")
+    excel_handler.write_cell(test_filename, "数据", "A1", "值")
+
+    assert excel_handler.read_cell(test_filename, "数据", "Z500")["value"] is None
+    assert excel_handler.read_row(test_filename, "数据", 9)["data"] == [None]
+    assert excel_handler.read_column(test_filename, "数据", 7)["data"] == [None]
+    assert excel_handler.read_range(test_filename, "数据", "A1:C3")["rows"] == 3
+    assert excel_handler.get_comment(test_filename, "数据", "D4")["text"] is None
+
+    info = excel_handler.get_workbook_info(test_filename)
+    assert info["sheets"] == [{"name": "数据", "rows": 1, "cols": 1}]
+    assert excel_handler.read_row(test_filename, "数据", 1)["data"] == ["值"]
+
+
+def test_statistics_same_with_and_without_cache(
+    excel_handler: ExcelHandler, test_filename: str
+) -> None:
+    """测试统计结果不受工作簿是否已缓存影响 (公式单元格一律跳过, 数值为 float)."""
+    from office_mcp_server.handlers.excel.excel_cache import workbook_cache
+
+    excel_handler.create_workbook(test_filename, sheet_name="Sheet1")
+    excel_handler.write_range(test_filename, "Sheet1", "A1", [[1], [2], [3], [4]])
+    excel_handler.write_cell(test_filename, "Sheet1", "A5", "=SUM(A1:A4)")
+
+    workbook_cache.invalidate()
+    uncached = excel_handler.descriptive_statistics(test_filename, "Sheet1", "A1:A5")
+    excel_handler.read_cell(test_filename, "Sheet1", "A1")
+    cached = excel_handler.descriptive_statistics(test_filename, "Sheet1", "A1:A5")
+
+    assert uncached["statistics"] == cached["statistics"]
+    assert cached["statistics"]["count"] == 4
+    assert type(cached["statistics"]["sum"]) is float
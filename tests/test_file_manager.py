@@ -35,3 +35,14 @@ def test_get_temp_file_path() -> None:
     temp_path = FileManager.get_temp_file_path(prefix="test_", suffix=".tmp")
     assert temp_path.name.startswith("test_")
     assert temp_path.suffix == ".tmp"
+
+
+def test_clone_file(tmp_path: Path) -> None:
+    """测试内核态复制文件 (备份与原文件互不影响)."""
+    src = tmp_path / "src.xlsx"
+    src.write_bytes(bytes(range(256)) * 5000)
+
+    dst = FileManager.clone_file(src, tmp_path / "dst.xlsx")
+    src.write_bytes(b"changed")
+
+    assert dst.read_bytes() == bytes(range(256)) * 5000
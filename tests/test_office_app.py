@@ -0,0 +1,59 @@
+"""测试 Office COM 应用实例复用."""
+
+import threading
+
+import pytest
+
+from office_mcp_server.utils.office_app import OfficeApplication
+
+
+class _FakeApp:
+    """模拟 Office 应用实例."""
+
+    def __init__(self) -> None:
+        self.alive = True
+        self.quit_called = False
+        self.thread = threading.current_thread()
+
+    @property
+    def Name(self) -> str:
+        if not self.alive:
+            raise RuntimeError("应用已关闭")
+        return "Fake"
+
+    def Quit(self) -> None:
+        self.quit_called = True
+
+
+def test_run_reuses_instance_in_dedicated_thread() -> None:
+    """测试多次调用复用同一实例, 且都在创建实例的线程中执行."""
+    created: list[_FakeApp] = []
+    office = OfficeApplication(lambda: created.append(_FakeApp()) or created[-1], "test-com")
+
+    first = office.run(lambda app: (app, threading.current_thread()))
+    second = office.run(lambda app: (app, threading.current_thread()))
+
+    assert len(created) == 1
+    assert first == second == (created[0], created[0].thread)
+    assert first[1] is not threading.current_thread()
+
+    office.quit()
+    assert created[0].quit_called
+
+
+def test_run_recreates_dead_instance_and_propagates_errors() -> None:
+    """测试实例失效后重新创建, 调用中的异常原样抛出."""
+    created: list[_FakeApp] = []
+    office = OfficeApplication(lambda: created.append(_FakeApp()) or created[-1], "test-com")
+
+    office.run(lambda app: None)
+    created[0].alive = False
+    assert office.run(lambda app: app) is created[1]
+
+    def fail(app: _FakeApp) -> None:
+        raise ValueError("导出失败")
+
+    with pytest.raises(ValueError, match="导出失败"):
+        office.run(fail)
+    assert office.run(lambda app: app) is created[1]
+    office.quit()
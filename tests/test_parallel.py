@@ -0,0 +1,43 @@
+"""测试多进程并行执行."""
+
+import os
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from office_mcp_server.utils import parallel
+from office_mcp_server.utils.parallel import map_in_processes
+
+
+def _worker_info(item: int) -> tuple[int, int]:
+    """返回 (输入, 进程号)."""
+    return item, os.getpid()
+
+
+def test_small_input_runs_serially() -> None:
+    """测试输入总量不足时在当前进程中串行执行."""
+    results = map_in_processes(_worker_info, range(6), max_workers=4, input_bytes=1024)
+
+    assert [item for item, _ in results] == list(range(6))
+    assert {pid for _, pid in results} == {os.getpid()}
+
+
+def test_large_input_runs_in_processes_without_main(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """测试输入足够大时在子进程中执行, 且子进程不导入父进程的 __main__ (服务入口)."""
+    marker = tmp_path / "main_imported"
+    script = tmp_path / "server.py"
+    script.write_text(f"open({str(marker)!r}, 'w').close()\n", encoding="utf-8")
+    main_module = types.ModuleType("__main__")
+    main_module.__file__ = str(script)
+    monkeypatch.setitem(sys.modules, "__main__", main_module)
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_BYTES", 0)
+
+    results = map_in_processes(_worker_info, range(6), max_workers=2)
+
+    assert [item for item, _ in results] == list(range(6))
+    assert os.getpid() not in {pid for _, pid in results}
+    assert not marker.exists()
@@ -216,3 +216,335 @@ def test_multiple_operations(ppt_handler: PowerPointHandler, test_filename: str)
     result = ppt_handler.get_presentation_info(test_filename)
     assert result["success"] is True
     assert result["slide_count"] >= 2
+
+
+def test_extract_text_titles_and_notes(ppt_handler: PowerPointHandler, test_filename: str) -> None:
+    """测试直接解析幻灯片 XML 提取文本、标题、备注和超链接."""
+    ppt_handler.create_presentation(test_filename, title="封面")
+    ppt_handler.add_slide(test_filename, layout_index=6)
+    ppt_handler.add_text(test_filename, slide_index=1, text="第一行\n第二行")
+    ppt_handler.add_speaker_notes(test_filename, slide_index=1, notes_text="备注内容")
+
+    result = ppt_handler.extract_all_text(test_filename)
+    assert result["success"] is True
+    assert result["total_slides"] == 2
+    assert "第一行\n第二行" in result["slide_texts"][1]["texts"]
+
+    titles = ppt_handler.extract_titles(test_filename)["titles"]
+    assert [item["title"] for item in titles] == ["封面", ""]
+
+    notes = ppt_handler.extract_notes(test_filename)["notes"]
+    assert [item["notes"] for item in notes] == ["", "备注内容"]
+    assert ppt_handler.get_speaker_notes(test_filename, 1)["notes_text"] == "备注内容"
+    assert ppt_handler.get_speaker_notes(test_filename, 0)["notes_text"] == ""
+    assert ppt_handler.get_speaker_notes(test_filename, 2)["success"] is False
+
+    ppt_handler.add_hyperlink(test_filename, slide_index=1, shape_index=0, url="https://example.com")
+    links = ppt_handler.extract_hyperlinks(test_filename)["hyperlinks"]
+    assert links
+    assert all(
+        (item["slide_index"], item["shape_index"], item["url"]) == (1, 0, "https://example.com")
+        for item in links
+    )
+
+    content = ppt_handler.extract_all_content(test_filename)
+    assert content["success"] is True
+    assert content["text"] == result
+    assert content["notes"]["notes"] == notes
+    assert content["hyperlinks"]["hyperlinks"] == links
+    assert content["images"]["total_images"] == 0
+
+
+def test_bulk_table_ops(ppt_handler: PowerPointHandler, test_filename: str) -> None:
+    """测试批量表格操作只保存一次且失败时不修改文件."""
+    ppt_handler.create_presentation(test_filename, title="测试")
+    file_path = config.paths.output_dir / test_filename
+
+    result = ppt_handler.bulk_table_ops(test_filename, [
+        {"kind": "add_table", "slide_index": 0, "rows": 2, "cols": 2, "data": [["a", "b"]]},
+        {"kind": "insert_row", "slide_index": 0, "table_index": 0, "row_index": 1,
+         "data": ["c", "d"]},
+        {"kind": "merge_cells", "slide_index": 0, "table_index": 0,
+         "start_row": 1, "start_col": 0, "end_row": 1, "end_col": 1},
+        {"kind": "format_cell", "slide_index": 0, "table_index": 0, "row": 0, "col": 0,
+         "fill_color": "#FF0000", "bold": True},
+    ])
+    assert result["success"] is True
+    assert result["operations"] == 4
+
+    from pptx import Presentation
+
+    shapes = Presentation(str(file_path)).slides[0].shapes
+    table = next(shape for shape in shapes if shape.has_table).table
+    assert len(table.rows) == 3
+    assert [table.cell(row, 0).text for row in range(3)] == ["a", "c\nd", ""]
+    assert table.cell(1, 0).is_merge_origin
+
+    before = file_path.read_bytes()
+    result = ppt_handler.bulk_table_ops(test_filename, [
+        {"kind": "insert_row", "slide_index": 0, "table_index": 0, "row_index": 3},
+        {"kind": "format_cell", "slide_index": 0, "table_index": 5, "row": 0, "col": 0},
+    ])
+    assert result["success"] is False
+    assert "第 2 个操作" in result["message"]
+    assert file_path.read_bytes() == before
+
+    assert ppt_handler.bulk_table_ops(test_filename, [{"kind": "delete_table"}])["success"] is False
+
+
+def test_operations_reuse_cached_presentation(
+    ppt_handler: PowerPointHandler, test_filename: str
+) -> None:
+    """测试连续操作复用缓存的演示文稿, 且每次修改仍然落盘."""
+    from pptx import Presentation
+
+    from office_mcp_server.handlers.ppt.ppt_cache import presentation_cache
+
+    ppt_handler.create_presentation(test_filename, title="测试")
+    hits = presentation_cache.stats()["hits"]
+
+    ppt_handler.add_slide(test_filename, layout_index=6)
+    ppt_handler.add_text(test_filename, slide_index=1, text="缓存")
+    info = ppt_handler.get_presentation_info(test_filename)
+
+    assert presentation_cache.stats()["hits"] >= hits + 3
+    assert info["slide_count"] == 2
+    prs = Presentation(str(config.paths.output_dir / test_filename))
+    assert len(prs.slides) == 2
+
+
+def test_edit_session_saves_once(ppt_handler: PowerPointHandler, test_filename: str) -> None:
+    """测试编辑会话中的修改延迟到提交时保存, 提取工具先自动写盘."""
+    ppt_handler.create_presentation(test_filename, title="测试")
+    file_path = config.paths.output_dir / test_filename
+    mtime = file_path.stat().st_mtime_ns
+
+    assert ppt_handler.begin_edit(test_filename)["success"] is True
+    ppt_handler.add_slide(test_filename, layout_index=6)
+    ppt_handler.add_text(test_filename, slide_index=1, text="会话")
+    ppt_handler.format_text(test_filename, slide_index=1, shape_index=0, bold=True)
+    ppt_handler.add_speaker_notes(test_filename, slide_index=1, notes_text="备注")
+
+    assert file_path.stat().st_mtime_ns == mtime
+    assert ppt_handler.get_presentation_info(test_filename)["slide_count"] == 2
+    assert ppt_handler.get_speaker_notes(test_filename, 1)["notes_text"] == "备注"
+
+    ppt_handler.add_slide(test_filename, layout_index=6)
+    result = ppt_handler.commit_edit(test_filename)
+    assert result["saved"] is True
+    assert ppt_handler.commit_edit(test_filename)["success"] is False
+
+    ppt_handler.begin_edit(test_filename)
+    ppt_handler.add_slide(test_filename, layout_index=6)
+    assert ppt_handler.commit_edit(test_filename, save=False)["saved"] is False
+
+    from pptx import Presentation
+
+    prs = Presentation(str(file_path))
+    assert len(prs.slides) == 3
+    assert ppt_handler.get_presentation_info(test_filename)["slide_count"] == 3
+
+
+def test_failed_operation_aborts_edit_session(
+    ppt_handler: PowerPointHandler, test_filename: str
+) -> None:
+    """测试编辑会话中的操作失败时中止会话, 失败操作的部分修改不会被保存."""
+    from pptx import Presentation
+
+    ppt_handler.create_presentation(test_filename, title="测试")
+    file_path = config.paths.output_dir / test_filename
+    before = file_path.read_bytes()
+
+    ppt_handler.begin_edit(test_filename)
+    ppt_handler.add_text(test_filename, slide_index=0, text="会话")
+    result = ppt_handler.bulk_table_ops(test_filename, [
+        {"kind": "add_table", "slide_index": 0, "rows": 2, "cols": 2},
+        {"kind": "format_cell", "slide_index": 0, "table_index": 5, "row": 0, "col": 0},
+    ])
+    assert result["success"] is False
+    assert result["session_aborted"] is True
+
+    result = ppt_handler.commit_edit(test_filename)
+    assert result["success"] is False
+    assert result["saved"] is False
+    assert file_path.read_bytes() == before
+    shapes = Presentation(str(file_path)).slides[0].shapes
+    assert not any(shape.has_table for shape in shapes)
+    assert ppt_handler.commit_edit(test_filename)["message"].startswith("未开启编辑会话")
+
+
+def test_export_html_returns_cached_presentation(
+    ppt_handler: PowerPointHandler, test_filename: str
+) -> None:
+    """测试导出 HTML 后归还缓存的演示文稿."""
+    from office_mcp_server.handlers.ppt.ppt_cache import presentation_cache
+
+    ppt_handler.create_presentation(test_filename, title="导出")
+    result = ppt_handler.export_presentation(test_filename, "html")
+    output_path = Path(result["output_file"])
+
+    try:
+        assert result["success"] is True
+        assert "导出" in output_path.read_text(encoding="utf-8")
+        hits = presentation_cache.stats()["hits"]
+        ppt_handler.get_presentation_info(test_filename)
+        assert presentation_cache.stats()["hits"] == hits + 1
+    finally:
+        output_path.unlink()
+
+
+def test_batch_transition_and_footer(ppt_handler: PowerPointHandler, test_filename: str) -> None:
+    """测试批量设置过渡效果和添加页脚."""
+    from pptx import Presentation
+    from pptx.oxml.ns import qn
+
+    ppt_handler.create_presentation(test_filename, title="测试")
+    ppt_handler.add_slide(test_filename, layout_index=6)
+
+    result = ppt_handler.batch_set_transition(test_filename, None, "push", 0.5)
+    assert result["slides_affected"] == 2
+    result = ppt_handler.batch_add_footer(test_filename, "页脚", [1, 1, 5])
+    assert result["slides_affected"] == 2
+    assert ppt_handler.batch_set_transition(test_filename, [0], "spin")["success"] is False
+
+    prs = Presentation(str(config.paths.output_dir / test_filename))
+    transitions = [slide._element.find(qn("p:transition")) for slide in prs.slides]
+    assert [t.get("advTm") for t in transitions] == ["500", "500"]
+    footers = [shape for shape in prs.slides[1].shapes if shape.text_frame.text == "页脚"]
+    assert [shape.name for shape in footers] == ["TextBox 1", "TextBox 2"]
+
+
+def test_set_transition_keeps_slide_child_order() -> None:
+    """测试过渡效果插在 clrMapOvr 之后、timing 之前, 且重复设置只保留一个."""
+    from pptx.oxml import parse_xml
+
+    from office_mcp_server.handlers.ppt.ppt_style import set_transition_xml
+
+    ns = "http://schemas.openxmlformats.org/presentationml/2006/main"
+    sld = parse_xml(
+        f'<p:sld xmlns:p="{ns}"><p:cSld/><p:clrMapOvr/><p:timing/><p:extLst/></p:sld>'
+    )
+    set_transition_xml(sld, "fade", 1.0)
+    set_transition_xml(sld, "push", 0.5)
+
+    children = [child.tag.split("}")[1] for child in sld]
+    assert children == ["cSld", "clrMapOvr", "transition", "timing", "extLst"]
+    assert sld[2].get("advTm") == "500"
+
+    sld = parse_xml(f'<p:sld xmlns:p="{ns}"><p:cSld/><p:timing/></p:sld>')
+    set_transition_xml(sld, "wipe", 1.0)
+    assert [child.tag.split("}")[1] for child in sld] == ["cSld", "transition", "timing"]
+
+
+def test_format_text_and_notes_patch_slide_xml(
+    ppt_handler: PowerPointHandler, test_filename: str
+) -> None:
+    """测试格式化文本和修改备注只改写单个部件, 且之后的缓存操作看到最新内容."""
+    from pptx import Presentation
+
+    ppt_handler.create_presentation(test_filename, title="测试")
+    ppt_handler.add_text(test_filename, slide_index=0, text="正文")
+    ppt_handler.add_speaker_notes(test_filename, slide_index=0, notes_text="旧备注")
+
+    result = ppt_handler.format_text(
+        test_filename, slide_index=0, shape_index=2, bold=True, color="#FF0000", alignment="center"
+    )
+    assert result["success"] is True
+    assert ppt_handler.add_speaker_notes(test_filename, 0, "新备注")["success"] is True
+    assert ppt_handler.format_text(test_filename, 0, 9)["success"] is False
+
+    ppt_handler.add_slide(test_filename, layout_index=6)
+
+    prs = Presentation(str(config.paths.output_dir / test_filename))
+    slide = prs.slides[0]
+    run = slide.shapes[2].text_frame.paragraphs[0].runs[0]
+    assert run.font.bold is True
+    assert str(run.font.color.rgb) == "FF0000"
+    assert slide.notes_slide.notes_text_frame.text == "新备注"
+    assert len(prs.slides) == 2
+
+
+def test_batch_format_text(ppt_handler: PowerPointHandler, test_filename: str) -> None:
+    """测试批量格式化文本一次写入, 任一项无效时文件保持不变."""
+    from pptx import Presentation
+
+    ppt_handler.create_presentation(test_filename, title="标题")
+    ppt_handler.add_text(test_filename, slide_index=0, text="正文")
+    file_path = config.paths.output_dir / test_filename
+
+    result = ppt_handler.batch_format_text(test_filename, [
+        {"slide_index": 0, "shape_index": 0, "bold": True},
+        {"slide_index": 0, "shape_index": 2, "color": "#00FF00", "font_size": 20},
+    ])
+    assert result["success"] is True
+    assert result["formatted"] == 2
+
+    content = file_path.read_bytes()
+    failed = ppt_handler.batch_format_text(test_filename, [
+        {"slide_index": 0, "shape_index": 0, "italic": True},
+        {"slide_index": 0, "shape_index": 9},
+    ])
+    assert failed["success"] is False
+    assert "第 2 项" in failed["message"]
+    assert ppt_handler.batch_format_text(test_filename, [{"slide_index": 0}])["success"] is False
+    assert file_path.read_bytes() == content
+
+    prs = Presentation(str(file_path))
+    shapes = prs.slides[0].shapes
+    assert shapes[0].text_frame.paragraphs[0].runs[0].font.bold is True
+    run = shapes[2].text_frame.paragraphs[0].runs[0]
+    assert str(run.font.color.rgb) == "00FF00"
+    assert run.font.size.pt == 20
+
+
+def test_add_image_reuses_image_part(ppt_handler: PowerPointHandler, test_filename: str) -> None:
+    """测试添加图片只追加一次相同内容的图片部件, 且尺寸与原始图片一致."""
+    import zipfile
+
+    from PIL import Image as PILImage
+    from pptx import Presentation
+
+    ppt_handler.create_presentation(test_filename, title="测试")
+    ppt_handler.add_slide(test_filename, layout_index=6)
+    image_path = config.paths.output_dir / "logo.png"
+    PILImage.new("RGB", (72, 36), (255, 0, 0)).save(image_path)
+    file_path = config.paths.output_dir / test_filename
+
+    try:
+        assert ppt_handler.add_image(test_filename, 0, str(image_path))["success"] is True
+        assert ppt_handler.add_image(test_filename, 1, str(image_path), 2.0, 2.0, 2.0)["success"]
+        assert ppt_handler.add_image(test_filename, 5, str(image_path))["success"] is False
+
+        with zipfile.ZipFile(file_path) as archive:
+            media = [name for name in archive.namelist() if name.startswith("ppt/media/")]
+        assert media == ["ppt/media/image1.png"]
+
+        prs = Presentation(str(file_path))
+        first = prs.slides[0].shapes[-1]
+        second = prs.slides[1].shapes[-1]
+        assert (first.width, first.height) == (914400, 457200)
+        assert (second.width, second.height) == (1828800, 914400)
+        assert first.image.sha1 == second.image.sha1
+
+        images = ppt_handler.extract_images(test_filename)["images"]
+        assert [image["slide_index"] for image in images] == [0, 1]
+        assert all(image["content_type"] == "image/png" for image in images)
+    finally:
+        image_path.unlink()
+
+
+def test_add_chart_category_indexes(ppt_handler: PowerPointHandler, test_filename: str) -> None:
+    """测试图表分类按顺序写入, 与分类数量无关."""
+    from pptx import Presentation
+
+    ppt_handler.create_presentation(test_filename, title="测试")
+    categories = [f"类别{i}" for i in range(500)]
+    result = ppt_handler.add_chart(
+        test_filename, 0, "line", categories, {"系列": [float(i) for i in range(500)]}
+    )
+    assert result["success"] is True
+
+    prs = Presentation(str(config.paths.output_dir / test_filename))
+    chart = next(shape for shape in prs.slides[0].shapes if shape.has_chart).chart
+    assert list(chart.plots[0].categories) == categories
+    assert list(chart.series[0].values) == [float(i) for i in range(500)]
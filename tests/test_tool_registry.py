@@ -0,0 +1,49 @@
+"""测试 MCP 工具声明式注册."""
+
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from office_mcp_server.tools.registry import make_tool
+
+
+class _DummyHandler:
+    """模拟处理器."""
+
+    def create_workbook(self, filename: str, sheet_name: Optional[str] = None) -> dict[str, Any]:
+        """创建工作簿."""
+        return {"success": True, "filename": filename, "sheet_name": sheet_name}
+
+
+def test_make_tool_copies_signature() -> None:
+    """测试生成的工具沿用处理器方法签名."""
+    handler = _DummyHandler()
+    tool = make_tool("create_excel_workbook", handler.create_workbook, "创建 Excel 工作簿.")
+
+    assert tool.__name__ == "create_excel_workbook"
+    assert tool.__doc__ == "创建 Excel 工作簿."
+    assert inspect.signature(tool) == inspect.signature(handler.create_workbook)
+    assert tool.__annotations__["sheet_name"] == Optional[str]
+
+
+def test_make_tool_forwards_arguments() -> None:
+    """测试生成的工具透传参数."""
+    tool = make_tool("create_excel_workbook", _DummyHandler().create_workbook, "创建 Excel 工作簿.")
+
+    result = tool(filename="test.xlsx", sheet_name="数据")
+
+    assert result == {"success": True, "filename": "test.xlsx", "sheet_name": "数据"}
+
+
+def test_make_tool_with_executor() -> None:
+    """测试指定线程池时生成异步工具."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        tool = make_tool(
+            "create_excel_workbook", _DummyHandler().create_workbook, "创建 Excel 工作簿.", executor
+        )
+
+        assert inspect.iscoroutinefunction(tool)
+        result = asyncio.run(tool(filename="test.xlsx"))
+
+    assert result == {"success": True, "filename": "test.xlsx", "sheet_name": None}
@@ -178,3 +178,95 @@ def test_invalid_file_extension(word_handler: WordHandler) -> None:
     result = word_handler.create_document("test.txt")
 
     assert result["success"] is False
+
+
+def test_format_paragraph_without_options_skips_save(
+    word_handler: WordHandler, test_filename: str
+) -> None:
+    """测试未给出任何格式参数时不重写文件, 索引仍被校验."""
+    word_handler.create_document(test_filename, content="正文")
+    file_path = config.paths.output_dir / test_filename
+    mtime = file_path.stat().st_mtime_ns
+
+    assert word_handler.format_paragraph(test_filename, 0)["success"] is True
+    assert word_handler.set_document_properties(test_filename)["success"] is True
+    assert word_handler.format_paragraph(test_filename, 9)["success"] is False
+    assert file_path.stat().st_mtime_ns == mtime
+
+    assert word_handler.format_paragraph(test_filename, 0, alignment="center")["success"]
+    assert file_path.stat().st_mtime_ns != mtime
+
+
+def test_set_document_properties_without_options_skips_core_properties(
+    word_handler: WordHandler, test_filename: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """测试未给出任何属性时不访问 core_properties (避免新建核心属性部件)."""
+    from docx.document import Document
+
+    word_handler.create_document(test_filename, content="正文")
+
+    def fail(self: Document) -> None:
+        raise AssertionError("不应访问 core_properties")
+
+    monkeypatch.setattr(Document, "core_properties", property(fail))
+
+    assert word_handler.set_document_properties(test_filename)["success"] is True
+    assert word_handler.set_document_properties(test_filename, title="标题")["success"] is False
+
+
+def test_operations_reuse_cached_document(word_handler: WordHandler, test_filename: str) -> None:
+    """测试连续操作复用缓存的文档, 且每次修改仍然落盘."""
+    from docx import Document
+
+    from office_mcp_server.handlers.word.word_cache import document_cache
+
+    word_handler.create_document(test_filename, title="测试")
+    hits = document_cache.stats()["hits"]
+
+    word_handler.insert_text(test_filename, "第一段")
+    word_handler.insert_text(test_filename, "第二段")
+    info = word_handler.get_document_info(test_filename)
+    text = word_handler.extract_text(test_filename)
+
+    assert document_cache.stats()["hits"] >= hits + 4
+    assert info["success"] is True
+    assert "第二段" in text["text"]
+    doc = Document(str(config.paths.output_dir / test_filename))
+    assert [p.text for p in doc.paragraphs][-2:] == ["第一段", "第二段"]
+
+
+def test_batch_replace_text_in_processes(
+    word_handler: WordHandler, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """测试多个文档分发到子进程批量替换, 结果按输入顺序返回."""
+    from docx import Document
+
+    from office_mcp_server.utils import parallel
+
+    monkeypatch.setattr(config.word, "batch_workers", 2)
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_BYTES", 0)
+    filenames = [f"batch_replace_{i}.docx" for i in range(4)]
+    try:
+        for filename in filenames:
+            word_handler.create_document(filename, content="旧文本")
+        # 先读入缓存, 确认子进程修改文件后不会读到缓存中的旧文档
+        word_handler.extract_text(filenames[0])
+
+        result = word_handler.batch_replace_text(filenames + ["missing.docx"], "旧", "新")
+
+        assert result["success_count"] == 4
+        assert result["fail_count"] == 1
+        assert [item["filename"] for item in result["results"]] == filenames + ["missing.docx"]
+        for filename in filenames:
+            doc = Document(str(config.paths.output_dir / filename))
+            assert "新文本" in [p.text for p in doc.paragraphs]
+        assert "新文本" in word_handler.extract_text(filenames[0])["text"]
+
+        # 同一文件出现多次时依次替换, 每次都基于上一次的结果
+        result = word_handler.batch_replace_text(filenames + filenames[:1], "文本", "文本!")
+        assert result["success_count"] == 5
+        assert "新文本!!" in word_handler.extract_text(filenames[0])["text"]
+        assert "新文本!!" not in word_handler.extract_text(filenames[1])["text"]
+    finally:
+        for filename in filenames:
+            (config.paths.output_dir / filename).unlink(missing_ok=True)